@@ -0,0 +1,327 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+"""
+Offline analytics export (SQLite, optional Parquet)
+===================================================
+Copies the data Project Overview shows into a self-contained SQLite file
+so analysts can run ad-hoc queries without touching the production DB.
+
+Tables in the export:
+- project: progress and planning fields of every Project
+- task: Task fields incl. tree depth/path (from Project Overview Snapshot)
+  and nested-set values
+- assignment: open ToDo assignments of tasks
+- _export_state: per-table watermark (modified, name) of the last run
+
+How it works:
+- Rows are read with keyset iteration on (modified, name) in batches of
+  EXPORT_BATCH_SIZE and upserted into SQLite batch by batch, so memory
+  stays bounded regardless of table size
+- Runs are incremental: only rows modified since the stored watermark
+  (minus a small overlap for late commits) are copied; deletions are
+  replayed from Deleted Document; closed/cancelled ToDos are removed
+  (Frappe does not record deleted ToDos; unassigning cancels them instead)
+- full=True recreates the file (e.g. after tree moves, which change the
+  depth of tasks whose `modified` does not change)
+- parquet=True additionally writes one Parquet file per table from the
+  SQLite file (needs pyarrow), typed from the SQLite column types (dates,
+  numbers and the `modified` timestamp keep their types)
+
+Site config (site_config.json):
+- riz_erp_analytics_path: Export file (default: private/analytics/riz_erp_analytics.sqlite)
+- riz_erp_analytics_export: Enable the nightly job (riz_erp.tasks)
+
+Main Functions:
+- export_analytics(): Incremental (or full) export
+- write_parquet(): Parquet copy of the SQLite tables
+"""
+
+import datetime
+import os
+import sqlite3
+
+import frappe
+from frappe.utils import add_to_date, get_datetime, now
+
+EXPORT_BATCH_SIZE = 2000
+
+# Rows committed late can carry an older `modified` than the watermark
+WATERMARK_OVERLAP_MINUTES = 10
+
+DEFAULT_FILE = "riz_erp_analytics.sqlite"
+
+# Export table -> (source table alias, source query, SQLite columns)
+# Queries select `name` first and `modified` last and take the keyset condition
+EXPORT_TABLES = {
+    "project": (
+        "p",
+        """
+        select p.name, p.project_name, p.status, p.percent_complete, p.percent_complete_method,
+            p.expected_start_date, p.expected_end_date, p.actual_start_date, p.actual_end_date,
+            p.company, p.modified
+        from `tabProject` p
+        where {keyset}
+        order by p.modified asc, p.name asc
+        limit %(limit)s
+        """,
+        ["name", "project_name", "status", "percent_complete", "percent_complete_method",
+         "expected_start_date", "expected_end_date", "actual_start_date", "actual_end_date",
+         "company", "modified"],
+    ),
+    "task": (
+        "t",
+        """
+        select t.name, t.project, t.subject, t.custom_next_action, t.status, t.priority,
+            t.exp_start_date, t.exp_end_date, t.progress, t.completed_on, t.parent_task,
+            t.is_group, t.lft, t.rgt, s.depth, s.sort_key as tree_path, t.modified
+        from `tabTask` t
+        left join `tabProject Overview Snapshot` s on s.name = t.name
+        where {keyset}
+        order by t.modified asc, t.name asc
+        limit %(limit)s
+        """,
+        ["name", "project", "subject", "custom_next_action", "status", "priority",
+         "exp_start_date", "exp_end_date", "progress", "completed_on", "parent_task",
+         "is_group", "lft", "rgt", "depth", "tree_path", "modified"],
+    ),
+    "assignment": (
+        "td",
+        """
+        select td.name, td.reference_name as task, td.allocated_to, td.status, td.date,
+            td.assigned_by, td.modified
+        from `tabToDo` td
+        where td.reference_type = 'Task' and {keyset}
+        order by td.modified asc, td.name asc
+        limit %(limit)s
+        """,
+        ["name", "task", "allocated_to", "status", "date", "assigned_by", "modified"],
+    ),
+}
+
+# SQLite column types of the export tables (columns not listed are text)
+COLUMN_TYPES = {
+    "expected_start_date": "date",
+    "expected_end_date": "date",
+    "actual_start_date": "date",
+    "actual_end_date": "date",
+    "exp_start_date": "date",
+    "exp_end_date": "date",
+    "completed_on": "date",
+    "date": "date",
+    "percent_complete": "real",
+    "progress": "real",
+    "is_group": "integer",
+    "lft": "integer",
+    "rgt": "integer",
+    "depth": "integer",
+    "modified": "timestamp",
+}
+
+# Export table -> source doctype (for Deleted Document replay)
+SOURCE_DOCTYPES = {
+    "project": "Project",
+    "task": "Task",
+    "assignment": "ToDo",
+}
+
+STATE_TABLE = "_export_state"
+
+
+# -------------------- export_analytics --------------------
+# Copies changed rows into the SQLite export
+# Returns: {table: rows written} (+ "deleted")
+# -----------------------------------------------------------
+def export_analytics(path=None, full=False, parquet=False):
+    """Export projects, tasks and open assignments to SQLite"""
+    path = path or get_export_path()
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    if full and os.path.exists(path):
+        os.remove(path)
+
+    conn = sqlite3.connect(path)
+    try:
+        create_tables(conn)
+        stats = {}
+        for table in EXPORT_TABLES:
+            stats[table] = export_table(conn, table)
+        stats["deleted"] = replay_deletions(conn)
+    finally:
+        conn.close()
+
+    if parquet:
+        write_parquet(path)
+    return stats
+
+
+# -------------------- export_table --------------------
+# Keyset iteration over (modified, name) from the stored watermark
+# -------------------------------------------------------
+def export_table(conn, table):
+    alias, query, columns = EXPORT_TABLES[table]
+    keyset = (
+        f"({alias}.modified > %(modified)s or ({alias}.modified = %(modified)s and {alias}.name > %(name)s))"
+    )
+
+    state = conn.execute(f"select last_modified, last_name from {STATE_TABLE} where tbl = ?", (table,)).fetchone()
+    if state:
+        # Restart a little earlier to pick up late commits (upserts are idempotent)
+        last_modified = add_to_date(get_datetime(state[0]), minutes=-WATERMARK_OVERLAP_MINUTES)
+        last_name = ""
+    else:
+        last_modified, last_name = "1900-01-01", ""
+
+    placeholders = ", ".join("?" * len(columns))
+    upsert = f"insert or replace into {table} ({', '.join(columns)}) values ({placeholders})"
+    written = 0
+    while True:
+        rows = frappe.db.sql(
+            query.format(keyset=keyset),
+            {"modified": last_modified, "name": last_name, "limit": EXPORT_BATCH_SIZE},
+            as_list=True
+        )
+        if not rows:
+            break
+
+        values = [[to_sqlite(v) for v in row] for row in rows]
+        if table == "assignment":
+            # Only open assignments are kept; others are removed below
+            closed = [(row[0],) for row in values if row[3] != "Open"]
+            values = [row for row in values if row[3] == "Open"]
+            conn.executemany("delete from assignment where name = ?", closed)
+        conn.executemany(upsert, values)
+
+        last_modified, last_name = rows[-1][-1], rows[-1][0]
+        save_state(conn, table, last_modified, last_name)
+        written += len(values)
+
+        if len(rows) < EXPORT_BATCH_SIZE:
+            break
+    return written
+
+
+# -------------------- replay_deletions --------------------
+# Removes rows whose source documents were deleted since the last run
+# ------------------------------------------------------------
+def replay_deletions(conn):
+    tables = {doctype: table for table, doctype in SOURCE_DOCTYPES.items()}
+    state = conn.execute(f"select last_modified from {STATE_TABLE} where tbl = 'deleted'").fetchone()
+    if not state:
+        # Fresh export: nothing to delete, start watching from now
+        save_state(conn, "deleted", now(), "")
+        return 0
+
+    deleted = 0
+    last_creation = add_to_date(get_datetime(state[0]), minutes=-WATERMARK_OVERLAP_MINUTES)
+    last_name = ""
+    while True:
+        rows = frappe.db.sql(
+            """
+            select name, deleted_doctype, deleted_name, creation
+            from `tabDeleted Document`
+            where deleted_doctype in %(doctypes)s
+                and (creation > %(creation)s or (creation = %(creation)s and name > %(name)s))
+            order by creation asc, name asc
+            limit %(limit)s
+            """,
+            {"doctypes": list(tables), "creation": last_creation, "name": last_name, "limit": EXPORT_BATCH_SIZE},
+            as_dict=True
+        )
+        if not rows:
+            break
+
+        for row in rows:
+            conn.execute(f"delete from {tables[row.deleted_doctype]} where name = ?", (row.deleted_name,))
+            if row.deleted_doctype == "Task":
+                conn.execute("delete from assignment where task = ?", (row.deleted_name,))
+            deleted += 1
+        last_creation, last_name = rows[-1].creation, rows[-1].name
+        save_state(conn, "deleted", last_creation, last_name)
+
+        if len(rows) < EXPORT_BATCH_SIZE:
+            break
+    return deleted
+
+
+def save_state(conn, table, last_modified, last_name):
+    """Store a table's watermark and commit the batch written with it"""
+    conn.execute(
+        f"insert or replace into {STATE_TABLE} (tbl, last_modified, last_name) values (?, ?, ?)",
+        (table, to_sqlite(get_datetime(last_modified)), last_name)
+    )
+    conn.commit()
+
+
+# -------------------- create_tables --------------------
+# Creates the export tables (all columns untyped except keys)
+# --------------------------------------------------------
+def create_tables(conn):
+    for table, (_alias, _query, columns) in EXPORT_TABLES.items():
+        column_defs = ", ".join(
+            f"{c} text primary key" if c == "name" else f"{c} {COLUMN_TYPES.get(c, 'text')}" for c in columns
+        )
+        conn.execute(f"create table if not exists {table} ({column_defs})")
+    conn.execute("create index if not exists task_project on task (project)")
+    conn.execute("create index if not exists assignment_task on assignment (task)")
+    conn.execute(f"create table if not exists {STATE_TABLE} (tbl text primary key, last_modified text, last_name text)")
+    conn.commit()
+
+
+# -------------------- write_parquet --------------------
+# One Parquet file per table next to the SQLite file, written in
+# batches (bounded memory); pyarrow is an optional dependency
+# Column types come from the SQLite declarations (COLUMN_TYPES for
+# files created before columns were typed)
+# --------------------------------------------------------
+def write_parquet(path):
+    """Write <table>.parquet files from the SQLite export"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        frappe.throw("Parquet export needs pyarrow: bench pip install pyarrow")
+
+    arrow_types = {
+        "date": (pa.date32(), lambda v: datetime.date.fromisoformat(str(v)[:10])),
+        "timestamp": (pa.timestamp("us"), lambda v: datetime.datetime.fromisoformat(str(v))),
+        "real": (pa.float64(), float),
+        "integer": (pa.int64(), int),
+        "text": (pa.string(), str),
+    }
+
+    folder = os.path.dirname(os.path.abspath(path))
+    conn = sqlite3.connect(path)
+    try:
+        for table, (_alias, _query, columns) in EXPORT_TABLES.items():
+            declared = {row[1]: row[2].lower() for row in conn.execute(f"pragma table_info({table})")}
+            types = [
+                arrow_types.get(declared.get(c) or COLUMN_TYPES.get(c, "text"), arrow_types["text"])
+                for c in columns
+            ]
+            schema = pa.schema([(c, arrow_type) for c, (arrow_type, _convert) in zip(columns, types)])
+            cursor = conn.execute(f"select {', '.join(columns)} from {table} order by name")
+            with pq.ParquetWriter(os.path.join(folder, f"{table}.parquet"), schema) as writer:
+                while True:
+                    rows = cursor.fetchmany(EXPORT_BATCH_SIZE)
+                    if not rows:
+                        break
+                    arrays = [
+                        pa.array([None if row[i] is None else convert(row[i]) for row in rows], arrow_type)
+                        for i, (arrow_type, convert) in enumerate(types)
+                    ]
+                    writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+    finally:
+        conn.close()
+
+
+def get_export_path():
+    return frappe.conf.get("riz_erp_analytics_path") or frappe.get_site_path("private", "analytics", DEFAULT_FILE)
+
+
+def to_sqlite(value):
+    """Dates/decimals as text/float so sqlite3 can store them"""
+    if value is None or isinstance(value, (int, float, str)):
+        return value
+    if hasattr(value, "isoformat"):
+        return value.isoformat(sep=" ") if hasattr(value, "hour") else value.isoformat()
+    return float(value) if hasattr(value, "as_integer_ratio") else str(value)
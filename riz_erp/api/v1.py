@@ -0,0 +1,182 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+"""
+Project Overview JSON API (v1)
+==============================
+Read-only, cacheable JSON view of the Project Overview report data for
+wall displays and dashboards that poll frequently.
+
+Endpoint:
+    GET /api/method/riz_erp.api.v1.project_overview
+
+Parameters (same meaning as the report filters):
+- project, status, assigned_to (comma separated), show_completed_tasks, search
+- fields: Comma separated task fields (default: all of TASK_FIELDS)
+
+Response body (not wrapped in "message"):
+    {"api_version": "1", "data_version": "...", "projects": [
+        {"name", "project_name", "status", "percent_complete",
+         "tasks": [{"name", "subject", ...}]}]}
+Tasks come in tree pre-order; depth and parent_task give the hierarchy,
+assigned_to is a list of {"user", "full_name"}.
+
+Caching:
+- ETag = hash of the data version (see project_overview_snapshot, a Redis
+  token replaced after every committed change) and the request
+- If-None-Match with the current ETag returns 304 without a body and
+  without running any report query
+- Cache-Control: private, no-cache (clients and proxies always revalidate)
+
+Requires access to the Project Overview report. Like the report itself, the
+endpoint shows all projects and tasks to anyone with that access (no
+Project/Task user permissions are applied), so the response does not depend
+on the user.
+
+Main Functions:
+- project_overview(): Whitelisted GET endpoint
+- get_overview_data(): Projects with their visible tasks
+"""
+
+import hashlib
+import json
+
+import frappe
+from werkzeug.wrappers import Response
+
+from riz_erp.riz_erp.doctype.project_overview_snapshot.project_overview_snapshot import (
+    DOCTYPE as SNAPSHOT_DOCTYPE,
+    get_data_version,
+)
+from riz_erp.riz_erp.report.project_overview.project_overview import (
+    get_filtered_task_ids,
+    get_snapshot_filters,
+    parse_bool,
+    parse_multi_select,
+)
+
+API_VERSION = "1"
+REPORT_NAME = "Project Overview"
+
+# API task field -> snapshot column
+TASK_FIELDS = {
+    "name": "task",
+    "subject": "subject",
+    "status": "status",
+    "priority": "priority",
+    "custom_next_action": "custom_next_action",
+    "exp_start_date": "exp_start_date",
+    "exp_end_date": "exp_end_date",
+    "progress": "progress",
+    "assigned_to": "assigned_to",
+    "parent_task": "parent_task",
+    "depth": "depth",
+    "modified": "modified",
+}
+
+
+# -------------------- project_overview --------------------
+# Versioned JSON endpoint with ETag / 304 support
+# Returns: werkzeug Response (200 JSON or 304)
+# -----------------------------------------------------------
+@frappe.whitelist(methods=["GET"])
+def project_overview(project=None, status=None, assigned_to=None, show_completed_tasks=None, search=None,
+                     fields=None):
+    """Project Overview data as JSON, answered with 304 when unchanged"""
+    if not frappe.get_cached_doc("Report", REPORT_NAME).is_permitted():
+        frappe.throw(f"You do not have access to the {REPORT_NAME} report", frappe.PermissionError)
+
+    task_fields = parse_multi_select(fields) or list(TASK_FIELDS)
+    unknown = [f for f in task_fields if f not in TASK_FIELDS]
+    if unknown:
+        frappe.throw(f"Unknown field(s): {', '.join(unknown)}. Available: {', '.join(TASK_FIELDS)}")
+
+    filters = {
+        "project": project,
+        "status": status,
+        "assigned_to": assigned_to,
+        "show_completed_tasks": parse_bool(show_completed_tasks or False),
+        "search": search,
+    }
+
+    # Redis only: no database query when the client is up to date
+    data_version = get_data_version()
+    etag = get_etag(data_version, filters, task_fields)
+    if etag in frappe.request.if_none_match:
+        return make_response(None, etag, status=304)
+
+    body = {
+        "api_version": API_VERSION,
+        "data_version": data_version,
+        "projects": get_overview_data(filters, task_fields),
+    }
+    return make_response(body, etag)
+
+
+# -------------------- get_overview_data --------------------
+# Same rows as execute() (snapshot, report filters), as plain values
+# Returns: [{project fields..., "tasks": [{task fields...}]}]
+# ------------------------------------------------------------
+def get_overview_data(filters, task_fields):
+    """Projects with their visible tasks in tree order"""
+    task_ids = get_filtered_task_ids(filters)
+    if task_ids is not None and not task_ids:
+        return []
+
+    columns = {TASK_FIELDS[f] for f in task_fields} | {"task", "project"}
+    tasks = frappe.get_all(
+        SNAPSHOT_DOCTYPE,
+        filters=get_snapshot_filters(filters, task_ids),
+        fields=list(columns),
+        order_by="project asc, sort_key asc"
+    )
+
+    project_tasks = {}
+    for t in tasks:
+        row = {}
+        for field in task_fields:
+            value = t.get(TASK_FIELDS[field])
+            if field == "assigned_to":
+                value = parse_assignees(value)
+            row[field] = value
+        project_tasks.setdefault(t.project, []).append(row)
+
+    if not project_tasks:
+        return []
+    projects = frappe.get_all(
+        "Project",
+        filters={"name": ["in", list(project_tasks)]},
+        fields=["name", "project_name", "status", "percent_complete"],
+        order_by="name asc"
+    )
+    return [{**p, "tasks": project_tasks[p.name]} for p in projects]
+
+
+def parse_assignees(value):
+    """Snapshot "email:full_name,..." -> [{"user", "full_name"}]"""
+    assignees = []
+    for entry in (value or "").split(","):
+        if entry:
+            user, _, full_name = entry.partition(":")
+            assignees.append({"user": user, "full_name": full_name or user})
+    return assignees
+
+
+# -------------------- get_etag --------------------
+# Strong ETag over data version, API version and request
+# (the data is the same for every user with report access)
+# ---------------------------------------------------
+def get_etag(data_version, filters, task_fields):
+    request = json.dumps([API_VERSION, data_version, filters, task_fields], sort_keys=True, default=str)
+    return hashlib.sha1(request.encode()).hexdigest()
+
+
+def make_response(body, etag, status=200):
+    response = Response(
+        frappe.as_json(body, indent=None) if body is not None else None,
+        status=status,
+        content_type="application/json",
+    )
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
@@ -0,0 +1,189 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+"""
+Bench commands for Riz ERP
+==========================
+Usage:
+    bench --site [site-name] rebuild-project-overview-snapshot [--project PROJ-0001]
+    bench --site [site-name] check-project-overview-snapshot [--project PROJ-0001] [--fix]
+    bench --site [site-name] export-riz-erp-fixtures
+    bench --site [site-name] export-riz-erp-analytics [--full] [--parquet] [--path FILE]
+    bench --site [site-name] riz-erp-load-test seed|run|cleanup [options]
+"""
+
+import click
+import frappe
+from frappe.commands import get_site, pass_context
+
+
+# -------------------- rebuild-project-overview-snapshot --------------------
+# Rebuilds the Project Overview Snapshot table from live Task/ToDo data
+# ----------------------------------------------------------------------------
+@click.command("rebuild-project-overview-snapshot")
+@click.option("--project", help="Only rebuild rows of this project")
+@pass_context
+def rebuild_project_overview_snapshot(context, project=None):
+    """Rebuild the Project Overview Snapshot table"""
+    from riz_erp.riz_erp.doctype.project_overview_snapshot.project_overview_snapshot import rebuild_snapshot
+
+    frappe.init(site=get_site(context))
+    frappe.connect()
+    try:
+        written = rebuild_snapshot(project)
+        frappe.db.commit()
+        click.echo(f"Wrote {written} snapshot row(s)")
+    finally:
+        frappe.destroy()
+
+
+# -------------------- check-project-overview-snapshot --------------------
+# Compares snapshot rows with live data and optionally repairs drift
+# Exits with status 1 when problems remain (usable from cron/CI)
+# --------------------------------------------------------------------------
+@click.command("check-project-overview-snapshot")
+@click.option("--project", help="Only check rows of this project")
+@click.option("--fix", is_flag=True, default=False, help="Rebuild projects with problems")
+@pass_context
+def check_project_overview_snapshot(context, project=None, fix=False):
+    """Check the Project Overview Snapshot table for drift"""
+    from riz_erp.riz_erp.doctype.project_overview_snapshot.project_overview_snapshot import check_snapshot
+
+    frappe.init(site=get_site(context))
+    frappe.connect()
+    try:
+        problems = check_snapshot(project, fix=fix)
+        if fix:
+            frappe.db.commit()
+        for problem in problems[:50]:
+            click.echo(f"{problem['project']} / {problem['task']}: {problem['problem']}")
+        if len(problems) > 50:
+            click.echo(f"... and {len(problems) - 50} more")
+        click.echo(f"{len(problems)} problem(s) found" + (" and fixed" if fix and problems else ""))
+    finally:
+        frappe.destroy()
+
+    if problems and not fix:
+        raise SystemExit(1)
+
+
+# -------------------- export-riz-erp-fixtures --------------------
+# Exports this app's Custom Field / Property Setter records (filtered by
+# `synced_fixtures` in hooks.py) to riz_erp/synced_fixtures/
+# -------------------------------------------------------------------
+@click.command("export-riz-erp-fixtures")
+@pass_context
+def export_riz_erp_fixtures(context):
+    """Export hash-synced customizations of this app"""
+    from riz_erp.fixture_sync import export_fixtures
+
+    frappe.init(site=get_site(context))
+    frappe.connect()
+    try:
+        export_fixtures()
+        click.echo("Exported Custom Field / Property Setter fixtures to riz_erp/synced_fixtures/")
+    finally:
+        frappe.destroy()
+
+
+# -------------------- export-riz-erp-analytics --------------------
+# Incremental SQLite (optionally Parquet) export of projects, tasks and
+# open assignments for offline analysis (see riz_erp.analytics_export)
+# ---------------------------------------------------------------------
+@click.command("export-riz-erp-analytics")
+@click.option("--path", help="SQLite file to write (default: site private/analytics/)")
+@click.option("--full", is_flag=True, default=False, help="Recreate the file instead of copying changes")
+@click.option("--parquet", is_flag=True, default=False, help="Also write one Parquet file per table")
+@pass_context
+def export_riz_erp_analytics(context, path=None, full=False, parquet=False):
+    """Export Project Overview data for offline analytics"""
+    from riz_erp.analytics_export import export_analytics, get_export_path
+
+    frappe.init(site=get_site(context))
+    frappe.connect()
+    try:
+        path = path or get_export_path()
+        stats = export_analytics(path, full=full, parquet=parquet)
+        click.echo(", ".join(f"{table}: {count}" for table, count in stats.items()))
+        click.echo(f"Exported to {path}")
+    finally:
+        frappe.destroy()
+
+
+# -------------------- riz-erp-load-test --------------------
+# Seeds test data, runs concurrent virtual users against the bench's web
+# server, or removes the test data (see riz_erp.load_testing)
+# run exits with status 1 on regressions against --baseline
+# --------------------------------------------------------------
+@click.command("riz-erp-load-test")
+@click.argument("action", type=click.Choice(["seed", "run", "cleanup"]))
+@click.option("--projects", type=int, default=10, help="seed: Number of projects")
+@click.option("--tasks-per-project", type=int, default=200, help="seed: Tasks per project")
+@click.option("--users", type=int, default=10, help="run: Number of virtual users")
+@click.option("--duration", type=int, default=60, help="run: Seconds to run")
+@click.option("--scenario", type=click.Choice(["mixed", "overlap"]), default="mixed", help="run: Scenario")
+@click.option("--mix", help="run: Operation weights, e.g. report=50,bulk_status=10,assign=5")
+@click.option("--url", help="run: Site URL (default: the site's host_name)")
+@click.option("--think-time", type=float, default=0.0, help="run: Mean pause between requests (seconds)")
+@click.option("--random-seed", type=int, help="run: Seed for repeatable task selections")
+@click.option("--output", help="run: Write the summary to this JSON file")
+@click.option("--baseline", help="run: Compare with a previous --output file")
+@click.option("--tolerance", type=float, default=0.2, help="run: Allowed p95/throughput change (0.2 = 20%)")
+@pass_context
+def riz_erp_load_test(context, action, projects=10, tasks_per_project=200, users=10, duration=60,
+                      scenario="mixed", mix=None, url=None, think_time=0.0, random_seed=None, output=None,
+                      baseline=None, tolerance=0.2):
+    """Load-test the Project Overview report and its endpoints"""
+    import json
+
+    from riz_erp import load_testing
+
+    frappe.init(site=get_site(context))
+    frappe.connect()
+    try:
+        if action == "seed":
+            click.echo(load_testing.seed_load_test(projects, tasks_per_project))
+            return
+        if action == "cleanup":
+            click.echo(load_testing.cleanup_load_test())
+            return
+
+        summary = load_testing.run_load_test(
+            users=users, duration=duration, scenario=scenario, mix=load_testing.parse_mix(mix), url=url,
+            think_time=think_time, seed=random_seed
+        )
+    finally:
+        frappe.destroy()
+
+    click.echo(f"{'operation':<14}{'requests':>10}{'req/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+               f"{'errors':>9}  outcomes")
+    for name, stats in [*summary["operations"].items(), ("TOTAL", summary["total"])]:
+        outcomes = ", ".join(f"{k}: {v}" for k, v in sorted(stats["outcomes"].items()))
+        click.echo(f"{name:<14}{stats['requests']:>10}{stats['throughput']:>9}{stats['p50_ms']:>10}"
+                   f"{stats['p95_ms']:>10}{stats['p99_ms']:>10}{stats['error_rate']:>9.2%}  {outcomes}")
+    click.echo("DB locks: " + ", ".join(f"{k}: {v}" for k, v in summary["db_locks"].items()))
+    if "lost_updates" in summary:
+        click.echo(f"Tasks out of sync with the snapshot: {len(summary['lost_updates'])}")
+
+    if output:
+        with open(output, "w") as f:
+            json.dump(summary, f, indent=2)
+        click.echo(f"Summary written to {output}")
+
+    if baseline:
+        with open(baseline) as f:
+            regressions = load_testing.compare_with_baseline(summary, json.load(f), tolerance)
+        for regression in regressions:
+            click.echo(f"REGRESSION {regression}")
+        if regressions:
+            raise SystemExit(1)
+        click.echo("No regressions against the baseline")
+
+
+commands = [
+    rebuild_project_overview_snapshot,
+    check_project_overview_snapshot,
+    export_riz_erp_fixtures,
+    export_riz_erp_analytics,
+    riz_erp_load_test,
+]
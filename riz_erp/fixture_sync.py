@@ -0,0 +1,260 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+"""
+Hash-diffed fixture sync for Custom Field and Property Setter
+=============================================================
+Frappe's standard fixture sync re-imports every record of every file in
+`fixtures/` (and every `custom/*.json` with sync_on_migrate) on each
+`bench migrate`, clearing metadata caches for every touched doctype.
+
+This module replaces that for Custom Field and Property Setter, and for the
+DocType Link / Custom DocPerm records of `custom/*.json`:
+- Records are read from `synced_fixtures/*.json` and `riz_erp/custom/*.json`
+- Records in `synced_fixtures/` must match the `synced_fixtures` filters in
+  hooks.py (this app's customizations, not ERPNext/HRMS setup records, by
+  fieldname prefix / explicit name); `custom/*.json` is owned by this app
+  and always synced in full
+- A content hash per record is stored in the global defaults; unchanged
+  records that still exist in the database are skipped
+- Changed records are saved through their controllers (validation included);
+  the schema update and meta cache clearing are deferred and run once per
+  affected doctype
+
+Main Functions:
+- sync_fixtures(): after_migrate hook, imports changed records
+- export_fixtures(): Writes filtered records to `synced_fixtures/`
+"""
+
+import glob
+import hashlib
+import json
+import os
+
+import frappe
+
+# Global default holding {"<doctype>::<name>": "<sha1>"}
+HASH_KEY = "riz_erp_fixture_hashes"
+
+SYNCED_FIXTURES_FOLDER = "synced_fixtures"
+
+# Field on each doctype naming the customized doctype
+TARGET_FIELD = {
+    "Custom Field": "dt",
+    "Property Setter": "doc_type",
+    "DocType Link": "parent",
+    "Custom DocPerm": "parent",
+}
+
+# Keys of doctype JSONs in riz_erp/custom/ holding each doctype's records
+CUSTOM_JSON_KEYS = {
+    "Custom Field": "custom_fields",
+    "Property Setter": "property_setters",
+    "DocType Link": "links",
+    "Custom DocPerm": "custom_perms",
+}
+
+# Other top-level keys of the custom/*.json files (no records)
+CUSTOM_JSON_META_KEYS = {"doctype", "sync_on_migrate"}
+
+# Bookkeeping fields that do not change a record's effect
+VOLATILE_FIELDS = {
+    "creation", "modified", "modified_by", "owner",
+    "_assign", "_comments", "_liked_by", "_user_tags",
+}
+
+
+# -------------------- sync_fixtures --------------------
+# after_migrate hook: imports new/changed records only
+# -------------------------------------------------------
+def sync_fixtures():
+    """Import customization records whose hash changed
+
+    Returns:
+        dict: {"changed": int, "skipped": int, "doctypes": list}
+    """
+    records = load_records()
+    stored_hashes = json.loads(frappe.db.get_global(HASH_KEY) or "{}")
+
+    existing = {}
+    for doctype in TARGET_FIELD:
+        names = [r["name"] for dt, r in records if dt == doctype]
+        existing[doctype] = set(
+            frappe.db.get_values(doctype, {"name": ["in", names]}, "name", pluck=True)
+        ) if names else set()
+
+    new_hashes = {}
+    affected = {doctype: set() for doctype in TARGET_FIELD}
+    changed = 0
+    skipped = 0
+
+    # Custom Field.on_update skips its own cache clearing / updatedb while
+    # this flag is set (as in create_custom_fields); done once per doctype below
+    frappe.flags.in_create_custom_fields = True
+    try:
+        for doctype, record in records:
+            key = f"{doctype}::{record['name']}"
+            record_hash = get_record_hash(record)
+            target = record.get(TARGET_FIELD[doctype])
+
+            if not frappe.db.exists("DocType", target):
+                # Customized doctype's app is not installed on this site
+                continue
+
+            new_hashes[key] = record_hash
+            exists = record["name"] in existing[doctype]
+            if exists and stored_hashes.get(key) == record_hash:
+                skipped += 1
+                continue
+
+            write_record(doctype, record, exists)
+            affected[doctype].add(target)
+            changed += 1
+    finally:
+        frappe.flags.in_create_custom_fields = False
+
+    # Schema changes and cache clearing once per customized doctype
+    for target in sorted(affected["Custom Field"]):
+        if not frappe.get_meta(target).issingle:
+            frappe.db.updatedb(target)
+
+    touched = sorted(set().union(*affected.values()))
+    for target in touched:
+        frappe.clear_cache(doctype=target)
+
+    frappe.db.set_global(HASH_KEY, json.dumps(new_hashes, sort_keys=True))
+    frappe.db.commit()
+
+    if changed:
+        frappe.logger("riz_erp").info(
+            f"Synced {changed} customization(s) for {', '.join(touched)}"
+        )
+
+    return {"changed": changed, "skipped": skipped, "doctypes": touched}
+
+
+# -------------------- load_records --------------------
+# Reads records from synced_fixtures/ (hooks filters applied) and
+# riz_erp/custom/*.json (unfiltered); on duplicates the latest `modified` wins
+# Returns: list of (doctype, record) tuples
+# ------------------------------------------------------
+def load_records():
+    """Collect filtered fixture records from all sources"""
+    filters = get_fixture_filters()
+    by_key = {}
+
+    def add(doctype, record, filtered=True):
+        if filtered and (doctype not in filters or not matches_filters(record, filters[doctype])):
+            return
+        key = (doctype, record["name"])
+        current = by_key.get(key)
+        if not current or (record.get("modified") or "") >= (current.get("modified") or ""):
+            by_key[key] = record
+
+    for doctype in TARGET_FIELD:
+        path = frappe.get_app_path("riz_erp", SYNCED_FIXTURES_FOLDER, f"{frappe.scrub(doctype)}.json")
+        if os.path.exists(path):
+            for record in json.loads(frappe.read_file(path) or "[]"):
+                add(doctype, record)
+
+    for path in sorted(glob.glob(frappe.get_app_path("riz_erp", "riz_erp", "custom", "*.json"))):
+        data = json.loads(frappe.read_file(path) or "{}")
+        for doctype, key in CUSTOM_JSON_KEYS.items():
+            for record in data.get(key) or []:
+                add(doctype, record, filtered=False)
+
+    return [(doctype, record) for (doctype, _name), record in sorted(by_key.items())]
+
+
+# -------------------- get_fixture_filters --------------------
+# Reads `synced_fixtures` from hooks.py
+# Returns: {doctype: [[field, operator, value], ...]}
+# --------------------------------------------------------------
+def get_fixture_filters():
+    """Filters per doctype from the synced_fixtures hook"""
+    filters = {}
+    for spec in frappe.get_hooks("synced_fixtures", app_name="riz_erp"):
+        if spec.get("dt") in TARGET_FIELD:
+            filters[spec["dt"]] = spec.get("filters") or []
+    return filters
+
+
+# -------------------- matches_filters --------------------
+# Evaluates hooks-style filters against a record dict
+# Supports =, !=, in, not in, like (with % wildcards)
+# ----------------------------------------------------------
+def matches_filters(record, filters):
+    """Return True if the record satisfies every filter"""
+    import fnmatch
+
+    for field, operator, value in filters:
+        actual = record.get(field)
+        operator = operator.lower()
+        if operator == "=" and actual != value:
+            return False
+        if operator == "!=" and actual == value:
+            return False
+        if operator == "in" and actual not in value:
+            return False
+        if operator == "not in" and actual in value:
+            return False
+        if operator == "like" and not fnmatch.fnmatchcase(str(actual or ""), value.replace("%", "*")):
+            return False
+    return True
+
+
+# -------------------- get_record_hash --------------------
+# Stable content hash of a record, ignoring bookkeeping fields
+# ----------------------------------------------------------
+def get_record_hash(record):
+    """sha1 of the record's meaningful fields"""
+    content = {k: v for k, v in record.items() if k not in VOLATILE_FIELDS}
+    return hashlib.sha1(json.dumps(content, sort_keys=True, default=str).encode()).hexdigest()
+
+
+# -------------------- write_record --------------------
+# Inserts or updates a record through its controller, so fieldnames,
+# insert_after/idx and property types are validated as in the UI
+# DocType Link rows are child rows of DocType without a controller of their
+# own and are written directly, as Frappe's customization sync does
+# Cache clearing / schema update is done once per doctype by the caller
+# ------------------------------------------------------
+def write_record(doctype, record, exists):
+    """Write a single customization record"""
+    values = {k: v for k, v in record.items() if k not in VOLATILE_FIELDS and k not in ("doctype", "name")}
+
+    if frappe.get_meta(doctype).istable:
+        doc = frappe.get_doc({"doctype": doctype, "name": record["name"], **values})
+        if exists:
+            doc.db_update()
+        else:
+            doc.db_insert()
+        return
+
+    if exists:
+        doc = frappe.get_doc(doctype, record["name"])
+        doc.update(values)
+        doc.save(ignore_permissions=True)
+    else:
+        doc = frappe.get_doc({"doctype": doctype, "name": record["name"], **values})
+        doc.insert(ignore_permissions=True)
+
+
+# -------------------- export_fixtures --------------------
+# Writes this app's Custom Field / Property Setter records (per hooks
+# filters) to synced_fixtures/, replacing `bench export-fixtures`
+# ----------------------------------------------------------
+def export_fixtures():
+    """Export filtered customizations to riz_erp/synced_fixtures/"""
+    from frappe.core.doctype.data_import.data_import import export_json
+
+    folder = frappe.get_app_path("riz_erp", SYNCED_FIXTURES_FOLDER)
+    os.makedirs(folder, exist_ok=True)
+
+    for doctype, filters in get_fixture_filters().items():
+        export_json(
+            doctype,
+            os.path.join(folder, f"{frappe.scrub(doctype)}.json"),
+            filters=filters,
+            order_by="name asc"
+        )
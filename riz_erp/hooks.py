@@ -22,8 +22,6 @@ app_license = "mit"
 # ]
 
 fixtures = [
-    "Custom Field",
-    "Property Setter",
     "Client Script",
     "Server Script",
     "Workflow",
@@ -31,6 +29,43 @@ fixtures = [
     "Workflow Action Master"
 ]
 
+# Custom Field / Property Setter are not in `fixtures`: they are synced by
+# riz_erp.fixture_sync (after_migrate) from synced_fixtures/ and custom/*.json,
+# skipped when their content hash is unchanged. The filters below select this
+# app's records in synced_fixtures/ (and for export); custom/*.json always syncs.
+# Export with: bench --site [site-name] export-riz-erp-fixtures
+synced_fixtures = [
+    # Fields added through Customize Form (ERPNext/HRMS setup fields excluded)
+    {"dt": "Custom Field", "filters": [["fieldname", "like", "custom_%"]]},
+    # This app's property setters (the ones shipped in riz_erp/custom/*.json),
+    # not the ones ERPNext settings generate on every site
+    {"dt": "Property Setter", "filters": [["name", "in", [
+        "Packed Item-rate-read_only",
+        "Sales Invoice Item-barcode-hidden",
+        "Sales Invoice Item-discount_account-hidden",
+        "Sales Invoice Item-discount_account-mandatory_depends_on",
+        "Sales Invoice Item-target_warehouse-hidden",
+        "Sales Invoice-additional_discount_account-hidden",
+        "Sales Invoice-additional_discount_account-mandatory_depends_on",
+        "Sales Invoice-base_rounded_total-hidden",
+        "Sales Invoice-base_rounded_total-print_hide",
+        "Sales Invoice-disable_rounded_total-default",
+        "Sales Invoice-due_date-print_hide",
+        "Sales Invoice-in_words-hidden",
+        "Sales Invoice-in_words-print_hide",
+        "Sales Invoice-main-allow_auto_repeat",
+        "Sales Invoice-main-default_print_format",
+        "Sales Invoice-payment_schedule-print_hide",
+        "Sales Invoice-rounded_total-hidden",
+        "Sales Invoice-rounded_total-print_hide",
+        "Sales Invoice-scan_barcode-hidden",
+        "Sales Invoice-tax_id-hidden",
+        "Sales Invoice-tax_id-print_hide",
+        "Task-main-field_order",
+        "Task-type-allow_in_quick_entry",
+    ]]]},
+]
+
 # Includes in <head>
 # ------------------
 
@@ -101,6 +136,15 @@ app_include_css = "/assets/riz_erp/css/riz_erp.css"
 # before_uninstall = "riz_erp.uninstall.before_uninstall"
 # after_uninstall = "riz_erp.uninstall.after_uninstall"
 
+# Migration
+# ------------
+
+after_migrate = [
+    "riz_erp.fixture_sync.sync_fixtures",
+    # After fixtures: the index covers the custom_next_action Custom Field
+    "riz_erp.riz_erp.report.project_overview.search.ensure_task_search_index",
+]
+
 # Integration Setup
 # ------------------
 # To set up dependencies/integrations with other apps
@@ -155,6 +199,51 @@ app_include_css = "/assets/riz_erp/css/riz_erp.css"
 # 	}
 # }
 
+doc_events = {
+    "Task": {
+        # Cascaded saves of an audit-mode bulk operation skip their Version
+        "on_update": "riz_erp.riz_erp.doctype.bulk_operation_log.bulk_operation_log.on_task_update",
+        "on_change": [
+            "riz_erp.riz_erp.doctype.project_overview_snapshot.project_overview_snapshot.on_task_change",
+            "riz_erp.riz_erp.report.project_overview.replica.mark_user_write",
+        ],
+        "on_trash": [
+            "riz_erp.riz_erp.doctype.project_overview_snapshot.project_overview_snapshot.on_task_trash",
+            "riz_erp.riz_erp.report.project_overview.replica.mark_user_write",
+        ],
+        "after_rename": "riz_erp.riz_erp.doctype.project_overview_snapshot.project_overview_snapshot.after_task_rename",
+    },
+    "ToDo": {
+        "on_update": [
+            "riz_erp.riz_erp.doctype.project_overview_snapshot.project_overview_snapshot.on_todo_change",
+            "riz_erp.riz_erp.report.project_overview.replica.mark_user_write",
+        ],
+        "on_trash": [
+            "riz_erp.riz_erp.doctype.project_overview_snapshot.project_overview_snapshot.on_todo_change",
+            "riz_erp.riz_erp.report.project_overview.replica.mark_user_write",
+        ],
+    },
+    "Project": {
+        "on_update": [
+            "riz_erp.riz_erp.doctype.project_overview_snapshot.project_overview_snapshot.on_project_update",
+            "riz_erp.riz_erp.report.project_overview.replica.mark_user_write",
+        ],
+        "on_trash": [
+            "riz_erp.riz_erp.doctype.project_overview_snapshot.project_overview_snapshot.on_project_trash",
+            "riz_erp.riz_erp.doctype.project_progress_history.project_progress_history.on_project_trash",
+            "riz_erp.riz_erp.report.project_overview.replica.mark_user_write",
+        ],
+    },
+    "User": {
+        "on_update": "riz_erp.riz_erp.doctype.project_overview_snapshot.project_overview_snapshot.on_user_update",
+    },
+}
+
+# Bulk Operation Logs that touched a task, shown on its form timeline
+additional_timeline_content = {
+    "Task": ["riz_erp.riz_erp.doctype.bulk_operation_log.bulk_operation_log.get_task_timeline_content"],
+}
+
 # Scheduled Tasks
 # ---------------
 
@@ -176,6 +265,17 @@ app_include_css = "/assets/riz_erp/css/riz_erp.css"
 # 	],
 # }
 
+scheduler_events = {
+    "daily_long": [
+        # Safety net for Task writes that bypass doc events (e.g. db_set by the overdue job)
+        "riz_erp.tasks.repair_project_overview_snapshot",
+        # Daily progress row per open project (trend column in Project Overview)
+        "riz_erp.tasks.record_project_progress_history",
+        # Incremental SQLite export for analysts (site config riz_erp_analytics_export)
+        "riz_erp.tasks.export_project_analytics",
+    ],
+}
+
 # Testing
 # -------
 
@@ -204,6 +304,8 @@ app_include_css = "/assets/riz_erp/css/riz_erp.css"
 
 # ignore_links_on_delete = ["Communication", "ToDo"]
 
+ignore_links_on_delete = ["Project Overview Snapshot", "Project Progress History", "Bulk Operation Log"]
+
 # Request Events
 # ----------------
 # before_request = ["riz_erp.utils.before_request"]
@@ -0,0 +1,536 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+"""
+Load test for the Project Overview endpoints
+============================================
+Measures how many simultaneous Project Overview users a bench can serve.
+Virtual users (threads) call the report and its write endpoints over HTTP
+against a running bench (web workers, DB and Redis as in production) and
+the results are summarised per operation.
+
+Steps:
+- seed: Creates LOADTEST_PREFIX projects with task trees (via
+  bulk_create_tasks) and LOADTEST_USERS load-test users (Projects User)
+- run: Gives every load-test user a fresh API key, then runs the virtual
+  users for `duration` seconds and reports throughput, p50/p95/p99
+  latency, error/conflict rates and InnoDB lock waits/deadlocks (deltas of
+  the global status counters, so keep other traffic off the DB server)
+- cleanup: Deletes everything created by seed
+
+Scenarios:
+- mixed: Weighted mix of report loads and writes on random tasks of all
+  load-test projects (weights via `mix`, see DEFAULT_MIX)
+- overlap: Every virtual user runs bulk status/date/shift updates on random
+  subsets of the same HOT_SET_SIZE tasks, sending the `modified` values of
+  its last report load (the deadlock/conflict stress test for the ordered
+  locking in concurrency.py). Expected outcome: conflicts and a few busy
+  responses, no errors and no lost updates
+
+Every virtual user reloads the report from time to time and sends the
+`modified` values it saw with its bulk updates, like the report UI does.
+
+Regression checks: the summary can be written to a JSON file and a later
+run compared against it (`baseline`); p95 latency / throughput worse than
+`tolerance` or more errors make the comparison (and the bench command) fail.
+
+Main Functions:
+- seed_load_test(): Create test projects, tasks and users
+- run_load_test(): Run the virtual users and summarise
+- compare_with_baseline(): Regressions against a previous summary
+- cleanup_load_test(): Remove the test data
+"""
+
+import json
+import random
+import threading
+import time
+
+import frappe
+from frappe.utils import add_days, cint, get_url, today
+
+LOADTEST_PREFIX = "[LT] "
+LOADTEST_USERS = 20
+USER_EMAIL = "lt-user-{:02d}@loadtest.invalid"
+USER_EMAIL_PATTERN = "lt-user-%@loadtest.invalid"
+
+# Operation -> weight in the mixed scenario
+DEFAULT_MIX = {
+    "report": 50,
+    "update_task": 15,
+    "bulk_status": 10,
+    "bulk_dates": 10,
+    "assign": 8,
+    "unassign": 7,
+}
+OVERLAP_MIX = {"report": 20, "bulk_status": 40, "bulk_dates": 20, "shift_dates": 20}
+
+HOT_SET_SIZE = 30
+BULK_SELECTION_SIZE = (5, 20)
+REPORT_RELOAD_EVERY = 5
+REQUEST_TIMEOUT = 120
+
+TASK_STATUSES = ("Open", "Working", "Pending Review")
+
+REPORT_METHOD = "frappe.desk.query_report.run"
+API_MODULE = "riz_erp.riz_erp.report.project_overview.project_overview"
+
+LOCK_STATUS_VARIABLES = ("Innodb_row_lock_waits", "Innodb_row_lock_time", "Innodb_deadlocks")
+
+
+# -------------------- seed_load_test --------------------
+# Creates `projects` projects with `tasks_per_project` tasks each
+# (groups of 1 phase + 9 sub-tasks, dated and assigned round-robin)
+# Returns: {"projects": int, "tasks": int, "users": int}
+# ---------------------------------------------------------
+def seed_load_test(projects=10, tasks_per_project=200, users=LOADTEST_USERS):
+    """Create load-test projects, task trees and users"""
+    from riz_erp.riz_erp.report.project_overview.bulk_create import MAX_BULK_TASKS, bulk_create_tasks
+
+    frappe.set_user("Administrator")
+    emails = ensure_users(users)
+
+    existing = len(get_load_test_projects())
+    start, end = today(), add_days(today(), 365)
+    created_tasks = 0
+    for i in range(existing, existing + projects):
+        project = frappe.get_doc({
+            "doctype": "Project",
+            "project_name": f"{LOADTEST_PREFIX}{i + 1:03d}",
+            "status": "Open",
+            "expected_start_date": start,
+            "expected_end_date": end,
+        }).insert()
+
+        lines = []
+        for n in range(tasks_per_project):
+            assignee = emails[n % len(emails)]
+            if n % 10 == 0:
+                lines.append(f"Phase {n // 10 + 1} | {assignee} | {start} | {end}")
+            else:
+                end_date = add_days(start, n % 300 + 5)
+                lines.append(f"    Task {n // 10 + 1}.{n % 10} | {assignee} | {start} | {end_date}")
+
+        # Whole phases per call, at most MAX_BULK_TASKS lines each
+        chunk_size = MAX_BULK_TASKS - MAX_BULK_TASKS % 10
+        for offset in range(0, len(lines), chunk_size):
+            result = bulk_create_tasks(project.name, "\n".join(lines[offset:offset + chunk_size]))
+            if not result["success"]:
+                frappe.throw(f"Seeding {project.name} failed: {'; '.join(result['errors'][:5])}")
+            created_tasks += result["created"]
+        frappe.db.commit()
+
+    return {"projects": projects, "tasks": created_tasks, "users": len(emails)}
+
+
+def ensure_users(count):
+    """Load-test users (Projects User), created when missing"""
+    emails = [USER_EMAIL.format(i + 1) for i in range(count)]
+    for email in emails:
+        if frappe.db.exists("User", email):
+            continue
+        user = frappe.get_doc({
+            "doctype": "User",
+            "email": email,
+            "first_name": email.split("@")[0],
+            "user_type": "System User",
+            "send_welcome_email": 0,
+        })
+        user.flags.no_welcome_mail = True
+        user.insert(ignore_permissions=True)
+        user.add_roles("Projects User")
+    frappe.db.commit()
+    return emails
+
+
+# -------------------- run_load_test --------------------
+# Runs `users` virtual users for `duration` seconds against `url`
+# Returns: summary dict (see summarise())
+# --------------------------------------------------------
+def run_load_test(users=10, duration=60, scenario="mixed", mix=None, url=None, think_time=0.0, seed=None):
+    """Drive the Project Overview endpoints with concurrent virtual users"""
+    frappe.set_user("Administrator")
+    rng = random.Random(seed)
+
+    projects = get_load_test_projects()
+    if not projects:
+        frappe.throw("No load-test data found, run the seed step first")
+    tasks = frappe.get_all(
+        "Task", filters={"project": ["in", projects]}, fields=["name", "project", "parent_task"],
+        order_by="name asc", limit_page_length=0
+    )
+    leaves = [t for t in tasks if t.parent_task]
+
+    if scenario == "overlap":
+        # Hot set from one project, so every report load sees all of it
+        project = rng.choice(sorted({t.project for t in leaves}))
+        candidates = [t.name for t in leaves if t.project == project]
+        pool = {"projects": [project], "tasks": rng.sample(candidates, min(HOT_SET_SIZE, len(candidates)))}
+        weights = mix or OVERLAP_MIX
+    else:
+        pool = {"projects": projects, "tasks": [t.name for t in leaves]}
+        weights = mix or DEFAULT_MIX
+
+    unknown = set(weights) - set(OPERATIONS)
+    if unknown:
+        frappe.throw(f"Unknown operation(s) in mix: {', '.join(sorted(unknown))}")
+
+    emails = frappe.get_all("User", filters={"name": ["like", USER_EMAIL_PATTERN]},
+                            pluck="name", order_by="name asc")
+    if not emails:
+        frappe.throw("No load-test users found, run the seed step first")
+    credentials = [(email, issue_api_key(email)) for email in emails]
+    frappe.db.commit()
+
+    url = (url or get_url()).rstrip("/")
+    lock_status_before = get_lock_status()
+    deadline = time.monotonic() + duration
+    samples = [[] for _ in range(users)]
+    threads = [
+        threading.Thread(
+            target=virtual_user,
+            args=(url, credentials[i % len(credentials)], emails, pool, weights, think_time, deadline,
+                  samples[i], random.Random(rng.random())),
+            daemon=True
+        )
+        for i in range(users)
+    ]
+
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+
+    lock_status_after = get_lock_status()
+    summary = summarise([s for user_samples in samples for s in user_samples], elapsed)
+    summary["db_locks"] = {
+        variable: lock_status_after.get(variable, 0) - lock_status_before.get(variable, 0)
+        for variable in LOCK_STATUS_VARIABLES
+    }
+    summary["config"] = {
+        "scenario": scenario, "users": users, "duration": duration, "mix": weights,
+        "projects": len(pool["projects"]), "tasks": len(pool["tasks"]), "url": url,
+    }
+    if scenario == "overlap":
+        summary["lost_updates"] = check_lost_updates(pool["tasks"])
+    return summary
+
+
+def issue_api_key(email):
+    """Fresh API secret for a load-test user: (api_key, api_secret)"""
+    user = frappe.get_doc("User", email)
+    user.api_key = user.api_key or frappe.generate_hash(length=15)
+    api_secret = frappe.generate_hash(length=15)
+    user.api_secret = api_secret
+    user.save(ignore_permissions=True)
+    return user.api_key, api_secret
+
+
+# -------------------- virtual_user --------------------
+# One simulated report user: picks weighted operations until the
+# deadline and appends (operation, seconds, outcome) to `samples`
+# -------------------------------------------------------
+def virtual_user(url, credential, emails, pool, weights, think_time, deadline, samples, rng):
+    import requests
+
+    email, (api_key, api_secret) = credential
+    session = requests.Session()
+    session.headers.update({"Authorization": f"token {api_key}:{api_secret}", "Accept": "application/json"})
+
+    state = {"email": email, "emails": emails, "pool": pool, "rng": rng, "seen": {}, "calls": 0}
+    operations = list(weights)
+    op_weights = [weights[op] for op in operations]
+    while time.monotonic() < deadline:
+        # Load the report first and every REPORT_RELOAD_EVERY calls (fresh `modified` values)
+        if state["calls"] % REPORT_RELOAD_EVERY == 0 and "report" in weights:
+            operation = "report"
+        else:
+            operation = rng.choices(operations, op_weights)[0]
+        state["calls"] += 1
+
+        method, args = OPERATIONS[operation](state)
+        started = time.perf_counter()
+        try:
+            response = session.post(f"{url}/api/method/{method}", data=args, timeout=REQUEST_TIMEOUT)
+            seconds = time.perf_counter() - started
+            outcome = get_outcome(operation, response, state)
+        except Exception:
+            seconds = time.perf_counter() - started
+            outcome = "error"
+        samples.append((operation, seconds, outcome))
+
+        if think_time:
+            time.sleep(rng.uniform(0, 2 * think_time))
+
+
+# -------------------- operations --------------------
+# Operation -> (method, form data); task selections come from the pool
+# -----------------------------------------------------
+def report_args(state):
+    project = state["rng"].choice(state["pool"]["projects"])
+    return REPORT_METHOD, {
+        "report_name": "Project Overview",
+        "filters": json.dumps({"project": project, "show_completed_tasks": 1}),
+        "ignore_prepared_report": 1,
+    }
+
+
+def update_task_args(state):
+    return f"{API_MODULE}.update_task", {
+        "task_name": state["rng"].choice(state["pool"]["tasks"]),
+        "new_status": state["rng"].choice(TASK_STATUSES),
+    }
+
+
+def bulk_status_args(state):
+    task_ids = pick_tasks(state)
+    return f"{API_MODULE}.bulk_update_task_status", {
+        "task_ids": json.dumps(task_ids),
+        "new_status": state["rng"].choice(TASK_STATUSES),
+        "custom_next_action": f"load test {state['calls']}",
+        "expected_modified": json.dumps(get_expected_modified(state, task_ids)),
+    }
+
+
+def bulk_dates_args(state):
+    task_ids = pick_tasks(state)
+    return f"{API_MODULE}.bulk_update_task_dates", {
+        "task_ids": json.dumps(task_ids),
+        "exp_start_date": today(),
+        "exp_end_date": add_days(today(), state["rng"].randint(5, 300)),
+        "expected_modified": json.dumps(get_expected_modified(state, task_ids)),
+    }
+
+
+def shift_dates_args(state):
+    task_ids = pick_tasks(state)
+    return f"{API_MODULE}.bulk_update_task_dates", {
+        "task_ids": json.dumps(task_ids),
+        "shift_days": state["rng"].choice((-1, 1)),
+        "working_days": 1,
+        "include_dependents": 1,
+        "expected_modified": json.dumps(get_expected_modified(state, task_ids)),
+    }
+
+
+def assign_args(state):
+    return f"{API_MODULE}.assign_tasks", {
+        "task_ids": json.dumps(pick_tasks(state)),
+        "user": state["rng"].choice(state["emails"]),
+    }
+
+
+def unassign_args(state):
+    return f"{API_MODULE}.unassign_tasks", {
+        "task_ids": json.dumps(pick_tasks(state)),
+        "users": json.dumps([state["rng"].choice(state["emails"])]),
+    }
+
+
+OPERATIONS = {
+    "report": report_args,
+    "update_task": update_task_args,
+    "bulk_status": bulk_status_args,
+    "bulk_dates": bulk_dates_args,
+    "shift_dates": shift_dates_args,
+    "assign": assign_args,
+    "unassign": unassign_args,
+}
+
+
+def pick_tasks(state):
+    tasks = state["pool"]["tasks"]
+    return state["rng"].sample(tasks, min(state["rng"].randint(*BULK_SELECTION_SIZE), len(tasks)))
+
+
+def get_expected_modified(state, task_ids):
+    return {task: state["seen"][task] for task in task_ids if task in state["seen"]}
+
+
+# -------------------- get_outcome --------------------
+# "ok", "conflict" (optimistic check rejected tasks), "busy" (all
+# deadlock retries failed), "failed" (per-task errors) or "error"
+# (HTTP error / exception response)
+# ------------------------------------------------------
+def get_outcome(operation, response, state):
+    if response.status_code != 200:
+        return "error"
+    message = response.json().get("message")
+
+    if operation == "report":
+        for row in (message or {}).get("result") or []:
+            if isinstance(row, dict) and not row.get("is_project") and row.get("modified"):
+                state["seen"][row["name"]] = row["modified"]
+        return "ok"
+
+    if not isinstance(message, dict):
+        return "ok"
+    if message.get("conflicts"):
+        return "conflict"
+    if not message.get("success") and not message.get("updated") and message.get("failed") \
+            and "someone else" in " ".join(message.get("errors") or []):
+        return "busy"
+    if message.get("failed"):
+        return "failed"
+    return "ok"
+
+
+# -------------------- summarise --------------------
+# Per-operation and overall count, throughput, latency percentiles
+# (ms) and outcome rates
+# ----------------------------------------------------
+def summarise(samples, elapsed):
+    by_operation = {}
+    for operation, seconds, outcome in samples:
+        by_operation.setdefault(operation, []).append((seconds, outcome))
+
+    def stats(rows):
+        latencies = sorted(seconds * 1000 for seconds, _outcome in rows)
+        outcomes = {}
+        for _seconds, outcome in rows:
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+        return {
+            "requests": len(rows),
+            "throughput": round(len(rows) / elapsed, 2) if elapsed else 0,
+            "p50_ms": round(percentile(latencies, 50), 1),
+            "p95_ms": round(percentile(latencies, 95), 1),
+            "p99_ms": round(percentile(latencies, 99), 1),
+            "max_ms": round(latencies[-1], 1) if latencies else 0,
+            "error_rate": round(outcomes.get("error", 0) / len(rows), 4) if rows else 0,
+            "outcomes": outcomes,
+        }
+
+    return {
+        "elapsed": round(elapsed, 2),
+        "total": stats([(seconds, outcome) for _operation, seconds, outcome in samples]),
+        "operations": {operation: stats(rows) for operation, rows in sorted(by_operation.items())},
+    }
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0
+    rank = max(1, -(-pct * len(sorted_values) // 100))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+# -------------------- get_lock_status --------------------
+# InnoDB lock wait / deadlock counters (server-wide, cumulative)
+# ----------------------------------------------------------
+def get_lock_status():
+    return {
+        variable: cint(value)
+        for variable, value in frappe.db.sql(
+            "show global status where Variable_name in %s", (LOCK_STATUS_VARIABLES,)
+        )
+    }
+
+
+# -------------------- check_lost_updates --------------------
+# Overlap scenario: Task and snapshot must agree for every hot task
+# (a lost or half-applied update shows up as a mismatch)
+# Returns: list of task names that differ
+# -------------------------------------------------------------
+def check_lost_updates(task_names):
+    from riz_erp.riz_erp.doctype.project_overview_snapshot.project_overview_snapshot import (
+        DOCTYPE as SNAPSHOT_DOCTYPE,
+    )
+
+    frappe.db.rollback()  # new read view after the run
+    return frappe.db.sql_list(
+        f"""
+        select t.name
+        from `tabTask` t
+        left join `tab{SNAPSHOT_DOCTYPE}` s on s.name = t.name
+        where t.name in %s
+            and (s.name is null or s.status != t.status
+                or not (s.exp_end_date <=> t.exp_end_date)
+                or not (s.exp_start_date <=> t.exp_start_date))
+        """,
+        (tuple(task_names),)
+    ) if task_names else []
+
+
+# -------------------- compare_with_baseline --------------------
+# Regressions of `summary` against a previous summary: p95 latency up
+# or throughput down by more than `tolerance`, or a higher error rate
+# Returns: list of messages (empty = no regression)
+# ----------------------------------------------------------------
+def compare_with_baseline(summary, baseline, tolerance=0.2):
+    regressions = []
+    sections = {"total": (summary["total"], baseline.get("total") or {})}
+    for operation, stats in summary["operations"].items():
+        if operation in (baseline.get("operations") or {}):
+            sections[operation] = (stats, baseline["operations"][operation])
+
+    for name, (current, previous) in sections.items():
+        if previous.get("p95_ms") and current["p95_ms"] > previous["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {current['p95_ms']} ms (baseline {previous['p95_ms']} ms)")
+        if previous.get("throughput") and current["throughput"] < previous["throughput"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: throughput {current['throughput']}/s (baseline {previous['throughput']}/s)"
+            )
+        previous_errors = previous.get("error_rate") or 0
+        if current["error_rate"] > previous_errors + 0.01:
+            regressions.append(
+                f"{name}: error rate {current['error_rate']:.2%} (baseline {previous_errors:.2%})"
+            )
+
+    if summary.get("lost_updates"):
+        regressions.append(f"{len(summary['lost_updates'])} task(s) out of sync with the snapshot")
+    return regressions
+
+
+# -------------------- cleanup_load_test --------------------
+# Deletes load-test projects, their tasks, assignments, snapshot and
+# history rows, and the load-test users
+# Returns: {"projects": int, "tasks": int, "users": int}
+# ------------------------------------------------------------
+def cleanup_load_test():
+    """Remove all data created by seed_load_test()"""
+    from riz_erp.riz_erp.doctype.project_overview_snapshot.project_overview_snapshot import (
+        DOCTYPE as SNAPSHOT_DOCTYPE,
+        bump_data_version,
+    )
+    from riz_erp.riz_erp.doctype.project_progress_history.project_progress_history import (
+        DOCTYPE as HISTORY_DOCTYPE,
+    )
+
+    frappe.set_user("Administrator")
+    projects = get_load_test_projects()
+    tasks = frappe.get_all("Task", filters={"project": ["in", projects]}, pluck="name") if projects else []
+
+    # Plain deletes: test data only, no document hooks (nested-set gaps are harmless)
+    if tasks:
+        frappe.db.delete("ToDo", {"reference_type": "Task", "reference_name": ["in", tasks]})
+        frappe.db.delete("Task Depends On", {"parenttype": "Task", "parent": ["in", tasks]})
+        frappe.db.delete("Task", {"name": ["in", tasks]})
+    if projects:
+        frappe.db.delete(SNAPSHOT_DOCTYPE, {"project": ["in", projects]})
+        frappe.db.delete(HISTORY_DOCTYPE, {"project": ["in", projects]})
+        frappe.db.delete("Project", {"name": ["in", projects]})
+        bump_data_version()
+
+    users = frappe.get_all("User", filters={"name": ["like", USER_EMAIL_PATTERN]}, pluck="name")
+    for user in users:
+        frappe.delete_doc("User", user, ignore_permissions=True, force=True)
+    frappe.db.commit()
+    return {"projects": len(projects), "tasks": len(tasks), "users": len(users)}
+
+
+def get_load_test_projects():
+    return frappe.get_all("Project", filters={"project_name": ["like", f"{LOADTEST_PREFIX}%"]}, pluck="name")
+
+
+def parse_mix(value):
+    """Parse "report=50,bulk_status=10" into {operation: weight}"""
+    if not value:
+        return None
+    mix = {}
+    for part in value.split(","):
+        operation, _, weight = part.partition("=")
+        mix[operation.strip()] = cint(weight or 1)
+    return {operation: weight for operation, weight in mix.items() if weight > 0}
@@ -0,0 +1,5 @@
+from riz_erp.riz_erp.report.project_overview.search import ensure_task_search_index
+
+
+def execute():
+    ensure_task_search_index()
@@ -0,0 +1,8 @@
+import frappe
+
+from riz_erp.riz_erp.doctype.project_overview_snapshot.project_overview_snapshot import rebuild_snapshot
+
+
+def execute():
+    frappe.reload_doc("riz_erp", "doctype", "project_overview_snapshot")
+    rebuild_snapshot()
@@ -0,0 +1,194 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+"""
+Bulk Operation Log - One audit record per bulk operation
+========================================================
+A 500-task bulk update used to write 500 Version rows (plus activity and
+assignment comments), which bloats tabVersion/tabComment and slows every
+Task form timeline.
+
+In bulk audit mode the Project Overview bulk endpoints skip per-task
+versions/comments and write one Bulk Operation Log instead: the operation,
+who ran it, and one child row per affected task with its field changes
+({"fieldname": [old, new]}). Parent and child rows are written with one
+bulk insert each, regardless of the number of tasks.
+
+Task.on_update saves other tasks in cascade (the parent task, dependent
+tasks it reschedules). Inside capture_cascaded_saves() those saves skip
+their Version as well (Task on_update hook) and their status/progress/date
+changes go into the same log, so one operation writes one log no matter
+how far the cascade reaches.
+
+Task timelines show the logs that touched the task (hooks.py
+additional_timeline_content, one indexed query per form load).
+
+Site config (site_config.json):
+- project_overview_bulk_audit: Enable bulk audit mode (default off)
+
+Main Functions:
+- is_bulk_audit_enabled(): Whether bulk endpoints use audit mode
+- record_bulk_operation(): Write one log for an operation
+- get_field_changes(): {fieldname: [old, new]} of a saved document
+- capture_cascaded_saves(): Collect cascaded Task saves of an operation
+- merge_task_changes(): Operation's own changes + cascaded ones
+- get_task_timeline_content(): Timeline entries for a Task form
+"""
+
+import json
+from contextlib import contextmanager
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import escape_html, now
+
+DOCTYPE = "Bulk Operation Log"
+TASK_DOCTYPE = "Bulk Operation Log Task"
+
+# Logs shown on a Task timeline (most recent first)
+TIMELINE_LIMIT = 20
+
+# frappe.flags key holding the cascaded saves of the running operation
+CASCADE_FLAG = "riz_erp_bulk_cascaded_saves"
+
+# Fields recorded for tasks saved in cascade
+CASCADE_FIELDS = ("status", "progress", "exp_start_date", "exp_end_date")
+
+
+class BulkOperationLog(Document):
+    pass
+
+
+def is_bulk_audit_enabled():
+    return bool(frappe.conf.get("project_overview_bulk_audit"))
+
+
+# -------------------- record_bulk_operation --------------------
+# Writes one log with a child row per task (two bulk inserts)
+# task_changes: {task: (project, {fieldname: [old, new]})}
+# Returns: log name (None when nothing changed)
+# ----------------------------------------------------------------
+def record_bulk_operation(operation, task_changes, summary=None):
+    """Record a bulk operation and the field changes of its tasks"""
+    if not task_changes:
+        return None
+
+    timestamp = now()
+    user = frappe.session.user
+    name = frappe.generate_hash(length=10)
+    projects = sorted({project for project, _changes in task_changes.values() if project})
+    summary = summary or f"{operation} of {len(task_changes)} task(s)"
+
+    frappe.db.bulk_insert(
+        DOCTYPE,
+        ["name", "operation", "task_count", "projects", "summary",
+         "creation", "modified", "owner", "modified_by"],
+        [[name, operation, len(task_changes), ", ".join(projects), summary, timestamp, timestamp, user, user]]
+    )
+    frappe.db.bulk_insert(
+        TASK_DOCTYPE,
+        ["name", "parent", "parenttype", "parentfield", "idx", "task", "project", "changes",
+         "creation", "modified", "owner", "modified_by"],
+        [
+            [frappe.generate_hash(length=10), name, DOCTYPE, "tasks", idx, task, project,
+             json.dumps(changes, default=str), timestamp, timestamp, user, user]
+            for idx, (task, (project, changes)) in enumerate(sorted(task_changes.items()), start=1)
+        ]
+    )
+    return name
+
+
+def get_field_changes(old_values, doc):
+    """Changed fields of doc compared with old_values ({fieldname: value})"""
+    return {
+        fieldname: [old, doc.get(fieldname)]
+        for fieldname, old in old_values.items()
+        if str(old or "") != str(doc.get(fieldname) or "")
+    }
+
+
+# -------------------- capture_cascaded_saves --------------------
+# Active for the block when enabled; yields {task: (project, changes)}
+# filled by on_task_update for every Task save that did not already set
+# ignore_version (i.e. saves the operation did not make itself)
+# -----------------------------------------------------------------
+@contextmanager
+def capture_cascaded_saves(enabled=True):
+    """Record cascaded Task saves in the operation's log instead of Versions"""
+    cascaded = {}
+    if not enabled:
+        yield cascaded
+        return
+
+    frappe.flags[CASCADE_FLAG] = cascaded
+    try:
+        yield cascaded
+    finally:
+        frappe.flags.pop(CASCADE_FLAG, None)
+
+
+def on_task_update(doc, method=None):
+    """Task on_update hook (runs before save_version)"""
+    cascaded = frappe.flags.get(CASCADE_FLAG)
+    if cascaded is None or doc.flags.ignore_version:
+        return
+
+    doc.flags.ignore_version = True
+    before = doc.get_doc_before_save()
+    if not before:
+        return
+
+    _project, changes = cascaded.setdefault(doc.name, (doc.project, {}))
+    for fieldname in CASCADE_FIELDS:
+        # Saved more than once: keep the value before the first save
+        old = changes[fieldname][0] if fieldname in changes else before.get(fieldname)
+        changes[fieldname] = [old, doc.get(fieldname)]
+        if str(old or "") == str(doc.get(fieldname) or ""):
+            del changes[fieldname]
+
+
+def merge_task_changes(task_changes, cascaded):
+    """{task: (project, changes)} of the operation's saves plus cascaded ones"""
+    merged = {task: (project, dict(changes)) for task, (project, changes) in cascaded.items() if changes}
+    for task, (project, changes) in task_changes.items():
+        merged.setdefault(task, (project, {}))[1].update(changes)
+    return merged
+
+
+# -------------------- get_task_timeline_content --------------------
+# hooks.py additional_timeline_content["Task"]
+# Returns: timeline entries linking to the logs that touched the task
+# --------------------------------------------------------------------
+def get_task_timeline_content(doctype, docname):
+    """Bulk operations of a task for its form timeline"""
+    logs = frappe.db.sql(
+        f"""
+        select l.name, l.operation, l.task_count, l.owner, l.creation, c.changes
+        from `tab{TASK_DOCTYPE}` c
+        inner join `tab{DOCTYPE}` l on l.name = c.parent
+        where c.task = %s and c.parenttype = %s
+        order by l.creation desc
+        limit %s
+        """,
+        (docname, DOCTYPE, TIMELINE_LIMIT),
+        as_dict=True
+    )
+
+    contents = []
+    for log in logs:
+        changes = json.loads(log.changes or "{}")
+        diff = ", ".join(
+            f"{field}: {escape_html(str(old or '-'))} → {escape_html(str(new or '-'))}"
+            for field, (old, new) in changes.items()
+        )
+        contents.append({
+            "icon": "list",
+            "is_card": False,
+            "creation": log.creation,
+            "content": (
+                f"{escape_html(frappe.utils.get_fullname(log.owner))} "
+                f"<a href='/app/bulk-operation-log/{log.name}'>{escape_html(log.operation)}</a> "
+                f"({log.task_count} task(s)){': ' + diff if diff else ''}"
+            ),
+        })
+    return contents
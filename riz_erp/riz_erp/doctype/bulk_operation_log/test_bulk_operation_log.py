@@ -0,0 +1,50 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from riz_erp.riz_erp.doctype.bulk_operation_log.bulk_operation_log import (
+    capture_cascaded_saves,
+    merge_task_changes,
+    on_task_update,
+)
+
+
+class TaskSave(frappe._dict):
+    """Stand-in for a Task being saved: its values plus the ones before the save"""
+
+    def __init__(self, before, **values):
+        super().__init__({**before, **values})
+        self.flags = frappe._dict()
+        self.before = frappe._dict(before)
+
+    def get_doc_before_save(self):
+        return self.before
+
+
+class TestCascadedSaves(FrappeTestCase):
+    def test_cascaded_saves_skip_versions_and_are_recorded(self):
+        parent = TaskSave({"name": "T-P", "project": "P1", "status": "Open", "progress": 0}, progress=50)
+        own = TaskSave({"name": "T-A", "project": "P1", "status": "Open"}, status="Completed")
+        own.flags.ignore_version = True  # saved by the operation itself
+
+        with capture_cascaded_saves() as cascaded:
+            on_task_update(own)
+            on_task_update(parent)
+            # Saved again later in the same operation: first old value is kept
+            on_task_update(TaskSave({"name": "T-P", "project": "P1", "status": "Open", "progress": 50}, progress=100))
+
+        self.assertTrue(parent.flags.ignore_version)
+        self.assertEqual(cascaded, {"T-P": ("P1", {"progress": [0, 100]})})
+        self.assertEqual(
+            merge_task_changes({"T-A": ("P1", {"status": ["Open", "Completed"]})}, cascaded),
+            {"T-A": ("P1", {"status": ["Open", "Completed"]}), "T-P": ("P1", {"progress": [0, 100]})},
+        )
+
+    def test_saves_outside_an_operation_keep_versions(self):
+        task = TaskSave({"name": "T-A", "project": "P1", "status": "Open"}, status="Working")
+        with capture_cascaded_saves(enabled=False):
+            on_task_update(task)
+        on_task_update(task)
+        self.assertFalse(task.flags.ignore_version)
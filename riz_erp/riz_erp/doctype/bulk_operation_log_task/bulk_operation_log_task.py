@@ -0,0 +1,8 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+from frappe.model.document import Document
+
+
+class BulkOperationLogTask(Document):
+    pass
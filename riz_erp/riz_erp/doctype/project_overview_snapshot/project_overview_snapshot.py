@@ -0,0 +1,491 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+"""
+Project Overview Snapshot - Denormalized task tree for the report
+=================================================================
+One row per Task (that belongs to a Project) holding everything the
+Project Overview report displays: display fields, tree depth, an ordering
+key and the pre-joined list of open assignees.
+
+The report reads this table with a single indexed scan instead of querying
+Task, ToDo and User and building the tree in Python on every run.
+
+Row layout:
+- depth: 1 for top-level tasks, +1 for every ancestor in the same project
+- sort_key: slash separated ancestor path ending with the task name
+  (ordering by project, sort_key yields the tree in pre-order)
+- assigned_to: "email:full_name" pairs, comma separated (same format the
+  report formatter already parses)
+
+Maintenance (wired in hooks.py doc_events):
+- Task on_change / on_trash / after_rename: refresh task (and subtree)
+- ToDo on_update / on_trash: refresh assignees of the referenced task
+- Project on_trash: drop the project's rows
+- User on_update: refresh assignee names when full_name changes
+
+Data version: every write path above (and the set-based bulk writers)
+calls bump_data_version(), which replaces a random token in Redis once
+the transaction commits. Readers can compare tokens instead of querying
+(used as the ETag base of the JSON API, riz_erp.api.v1).
+
+Main Functions:
+- rebuild_snapshot(): Full rebuild (all projects or one project)
+- check_snapshot(): Consistency checker, optionally fixes drifted projects
+- refresh_tasks(): Incremental refresh for a set of tasks
+- build_snapshot_rows(): Compute depth/sort_key rows from task dicts
+- get_data_version() / bump_data_version(): Change token of the report data
+"""
+
+import frappe
+from frappe.model.document import Document
+
+DOCTYPE = "Project Overview Snapshot"
+
+DATA_VERSION_KEY = "riz_erp:project_overview:data_version"
+DATA_VERSION_FLAG = "project_overview_data_version_bump"
+
+# Task fields copied into the snapshot
+TASK_FIELDS = [
+    "name", "project", "subject", "custom_next_action", "status", "priority",
+    "exp_start_date", "exp_end_date", "progress", "parent_task",
+]
+
+# Snapshot fields compared by the consistency checker
+SNAPSHOT_FIELDS = [
+    "project", "subject", "custom_next_action", "status", "priority",
+    "exp_start_date", "exp_end_date", "progress", "parent_task",
+    "depth", "sort_key", "assigned_to",
+]
+
+
+class ProjectOverviewSnapshot(Document):
+    pass
+
+
+# -------------------- on_doctype_update --------------------
+# Composite index backing the report scan (project, tree order)
+# ------------------------------------------------------------
+def on_doctype_update():
+    frappe.db.add_index(DOCTYPE, ["project", "sort_key"])
+
+
+# -------------------- build_snapshot_rows --------------------
+# Converts task dicts into snapshot rows with depth and sort_key
+# parent_paths: {task_name: (depth, sort_key)} for ancestors that are
+# not part of `tasks` (used by incremental refreshes)
+# A parent in another project is ignored (task becomes top-level),
+# matching how the report nests tasks per project
+# --------------------------------------------------------------
+def build_snapshot_rows(tasks, task_assignments=None, parent_paths=None):
+    """Build snapshot rows (dicts) for the given tasks"""
+    if task_assignments is None:
+        task_assignments = {}
+
+    lookup = {t["name"]: t for t in tasks}
+    paths = dict(parent_paths or {})
+
+    def resolve(name):
+        # Walk up until a task with a known path (or a root) is found
+        chain = []
+        current = name
+        while current not in paths:
+            task = lookup[current]
+            parent = task.get("parent_task")
+            if parent in lookup:
+                linked = lookup[parent].get("project") == task.get("project") and parent not in chain
+            else:
+                linked = parent in paths
+            if not parent or parent == current or not linked:
+                paths[current] = (1, current)
+                break
+            chain.append(current)
+            current = parent
+
+        for task_name in reversed(chain):
+            if task_name in paths:
+                continue
+            depth, sort_key = paths[lookup[task_name]["parent_task"]]
+            paths[task_name] = (depth + 1, f"{sort_key}/{task_name}")
+        return paths[name]
+
+    rows = []
+    for t in tasks:
+        if not t.get("project"):
+            continue
+        depth, sort_key = resolve(t["name"])
+        assignees = task_assignments.get(t["name"], [])
+        rows.append({
+            "name": t["name"],
+            "task": t["name"],
+            "project": t.get("project"),
+            "subject": t.get("subject"),
+            "custom_next_action": t.get("custom_next_action"),
+            "status": t.get("status"),
+            "priority": t.get("priority"),
+            "exp_start_date": t.get("exp_start_date"),
+            "exp_end_date": t.get("exp_end_date"),
+            "progress": t.get("progress"),
+            "parent_task": t.get("parent_task"),
+            "depth": depth,
+            "sort_key": sort_key,
+            "assigned_to": ",".join(assignees),
+        })
+    return rows
+
+
+# -------------------- get_task_assignments --------------------
+# Open ToDo assignments for tasks with user full names (2 queries)
+# Returns: {task_name: ["email:full_name", ...]}
+# ---------------------------------------------------------------
+def get_task_assignments(task_names):
+    """Fetch open assignments for tasks in "email:full_name" format"""
+    task_assignments = {}
+    if not task_names:
+        return task_assignments
+
+    assignments = frappe.get_all(
+        "ToDo",
+        filters={
+            "reference_type": "Task",
+            "reference_name": ["in", list(task_names)],
+            "status": "Open"
+        },
+        fields=["reference_name", "allocated_to"],
+        order_by="creation asc"
+    )
+
+    assigned_users = list(set([a.allocated_to for a in assignments]))
+    user_names = {}
+    if assigned_users:
+        users = frappe.get_all(
+            "User",
+            filters={"name": ["in", assigned_users]},
+            fields=["name", "full_name"]
+        )
+        user_names = {u.name: u.full_name or u.name for u in users}
+
+    for assignment in assignments:
+        email = assignment.allocated_to
+        entry = f"{email}:{user_names.get(email, email)}"
+        entries = task_assignments.setdefault(assignment.reference_name, [])
+        if entry not in entries:
+            entries.append(entry)
+    return task_assignments
+
+
+# -------------------- rebuild_snapshot --------------------
+# Full rebuild of the snapshot, one project at a time
+# Deletes and re-inserts the rows of each project in bulk
+# -----------------------------------------------------------
+def rebuild_snapshot(project=None):
+    """Rebuild snapshot rows for one project or for all projects
+
+    Args:
+        project (str): Optional project name, all projects when empty
+
+    Returns:
+        int: Number of rows written
+    """
+    if project:
+        projects = [project]
+    else:
+        projects = frappe.get_all("Project", pluck="name", order_by="name asc")
+        # Rows of deleted projects / project-less tasks are dropped as well
+        frappe.db.delete(DOCTYPE)
+
+    written = 0
+    for project_name in projects:
+        rows = compute_project_rows(project_name)
+        if project:
+            frappe.db.delete(DOCTYPE, {"project": project_name})
+        insert_rows(rows)
+        written += len(rows)
+
+    # Takes effect when the transaction commits, with the rows above
+    bump_data_version()
+    return written
+
+
+# -------------------- compute_project_rows --------------------
+# Computes the expected snapshot rows of a project from live tables
+# ---------------------------------------------------------------
+def compute_project_rows(project):
+    """Compute snapshot rows for all tasks of a project"""
+    tasks = frappe.get_all(
+        "Task",
+        filters={"project": project},
+        fields=TASK_FIELDS,
+        order_by="name asc"
+    )
+    task_assignments = get_task_assignments([t.name for t in tasks])
+    return build_snapshot_rows(tasks, task_assignments)
+
+
+# -------------------- check_snapshot --------------------
+# Consistency checker: compares stored rows with live data
+# Returns list of problems; with fix=True rebuilds affected projects
+# ---------------------------------------------------------
+def check_snapshot(project=None, fix=False):
+    """Compare snapshot rows with live Task/ToDo/User data
+
+    Args:
+        project (str): Optional project name, all projects when empty
+        fix (bool): Rebuild every project with at least one problem
+
+    Returns:
+        list: [{"project": str, "task": str, "problem": str}, ...]
+    """
+    projects = [project] if project else frappe.get_all("Project", pluck="name", order_by="name asc")
+    problems = []
+
+    for project_name in projects:
+        expected = {r["task"]: r for r in compute_project_rows(project_name)}
+        stored = {
+            r.task: r for r in frappe.get_all(
+                DOCTYPE, filters={"project": project_name}, fields=["task", *SNAPSHOT_FIELDS]
+            )
+        }
+        project_problems = []
+
+        for task_name, row in expected.items():
+            if task_name not in stored:
+                project_problems.append({"project": project_name, "task": task_name, "problem": "missing"})
+                continue
+            for field in SNAPSHOT_FIELDS:
+                if (row.get(field) or None) != (stored[task_name].get(field) or None):
+                    project_problems.append({
+                        "project": project_name,
+                        "task": task_name,
+                        "problem": f"{field}: expected {row.get(field)!r}, found {stored[task_name].get(field)!r}"
+                    })
+
+        for task_name in set(stored) - set(expected):
+            project_problems.append({"project": project_name, "task": task_name, "problem": "stale"})
+
+        if fix and project_problems:
+            rebuild_snapshot(project_name)
+        problems.extend(project_problems)
+
+    return problems
+
+
+# -------------------- insert_rows --------------------
+# Bulk inserts snapshot rows (no controller hooks)
+# ------------------------------------------------------
+def insert_rows(rows):
+    """Insert snapshot rows with a single multi-row INSERT per batch"""
+    if not rows:
+        return
+
+    from frappe.utils import now
+
+    timestamp = now()
+    user = frappe.session.user
+    fields = ["name", "task", *SNAPSHOT_FIELDS, "creation", "modified", "owner", "modified_by"]
+    values = [
+        [row.get(f) for f in fields[:-4]] + [timestamp, timestamp, user, user]
+        for row in rows
+    ]
+    frappe.db.bulk_insert(DOCTYPE, fields, values)
+
+
+# -------------------- upsert_rows --------------------
+# Writes rows for tasks that may or may not exist in the snapshot
+# ------------------------------------------------------
+def upsert_rows(rows):
+    """Update existing snapshot rows and insert missing ones"""
+    if not rows:
+        return
+
+    existing = set(frappe.get_all(DOCTYPE, filters={"name": ["in", [r["name"] for r in rows]]}, pluck="name"))
+    new_rows = []
+    for row in rows:
+        if row["name"] in existing:
+            frappe.db.set_value(DOCTYPE, row["name"], {f: row.get(f) for f in SNAPSHOT_FIELDS})
+        else:
+            new_rows.append(row)
+    insert_rows(new_rows)
+
+
+# -------------------- refresh_tasks --------------------
+# Incremental refresh of a task (and optionally its subtree)
+# Ancestors are loaded with one nested-set query, descendants with another
+# ------------------------------------------------------------------------
+def refresh_tasks(task_name, include_descendants=False):
+    """Recompute and write the snapshot rows of a task
+
+    Args:
+        task_name (str): Task to refresh
+        include_descendants (bool): Also refresh every task below it
+    """
+    task = frappe.db.get_value("Task", task_name, [*TASK_FIELDS, "lft", "rgt"], as_dict=True)
+    if not task:
+        frappe.db.delete(DOCTYPE, {"task": task_name})
+        return
+
+    tasks = [task]
+    if include_descendants and task.lft and task.rgt and task.rgt - task.lft > 1:
+        tasks.extend(frappe.get_all(
+            "Task",
+            filters={"lft": [">", task.lft], "rgt": ["<", task.rgt]},
+            fields=TASK_FIELDS,
+            order_by="lft asc"
+        ))
+
+    parent_paths = {}
+    if task.parent_task:
+        parent = frappe.db.get_value(DOCTYPE, task.parent_task, ["project", "depth", "sort_key"], as_dict=True)
+        if parent and parent.project == task.project:
+            parent_paths[task.parent_task] = (parent.depth, parent.sort_key)
+        else:
+            # Parent row missing (snapshot not built yet) - derive the path
+            parent_paths.update(get_ancestor_paths(task))
+
+    rows = build_snapshot_rows(tasks, get_task_assignments([t.name for t in tasks]), parent_paths)
+
+    # Tasks without a project are not shown in the report
+    orphaned = [t.name for t in tasks if not t.project]
+    if orphaned:
+        frappe.db.delete(DOCTYPE, {"task": ["in", orphaned]})
+    upsert_rows(rows)
+
+
+# -------------------- get_ancestor_paths --------------------
+# Derives {ancestor: (depth, sort_key)} for a task's same-project
+# ancestors from the Task nested set (single query)
+# -------------------------------------------------------------
+def get_ancestor_paths(task):
+    """Compute paths of a task's ancestors within its project"""
+    if not (task.lft and task.rgt):
+        return {}
+
+    ancestors = frappe.get_all(
+        "Task",
+        filters={"lft": ["<", task.lft], "rgt": [">", task.rgt]},
+        fields=["name", "project", "parent_task"],
+        order_by="lft asc"
+    )
+
+    # Only the contiguous same-project chain directly above the task counts
+    chain = []
+    for ancestor in reversed(ancestors):
+        if ancestor.project != task.project:
+            break
+        chain.append(ancestor)
+
+    paths = {}
+    depth, sort_key = 0, ""
+    for ancestor in reversed(chain):
+        depth += 1
+        sort_key = f"{sort_key}/{ancestor.name}" if sort_key else ancestor.name
+        paths[ancestor.name] = (depth, sort_key)
+    return paths
+
+
+# -------------------- Task hooks --------------------
+# Wired in hooks.py doc_events["Task"]
+# ----------------------------------------------------
+def on_task_change(doc, method=None):
+    """Refresh the task row; refresh the subtree when tree position changed"""
+    # Bulk writers refresh the snapshot themselves once they are done
+    if doc.flags.ignore_project_overview_snapshot:
+        return
+
+    moved = doc.has_value_changed("parent_task") or doc.has_value_changed("project")
+    refresh_tasks(doc.name, include_descendants=moved)
+    bump_data_version()
+
+
+def on_task_trash(doc, method=None):
+    """Drop the deleted task's row"""
+    frappe.db.delete(DOCTYPE, {"task": doc.name})
+    bump_data_version()
+
+
+def after_task_rename(doc, method=None, old_name=None, new_name=None, merge=False):
+    """Sort keys embed task names - rebuild the whole project"""
+    frappe.db.delete(DOCTYPE, {"task": ["in", [old_name, new_name]]})
+    bump_data_version()
+    if doc.project:
+        rebuild_snapshot(doc.project)
+
+
+# -------------------- ToDo hooks --------------------
+# Wired in hooks.py doc_events["ToDo"]
+# ----------------------------------------------------
+def on_todo_change(doc, method=None):
+    """Refresh assignees of the referenced task"""
+    if doc.reference_type != "Task" or not doc.reference_name:
+        return
+
+    assigned_to = ",".join(get_task_assignments([doc.reference_name]).get(doc.reference_name, []))
+    if frappe.db.exists(DOCTYPE, doc.reference_name):
+        frappe.db.set_value(DOCTYPE, doc.reference_name, "assigned_to", assigned_to)
+        bump_data_version()
+
+
+# -------------------- Project hooks --------------------
+# Wired in hooks.py doc_events["Project"]
+# -------------------------------------------------------
+def on_project_trash(doc, method=None):
+    """Drop all rows of the deleted project"""
+    frappe.db.delete(DOCTYPE, {"project": doc.name})
+    bump_data_version()
+
+
+def on_project_update(doc, method=None):
+    """Project rows show name and % complete - new data version"""
+    bump_data_version()
+
+
+# -------------------- User hooks --------------------
+# Wired in hooks.py doc_events["User"]
+# ----------------------------------------------------
+def on_user_update(doc, method=None):
+    """Refresh assignee names of open tasks when the user's name changes"""
+    if not doc.has_value_changed("full_name"):
+        return
+
+    task_names = frappe.get_all(
+        "ToDo",
+        filters={"reference_type": "Task", "allocated_to": doc.name, "status": "Open"},
+        pluck="reference_name"
+    )
+    task_assignments = get_task_assignments(task_names)
+    for task_name in set(task_names):
+        if frappe.db.exists(DOCTYPE, task_name):
+            frappe.db.set_value(DOCTYPE, task_name, "assigned_to", ",".join(task_assignments.get(task_name, [])))
+    bump_data_version()
+
+
+# -------------------- Data version --------------------
+# Random token replaced after every committed change of the report data
+# (Redis only: comparing versions costs no database query)
+# ------------------------------------------------------
+def get_data_version():
+    """Current data version token"""
+    return frappe.cache.get_value(DATA_VERSION_KEY, generator=new_data_version)
+
+
+def bump_data_version():
+    """Replace the data version once the current transaction commits"""
+    # One callback per transaction; a rollback discards it
+    if frappe.flags.get(DATA_VERSION_FLAG):
+        return
+    frappe.flags[DATA_VERSION_FLAG] = True
+    frappe.db.after_commit.add(set_data_version)
+    frappe.db.after_rollback.add(clear_data_version_flag)
+
+
+def set_data_version():
+    clear_data_version_flag()
+    frappe.cache.set_value(DATA_VERSION_KEY, new_data_version())
+
+
+def clear_data_version_flag():
+    frappe.flags.pop(DATA_VERSION_FLAG, None)
+
+
+def new_data_version():
+    return frappe.generate_hash(length=16)
@@ -0,0 +1,171 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+"""
+Project Progress History - Daily progress of open projects
+==========================================================
+Narrow, append-only table with one row per open project and day:
+percent_complete and task counts per status. Feeds the progress trend
+(sparkline) column of the Project Overview report.
+
+Maintenance (wired in hooks.py scheduler_events via riz_erp.tasks):
+- record_progress_history(): one grouped Task query + one bulk insert;
+  a unique (project, date) index makes re-runs on the same day no-ops
+- downsample_history(): rows older than DAILY_RETENTION_DAYS are thinned
+  to the first row of each ISO week, rows older than RETENTION_DAYS are
+  deleted
+- Project on_trash (doc_events): drop the project's rows
+
+Main Functions:
+- record_progress_history(): Append today's rows
+- downsample_history(): Retention / downsampling
+- get_progress_trends(): Trend series for many projects in one range query
+"""
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import add_days, getdate, now, today
+
+DOCTYPE = "Project Progress History"
+
+# Task status -> count field
+STATUS_FIELDS = {
+    "Open": "open_tasks",
+    "Working": "working_tasks",
+    "Pending Review": "pending_review_tasks",
+    "Overdue": "overdue_tasks",
+    "Completed": "completed_tasks",
+    "Cancelled": "cancelled_tasks",
+}
+
+# Daily rows are kept this long, then downsampled to weekly
+DAILY_RETENTION_DAYS = 120
+# Weekly rows are kept this long
+RETENTION_DAYS = 730
+
+DELETE_BATCH_SIZE = 1000
+
+
+class ProjectProgressHistory(Document):
+    pass
+
+
+# -------------------- on_doctype_update --------------------
+# One row per project and day; also backs the trend range query
+# ------------------------------------------------------------
+def on_doctype_update():
+    frappe.db.add_unique(DOCTYPE, ["project", "date"], constraint_name="unique_project_date")
+
+
+# -------------------- record_progress_history --------------------
+# Appends one row per open project for the given date (default today)
+# Returns: number of rows written
+# ------------------------------------------------------------------
+def record_progress_history(date=None):
+    """Record today's percent complete and status counts of open projects"""
+    date = getdate(date or today())
+    projects = frappe.get_all("Project", filters={"status": "Open"}, fields=["name", "percent_complete"])
+    if not projects:
+        return 0
+
+    counts = {}
+    for project, status, count in frappe.db.sql(
+        """
+        select project, status, count(*)
+        from `tabTask`
+        where project in %(projects)s
+        group by project, status
+        """,
+        {"projects": [p.name for p in projects]}
+    ):
+        counts.setdefault(project, {})[status] = count
+
+    timestamp = now()
+    user = frappe.session.user
+    count_fields = list(STATUS_FIELDS.values())
+    fields = ["name", "project", "date", "percent_complete", "total_tasks", *count_fields,
+              "creation", "modified", "owner", "modified_by"]
+    values = []
+    for p in projects:
+        status_counts = counts.get(p.name, {})
+        values.append([
+            frappe.generate_hash(length=10), p.name, date, p.percent_complete or 0,
+            sum(status_counts.values()),
+            *[status_counts.get(status, 0) for status in STATUS_FIELDS],
+            timestamp, timestamp, user, user
+        ])
+
+    # Unique (project, date): a second run on the same day inserts nothing
+    frappe.db.bulk_insert(DOCTYPE, fields, values, ignore_duplicates=True)
+    return len(values)
+
+
+# -------------------- downsample_history --------------------
+# Keeps daily rows for DAILY_RETENTION_DAYS, then the first row of
+# each ISO week until RETENTION_DAYS, then nothing
+# Returns: number of rows deleted
+# -------------------------------------------------------------
+def downsample_history():
+    """Apply retention and weekly downsampling"""
+    daily_cutoff = add_days(today(), -DAILY_RETENTION_DAYS)
+    retention_cutoff = add_days(today(), -RETENTION_DAYS)
+
+    expired = frappe.db.count(DOCTYPE, {"date": ["<", retention_cutoff]})
+    if expired:
+        frappe.db.delete(DOCTYPE, {"date": ["<", retention_cutoff]})
+
+    rows = frappe.get_all(
+        DOCTYPE,
+        filters={"date": ["<", daily_cutoff]},
+        fields=["name", "project", "date"],
+        order_by="project asc, date asc"
+    )
+    kept_weeks = set()
+    to_delete = []
+    for row in rows:
+        week = (row.project, *getdate(row.date).isocalendar()[:2])
+        if week in kept_weeks:
+            to_delete.append(row.name)
+        else:
+            kept_weeks.add(week)
+
+    for i in range(0, len(to_delete), DELETE_BATCH_SIZE):
+        frappe.db.delete(DOCTYPE, {"name": ["in", to_delete[i:i + DELETE_BATCH_SIZE]]})
+    return expired + len(to_delete)
+
+
+# -------------------- Project hooks --------------------
+# Wired in hooks.py doc_events["Project"]
+# --------------------------------------------------------
+def on_project_trash(doc, method=None):
+    """Drop the history of the deleted project"""
+    frappe.db.delete(DOCTYPE, {"project": doc.name})
+
+
+# -------------------- get_progress_trends --------------------
+# History of all given projects for the last `days` days (one query)
+# Returns: {project: {"progress_trend": "p1,p2,..", "open_trend": "o1,o2,.."}}
+#   values are oldest first; open = tasks not completed/cancelled
+# --------------------------------------------------------------
+def get_progress_trends(project_names, days=90):
+    """Percent complete and open task series per project"""
+    if not project_names:
+        return {}
+
+    rows = frappe.get_all(
+        DOCTYPE,
+        filters={"project": ["in", project_names], "date": [">=", add_days(today(), -days)]},
+        fields=["project", "percent_complete", "total_tasks", "completed_tasks", "cancelled_tasks"],
+        order_by="project asc, date asc"
+    )
+
+    series = {}
+    for row in rows:
+        progress, open_counts = series.setdefault(row.project, ([], []))
+        progress.append(str(round(row.percent_complete or 0)))
+        open_counts.append(str((row.total_tasks or 0) - (row.completed_tasks or 0) - (row.cancelled_tasks or 0)))
+
+    return {
+        project: {"progress_trend": ",".join(progress), "open_trend": ",".join(open_counts)}
+        for project, (progress, open_counts) in series.items()
+    }
@@ -0,0 +1,62 @@
+/**
+ * Assignee Workload Report - Client-side logic
+ * ============================================
+ * One row per user with open task counts by status, priority and due week
+ *
+ * Features:
+ * - Filters shared with Project Overview (project, assigned_to)
+ * - Configurable number of weekly due-date buckets
+ * - Late counts highlighted, zero counts dimmed
+ * - Click a user's open task count to open Project Overview for that user
+ */
+
+frappe.query_reports["Assignee Workload"] = {
+    // -------------------- Filters --------------------
+    filters: [
+        {
+            fieldname: 'project',
+            label: __('Project'),
+            fieldtype: 'Link',
+            width: '80',
+            options: 'Project'
+        },
+        {
+            fieldname: 'assigned_to',
+            label: __('Assigned To'),
+            fieldtype: 'MultiSelectList',
+            width: '80',
+            options: 'User',
+            get_data: function(txt) {
+                return frappe.db.get_link_options('User', txt);
+            }
+        },
+        {
+            fieldname: 'weeks',
+            label: __('Weeks'),
+            fieldtype: 'Int',
+            width: '80',
+            default: 6
+        }
+    ],
+
+    // -------------------- formatter --------------------
+    // Links open task counts to Project Overview filtered by user
+    // Highlights late tasks, dims zero counts
+    // ---------------------------------------------------
+    formatter: function (value, row, column, data, default_formatter) {
+        value = default_formatter(value, row, column, data);
+
+        if (!data || !data.user) return value;
+
+        if (column.fieldname === "total_tasks" && data.total_tasks > 0) {
+            const route = `/app/query-report/Project Overview?assigned_to=${encodeURIComponent(data.user)}`;
+            value = `<a href="${route}">${data.total_tasks}</a>`;
+        } else if (column.fieldname === "late_tasks" && data.late_tasks > 0) {
+            value = `<span class="indicator-pill red">${data.late_tasks}</span>`;
+        } else if (column.fieldtype === "Int" && !data[column.fieldname]) {
+            value = `<span style="color:#9ca3af">0</span>`;
+        }
+
+        return value;
+    }
+};
@@ -0,0 +1,151 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+"""
+Assignee Workload Report - Server-side logic
+============================================
+Companion to Project Overview for balancing work across people.
+One row per user with their open task load, computed in SQL.
+
+Features:
+- Open task counts by status and by priority
+- Late tasks (exp_end_date before today)
+- Per-week buckets of exp_end_date starting with the current week
+- Single grouped query over open ToDo joined with Task, so it stays fast
+  across thousands of tasks and users
+
+Filters (defined in .js):
+- project: Only count tasks of this project
+- assigned_to: Only show these users
+- weeks: Number of weekly exp_end_date buckets (default: 6)
+
+Main Functions:
+- execute(): Report data generation
+- get_workload(): Grouped workload query
+- get_week_starts(): Monday of each bucketed week
+"""
+
+import frappe
+from frappe.utils import add_days, cint, formatdate, getdate, today
+
+from riz_erp.riz_erp.report.project_overview.project_overview import parse_multi_select
+from riz_erp.riz_erp.report.project_overview.replica import fresh_reads
+
+STATUSES = ["Open", "Working", "Pending Review", "Overdue"]
+PRIORITIES = ["Low", "Medium", "High", "Urgent"]
+
+DEFAULT_WEEKS = 6
+MAX_WEEKS = 26
+
+
+# -------------------- execute --------------------
+# Main report execution function
+# Returns columns and one row per assigned user
+# ------------------------------------------------
+@fresh_reads
+def execute(filters=None):
+    if not filters:
+        filters = {}
+
+    weeks = min(max(cint(filters.get("weeks")) or DEFAULT_WEEKS, 1), MAX_WEEKS)
+    week_starts = get_week_starts(weeks)
+    data = get_workload(filters, week_starts)
+
+    columns = [
+        {"label": "User", "fieldname": "user", "fieldtype": "Link", "options": "User", "width": 200},
+        {"label": "Full Name", "fieldname": "full_name", "fieldtype": "Data", "width": 150},
+        {"label": "Open Tasks", "fieldname": "total_tasks", "fieldtype": "Int", "width": 90},
+    ]
+    columns.extend(
+        {"label": status, "fieldname": frappe.scrub(status), "fieldtype": "Int", "width": 80}
+        for status in STATUSES
+    )
+    columns.extend(
+        {"label": priority, "fieldname": f"priority_{frappe.scrub(priority)}", "fieldtype": "Int", "width": 70}
+        for priority in PRIORITIES
+    )
+    columns.extend([
+        {"label": "Late", "fieldname": "late_tasks", "fieldtype": "Int", "width": 65},
+        {"label": "No Date", "fieldname": "no_date", "fieldtype": "Int", "width": 75},
+    ])
+    columns.extend(
+        {"label": f"Wk {formatdate(week_start, 'dd-MM')}", "fieldname": f"week_{i}", "fieldtype": "Int", "width": 80}
+        for i, week_start in enumerate(week_starts[:-1])
+    )
+    columns.append({"label": "Later", "fieldname": "later", "fieldtype": "Int", "width": 65})
+
+    return columns, data
+
+
+# -------------------- get_week_starts --------------------
+# Monday of the current week and the following `weeks` Mondays
+# The last entry is the exclusive end of the final bucket
+# ----------------------------------------------------------
+def get_week_starts(weeks):
+    """Return weeks + 1 bucket boundaries starting this Monday"""
+    current = getdate(today())
+    monday = add_days(current, -current.weekday())
+    return [getdate(add_days(monday, 7 * i)) for i in range(weeks + 1)]
+
+
+# -------------------- get_workload --------------------
+# One grouped query over open ToDo assignments joined with Task
+# Conditional counts give status, priority, late and week buckets
+# Completed/Cancelled tasks are excluded (their ToDos may stay open)
+# ------------------------------------------------------
+def get_workload(filters, week_starts):
+    """Aggregate open task load per assigned user"""
+    values = {"today": today()}
+    conditions = []
+
+    if filters.get("project"):
+        conditions.append("t.project = %(project)s")
+        values["project"] = filters.get("project")
+
+    users = parse_multi_select(filters.get("assigned_to"))
+    if users:
+        conditions.append("td.allocated_to in %(users)s")
+        values["users"] = users
+
+    select = [
+        "count(distinct t.name) as total_tasks",
+        "count(distinct case when t.exp_end_date < %(today)s then t.name end) as late_tasks",
+        "count(distinct case when t.exp_end_date is null then t.name end) as no_date",
+    ]
+    for i, status in enumerate(STATUSES):
+        values[f"status_{i}"] = status
+        select.append(f"count(distinct case when t.status = %(status_{i})s then t.name end) as {frappe.scrub(status)}")
+    for i, priority in enumerate(PRIORITIES):
+        values[f"priority_{i}"] = priority
+        select.append(
+            f"count(distinct case when t.priority = %(priority_{i})s then t.name end) as priority_{frappe.scrub(priority)}"
+        )
+    for i in range(len(week_starts) - 1):
+        values[f"week_start_{i}"] = week_starts[i]
+        values[f"week_end_{i}"] = week_starts[i + 1]
+        select.append(
+            f"count(distinct case when t.exp_end_date >= %(week_start_{i})s"
+            f" and t.exp_end_date < %(week_end_{i})s then t.name end) as week_{i}"
+        )
+    values["horizon"] = week_starts[-1]
+    select.append("count(distinct case when t.exp_end_date >= %(horizon)s then t.name end) as later")
+
+    where = " and ".join(["td.reference_type = 'Task'", "td.status = 'Open'",
+                          "t.status not in ('Completed', 'Cancelled')", *conditions])
+
+    return frappe.db.sql(
+        f"""
+        select
+            td.allocated_to as user,
+            max(u.full_name) as full_name,
+            {", ".join(select)}
+        from `tabToDo` td
+        inner join `tabTask` t on t.name = td.reference_name
+        left join `tabUser` u on u.name = td.allocated_to
+        where {where}
+        group by td.allocated_to
+        order by total_tasks desc, td.allocated_to asc
+        """,
+        values,
+        as_dict=True
+    )
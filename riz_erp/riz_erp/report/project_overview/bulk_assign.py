@@ -0,0 +1,208 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+"""
+Project Overview Report - Set-based assignments (bulk audit mode)
+=================================================================
+frappe.desk.form.assign_to.add/remove write one ToDo, one "Assigned"
+comment and one notification per task. In bulk audit mode
+(see Bulk Operation Log) assign_tasks/unassign_tasks use these helpers
+instead: ToDo rows are inserted/cancelled with one statement, Task._assign
+and the snapshot's assigned_to are rewritten with one CASE UPDATE per 500
+tasks, the assignee gets one notification (linked to the log), and the
+operation is recorded in a single Bulk Operation Log.
+
+bulk_create.py uses insert_todos() for the assignments of new tasks.
+
+Main Functions:
+- insert_todos(): Bulk insert open ToDos, skipping existing assignments
+- insert_assignments(): Assign one user to many tasks
+- cancel_assignments(): Remove (task, user) assignments
+- refresh_assignment_fields(): Task._assign + snapshot assigned_to
+"""
+
+import json
+
+import frappe
+from frappe.utils import now
+
+from riz_erp.riz_erp.doctype.bulk_operation_log.bulk_operation_log import record_bulk_operation
+from riz_erp.riz_erp.doctype.project_overview_snapshot.project_overview_snapshot import (
+    DOCTYPE as SNAPSHOT_DOCTYPE,
+    bump_data_version,
+    get_task_assignments,
+)
+from riz_erp.riz_erp.report.project_overview.replica import mark_user_write
+
+ASSIGNMENT_DESCRIPTION = "Assigned from Project Overview"
+
+UPDATE_BATCH_SIZE = 500
+
+
+# -------------------- insert_todos --------------------
+# Bulk inserts Open ToDos, one per (task, user), skipping users that
+# already have an open ToDo on the task (one query), then refreshes
+# Task._assign and the snapshot once
+# rows: [{"task", "user", "date" (optional), "description" (optional)}]
+# Returns: list of (task, user) pairs inserted
+# -------------------------------------------------------
+def insert_todos(rows):
+    """Create open ToDo assignments in one insert"""
+    task_ids = sorted({row["task"] for row in rows})
+    if not task_ids:
+        return []
+
+    assigned = set(frappe.db.sql(
+        """
+        select reference_name, allocated_to
+        from `tabToDo`
+        where reference_type = 'Task' and status = 'Open' and reference_name in %s
+        """,
+        (tuple(task_ids),)
+    ))
+
+    timestamp = now()
+    session_user = frappe.session.user
+    values = []
+    inserted = []
+    for row in rows:
+        pair = (row["task"], row["user"])
+        if pair in assigned:
+            continue
+        assigned.add(pair)
+        inserted.append(pair)
+        values.append([
+            frappe.generate_hash(length=10), "Open", "Medium", row.get("date"), row["user"],
+            row.get("description") or ASSIGNMENT_DESCRIPTION, "Task", row["task"],
+            session_user, timestamp, timestamp, session_user, session_user
+        ])
+
+    if values:
+        frappe.db.bulk_insert(
+            "ToDo",
+            ["name", "status", "priority", "date", "allocated_to", "description", "reference_type",
+             "reference_name", "assigned_by", "creation", "modified", "owner", "modified_by"],
+            values
+        )
+        refresh_assignment_fields(sorted({task for task, _user in inserted}))
+    return inserted
+
+
+# -------------------- insert_assignments --------------------
+# Assigns `user` to the tasks (insert_todos), records one Bulk Operation
+# Log and sends the user one notification linked to it
+# Returns: number of tasks assigned
+# -------------------------------------------------------------
+def insert_assignments(task_ids, user):
+    """Assign a user to many tasks without per-task comments"""
+    if not task_ids:
+        return 0
+    if not frappe.db.get_value("User", user, "enabled"):
+        frappe.throw(f"User {user} does not exist or is disabled")
+
+    inserted = [task for task, _user in insert_todos([{"task": task, "user": user} for task in task_ids])]
+    if not inserted:
+        return 0
+
+    tasks = dict(frappe.get_all(
+        "Task", filters={"name": ["in", inserted]}, fields=["name", "project"], as_list=True
+    ))
+    log = record_bulk_operation(
+        "Assign", {task: (tasks.get(task), {"assigned_to": [None, user]}) for task in inserted},
+        summary=f"Assigned {user} to {len(inserted)} task(s)"
+    )
+
+    if user != frappe.session.user:
+        frappe.get_doc({
+            "doctype": "Notification Log",
+            "for_user": user,
+            "from_user": frappe.session.user,
+            "type": "Assignment",
+            "subject": f"{len(inserted)} task(s) assigned to you",
+            "document_type": "Bulk Operation Log",
+            "document_name": log,
+        }).insert(ignore_permissions=True)
+    return len(inserted)
+
+
+# -------------------- cancel_assignments --------------------
+# Cancels the Open ToDos of the given (task, user) pairs in one UPDATE
+# (same as assign_to.remove, which cancels instead of deleting)
+# Returns: number of assignments removed
+# -------------------------------------------------------------
+def cancel_assignments(pairs):
+    """Remove assignments without per-task comments"""
+    if not pairs:
+        return 0
+
+    frappe.db.sql(
+        f"""
+        update `tabToDo`
+        set status = 'Cancelled', modified = %s, modified_by = %s
+        where reference_type = 'Task' and status = 'Open'
+            and (reference_name, allocated_to) in ({", ".join(["(%s, %s)"] * len(pairs))})
+        """,
+        (now(), frappe.session.user, *[v for pair in pairs for v in pair])
+    )
+
+    task_ids = sorted({task for task, _user in pairs})
+    refresh_assignment_fields(task_ids)
+
+    removed = {}
+    for task, user in pairs:
+        removed.setdefault(task, []).append(user)
+    tasks = dict(frappe.get_all(
+        "Task", filters={"name": ["in", task_ids]}, fields=["name", "project"], as_list=True
+    ))
+    record_bulk_operation(
+        "Unassign",
+        {
+            task: (tasks.get(task), {"assigned_to": [", ".join(users), None]})
+            for task, users in removed.items()
+        },
+        summary=f"Removed {len(pairs)} assignment(s) from {len(task_ids)} task(s)"
+    )
+    return len(pairs)
+
+
+# -------------------- refresh_assignment_fields --------------------
+# Rewrites Task._assign and snapshot assigned_to from open ToDos
+# (what ToDo.update_in_reference and the snapshot ToDo hook do per row)
+# --------------------------------------------------------------------
+def refresh_assignment_fields(task_ids):
+    open_users = {task: [] for task in task_ids}
+    for task, user in frappe.db.sql(
+        """
+        select reference_name, allocated_to
+        from `tabToDo`
+        where reference_type = 'Task' and status = 'Open' and reference_name in %s
+        order by creation asc
+        """,
+        (tuple(task_ids),)
+    ):
+        if user not in open_users[task]:
+            open_users[task].append(user)
+
+    assignments = get_task_assignments(task_ids)
+    timestamp = now()
+    for i in range(0, len(task_ids), UPDATE_BATCH_SIZE):
+        batch = task_ids[i:i + UPDATE_BATCH_SIZE]
+        case = " ".join(["when %s then %s"] * len(batch))
+        frappe.db.sql(
+            f"update `tabTask` set _assign = case name {case} end where name in %s",
+            (*[v for task in batch for v in (task, json.dumps(open_users[task]))], tuple(batch))
+        )
+        # `modified` is the report's version token, as on every snapshot write
+        frappe.db.sql(
+            f"""
+            update `tab{SNAPSHOT_DOCTYPE}`
+            set assigned_to = case name {case} end, modified = %s
+            where name in %s
+            """,
+            (
+                *[v for task in batch for v in (task, ",".join(assignments.get(task, [])))],
+                timestamp, tuple(batch)
+            )
+        )
+    bump_data_version()
+    mark_user_write()
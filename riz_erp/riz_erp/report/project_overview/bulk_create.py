@@ -0,0 +1,410 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+"""
+Project Overview Report - Bulk hierarchical task creation
+=========================================================
+Creates a whole task hierarchy from a pasted outline or CSV in one request
+(one transaction: all tasks are created or none).
+
+Input formats:
+- outline: One task per line, nesting by indentation (spaces or tabs),
+  optional bullets (-, *, •). Extra fields separated by "|":
+      Design | alice@example.com | 2026-01-05 | 2026-01-09
+          Wireframes | bob@example.com
+- csv: Columns subject, assigned_to, exp_start_date, exp_end_date[, level].
+  A header row is optional; nesting comes from `level` (0 = top) or from
+  leading spaces in the subject.
+  Several assignees can be given separated by ";".
+
+Why it is fast:
+- Nested-set values (lft/rgt) are computed for the whole block up front,
+  the tree is shifted at most once, so Task inserts skip update_nsm work
+- Parent links are written with one UPDATE after insert (the per-insert
+  parent save done by Task.populate_depends_on is replaced by one bulk
+  insert of the parents' Task Depends On rows)
+- Project progress is recalculated once, not per task
+- ToDo assignments are bulk inserted, one notification per assignee
+- The snapshot is rebuilt once for the project
+
+Main Functions:
+- bulk_create_tasks(): Whitelisted entry point
+- parse_outline() / parse_csv(): Input parsing into task entries
+- assign_levels(): Resolves nesting into parent indexes
+- set_nested_set_values(): lft/rgt of the new block
+"""
+
+import csv
+import io
+import re
+
+import frappe
+from frappe.utils import cstr, getdate, now
+
+from riz_erp.riz_erp.doctype.project_overview_snapshot.project_overview_snapshot import rebuild_snapshot
+from riz_erp.riz_erp.report.project_overview.bulk_assign import insert_todos
+from riz_erp.riz_erp.report.project_overview.replica import mark_user_write
+
+MAX_BULK_TASKS = 1000
+
+BULLET_PATTERN = re.compile(r"^([-*•]|\d+[.)])\s+")
+
+
+# -------------------- bulk_create_tasks --------------------
+# Creates a task hierarchy in one transaction
+# Requires: Task create permission
+# Returns: Dict with created task names or parse/validation errors
+# ------------------------------------------------------------
+@frappe.whitelist()
+def bulk_create_tasks(project, text, input_format="outline", parent_task=None, status="Open"):
+    """Create many tasks (with hierarchy and assignments) at once
+
+    Args:
+        project (str): Project name
+        text (str): Pasted outline or CSV
+        input_format (str): "outline" or "csv"
+        parent_task (str): Optional existing task to nest the new tasks under
+        status (str): Status of the new tasks
+
+    Returns:
+        dict: {"success": bool, "created": int, "assigned": int, "task_names": list, "errors": list}
+    """
+    project = cstr(project).strip()
+    parent_task = cstr(parent_task).strip() or None
+    status = cstr(status).strip() or "Open"
+
+    if not project:
+        frappe.throw("Project is required")
+    if not frappe.has_permission("Task", "create"):
+        frappe.throw("You do not have permission to create tasks")
+
+    if input_format == "csv":
+        entries, errors = parse_csv(cstr(text))
+    else:
+        entries, errors = parse_outline(cstr(text))
+
+    if not errors:
+        errors = assign_levels(entries)
+    if not entries and not errors:
+        errors = ["Nothing to create"]
+    if len(entries) > MAX_BULK_TASKS:
+        errors.append(f"At most {MAX_BULK_TASKS} tasks can be created at once")
+    if not errors:
+        errors = validate_entries(entries, project, parent_task)
+
+    if errors:
+        return {"success": False, "created": 0, "assigned": 0, "task_names": [], "errors": errors}
+
+    try:
+        task_names = insert_task_tree(entries, project, parent_task, status)
+        assigned = insert_assignments(entries, project)
+
+        # Once per request instead of once per inserted task
+        frappe.get_doc("Project", project).update_project()
+        rebuild_snapshot(project)
+        mark_user_write()
+    except Exception as e:
+        frappe.db.rollback()
+        frappe.log_error(f"Bulk task creation failed: {str(e)}", "Bulk Task Creation Error")
+        return {"success": False, "created": 0, "assigned": 0, "task_names": [], "errors": [str(e)]}
+
+    return {
+        "success": True,
+        "created": len(task_names),
+        "assigned": assigned,
+        "task_names": task_names,
+        "errors": []
+    }
+
+
+# -------------------- parse_outline --------------------
+# One entry per non-empty line: indentation width + "|" fields
+# Returns: (entries, errors)
+# --------------------------------------------------------
+def parse_outline(text):
+    """Parse an indented outline into task entries"""
+    entries = []
+    errors = []
+    for line_no, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        expanded = line.expandtabs(4)
+        width = len(expanded) - len(expanded.lstrip())
+        fields = [f.strip() for f in expanded.strip().split("|")]
+        fields[0] = BULLET_PATTERN.sub("", fields[0])
+        entry, error = make_entry(line_no, fields, width=width)
+        if error:
+            errors.append(error)
+        else:
+            entries.append(entry)
+    return entries, errors
+
+
+# -------------------- parse_csv --------------------
+# Columns by header name when a header row is present, else positional
+# Returns: (entries, errors)
+# ----------------------------------------------------
+def parse_csv(text):
+    """Parse CSV rows into task entries"""
+    rows = [row for row in csv.reader(io.StringIO(text)) if any(cell.strip() for cell in row)]
+    if not rows:
+        return [], []
+
+    columns = ["subject", "assigned_to", "exp_start_date", "exp_end_date", "level"]
+    aliases = {"task": "subject", "assignee": "assigned_to", "start": "exp_start_date", "end": "exp_end_date"}
+    header = [aliases.get(frappe.scrub(cell.strip()), frappe.scrub(cell.strip())) for cell in rows[0]]
+    start_line = 1
+    if "subject" in header:
+        columns = header
+        rows = rows[1:]
+        start_line = 2
+
+    entries = []
+    errors = []
+    for line_no, row in enumerate(rows, start=start_line):
+        values = dict(zip(columns, row))
+        subject = values.get("subject") or ""
+        fields = [subject.strip(), values.get("assigned_to", ""), values.get("exp_start_date", ""),
+                  values.get("exp_end_date", "")]
+        level = cstr(values.get("level")).strip()
+        if level and not level.isdigit():
+            errors.append(f"Line {line_no}: level must be a number")
+            continue
+        entry, error = make_entry(
+            line_no, [f.strip() for f in fields],
+            level=int(level) if level else None,
+            width=len(subject) - len(subject.lstrip())
+        )
+        if error:
+            errors.append(error)
+        else:
+            entries.append(entry)
+    return entries, errors
+
+
+# -------------------- make_entry --------------------
+# Builds one task entry from [subject, assignees, start, end] fields
+# Returns: (entry, error)
+# -----------------------------------------------------
+def make_entry(line_no, fields, width=0, level=None):
+    fields = fields + [""] * (4 - len(fields))
+    subject, assignees, start, end = fields[:4]
+    if not subject:
+        return None, f"Line {line_no}: subject is required"
+    if len(subject) > 140:
+        return None, f"Line {line_no}: subject is longer than 140 characters"
+
+    try:
+        exp_start_date = getdate(start) if start else None
+        exp_end_date = getdate(end) if end else None
+    except Exception:
+        return None, f"Line {line_no}: invalid date"
+    if exp_start_date and exp_end_date and exp_end_date < exp_start_date:
+        return None, f"Line {line_no}: end date is before start date"
+
+    return frappe._dict({
+        "line": line_no,
+        "subject": subject,
+        "assignees": [u.strip() for u in re.split(r"[;,]", assignees) if u.strip()],
+        "exp_start_date": exp_start_date,
+        "exp_end_date": exp_end_date,
+        "width": width,
+        "level": level,
+        "parent_index": None,
+        "is_group": 0,
+    }), None
+
+
+# -------------------- assign_levels --------------------
+# Resolves indentation widths (or explicit levels) into parent indexes
+# A line may go at most one level deeper than the line above it
+# Returns: list of errors
+# --------------------------------------------------------
+def assign_levels(entries):
+    """Set level and parent_index on every entry"""
+    errors = []
+    stack = []  # [(indent width or level, entry index)]
+    for i, entry in enumerate(entries):
+        key = entry.level if entry.level is not None else entry.width
+        while stack and stack[-1][0] >= key:
+            stack.pop()
+        if entry.level is not None and entry.level > len(stack):
+            errors.append(f"Line {entry.line}: level {entry.level} skips a level")
+            continue
+        entry.level = len(stack)
+        if stack:
+            entry.parent_index = stack[-1][1]
+            entries[stack[-1][1]].is_group = 1
+        stack.append((key, i))
+    return errors
+
+
+# -------------------- validate_entries --------------------
+# Checks project, parent task and assignees with one query each
+# Returns: list of errors
+# -----------------------------------------------------------
+def validate_entries(entries, project, parent_task):
+    errors = []
+    if not frappe.db.exists("Project", project):
+        errors.append(f"Project {project} not found")
+    if parent_task and frappe.db.get_value("Task", parent_task, "project") != project:
+        errors.append(f"Parent task {parent_task} does not belong to project {project}")
+
+    assignees = {u for entry in entries for u in entry.assignees}
+    if assignees:
+        enabled = set(frappe.get_all("User", filters={"name": ["in", list(assignees)], "enabled": 1}, pluck="name"))
+        errors.extend(
+            f"Line {entry.line}: user {user} not found or disabled"
+            for entry in entries for user in entry.assignees if user not in enabled
+        )
+    return errors
+
+
+# -------------------- insert_task_tree --------------------
+# Inserts all tasks with precomputed lft/rgt, then links parents
+# Returns: list of new task names in input order
+# -----------------------------------------------------------
+def insert_task_tree(entries, project, parent_task, status):
+    """Insert the hierarchy with one nested-set shift and one parent UPDATE"""
+    width = 2 * len(entries)
+
+    # Reserve lft/rgt space: inside parent_task, or after every existing task
+    if parent_task:
+        parent_rgt = frappe.db.sql("select rgt from `tabTask` where name = %s for update", parent_task)[0][0]
+        frappe.db.sql("update `tabTask` set rgt = rgt + %s where rgt >= %s", (width, parent_rgt))
+        frappe.db.sql("update `tabTask` set lft = lft + %s where lft > %s", (width, parent_rgt))
+        base = parent_rgt - 1
+        if not frappe.db.get_value("Task", parent_task, "is_group"):
+            frappe.db.set_value("Task", parent_task, "is_group", 1, update_modified=False)
+    else:
+        base = frappe.db.sql("select ifnull(max(rgt), 0) from `tabTask` for update")[0][0]
+
+    set_nested_set_values(entries, base)
+
+    # lft/rgt already set and no parent yet: update_nsm has nothing to move
+    for entry in entries:
+        task = frappe.get_doc({
+            "doctype": "Task",
+            "subject": entry.subject,
+            "project": project,
+            "status": status,
+            "exp_start_date": entry.exp_start_date,
+            "exp_end_date": entry.exp_end_date,
+            "is_group": entry.is_group,
+            "lft": entry.lft,
+            "rgt": entry.rgt,
+        })
+        task.flags.from_project = True  # skip per-task Project.update_project
+        task.flags.ignore_project_overview_snapshot = True
+        task.insert()
+        entry.name = task.name
+
+    link_parents(entries, project, parent_task)
+    return [entry.name for entry in entries]
+
+
+# -------------------- set_nested_set_values --------------------
+# Preorder lft/rgt numbering after `base` (entries are already in
+# depth-first order with levels set by assign_levels)
+# ----------------------------------------------------------------
+def set_nested_set_values(entries, base):
+    counter = base
+    open_nodes = []
+    for i, entry in enumerate(entries):
+        while open_nodes and entries[open_nodes[-1]].level >= entry.level:
+            counter += 1
+            entries[open_nodes.pop()].rgt = counter
+        counter += 1
+        entry.lft = counter
+        open_nodes.append(i)
+    while open_nodes:
+        counter += 1
+        entries[open_nodes.pop()].rgt = counter
+
+
+# -------------------- link_parents --------------------
+# Sets parent_task/old_parent of all new tasks with one UPDATE and adds
+# each child to its parent's depends_on table (what Task.populate_depends_on
+# would do with one parent save per child)
+# -------------------------------------------------------
+def link_parents(entries, project, parent_task):
+    children = {}
+    for entry in entries:
+        parent = entries[entry.parent_index].name if entry.parent_index is not None else parent_task
+        if parent:
+            children.setdefault(parent, []).append(entry)
+    if not children:
+        return
+
+    links = [(entry.name, parent) for parent, kids in children.items() for entry in kids]
+    case = " ".join(["when %s then %s"] * len(links))
+    case_values = [v for link in links for v in link]
+    frappe.db.sql(
+        f"""
+        update `tabTask`
+        set parent_task = case name {case} end, old_parent = case name {case} end
+        where name in %s
+        """,
+        (*case_values, *case_values, tuple(name for name, _parent in links))
+    )
+
+    # Existing parent keeps its current depends_on rows
+    start_idx = {}
+    depends_on_tasks = {}
+    if parent_task in children:
+        start_idx[parent_task] = frappe.db.sql(
+            "select ifnull(max(idx), 0) from `tabTask Depends On` where parent = %s and parenttype = 'Task'",
+            parent_task
+        )[0][0]
+        depends_on_tasks[parent_task] = frappe.db.get_value("Task", parent_task, "depends_on_tasks") or ""
+
+    timestamp = now()
+    user = frappe.session.user
+    fields = ["name", "parent", "parentfield", "parenttype", "idx", "task", "subject", "project",
+              "creation", "modified", "owner", "modified_by"]
+    values = []
+    for parent, kids in children.items():
+        for idx, entry in enumerate(kids, start=start_idx.get(parent, 0) + 1):
+            values.append([frappe.generate_hash(length=10), parent, "depends_on", "Task", idx,
+                           entry.name, entry.subject, project, timestamp, timestamp, user, user])
+        depends_on_tasks[parent] = depends_on_tasks.get(parent, "") + "".join(f"{e.name}," for e in kids)
+    frappe.db.bulk_insert("Task Depends On", fields, values)
+
+    # Denormalized list Task.update_depends_on keeps in sync on save
+    case = " ".join(["when %s then %s"] * len(depends_on_tasks))
+    frappe.db.sql(
+        f"update `tabTask` set depends_on_tasks = case name {case} end where name in %s",
+        (*[v for item in depends_on_tasks.items() for v in item], tuple(depends_on_tasks))
+    )
+
+
+# -------------------- insert_assignments --------------------
+# ToDos of the new tasks via bulk_assign.insert_todos (one insert)
+# Sends one summary notification per assignee instead of one per task
+# Returns: number of assignments created
+# -------------------------------------------------------------
+def insert_assignments(entries, project):
+    """Create all ToDo assignments of the new tasks"""
+    inserted = insert_todos([
+        {"task": entry.name, "user": assignee, "date": entry.exp_end_date, "description": entry.subject}
+        for entry in entries
+        for assignee in dict.fromkeys(entry.assignees or [])
+    ])
+
+    per_user = {}
+    for _task, assignee in inserted:
+        per_user[assignee] = per_user.get(assignee, 0) + 1
+
+    for assignee, count in per_user.items():
+        if assignee == frappe.session.user:
+            continue
+        frappe.get_doc({
+            "doctype": "Notification Log",
+            "for_user": assignee,
+            "from_user": frappe.session.user,
+            "type": "Assignment",
+            "subject": f"{count} new task(s) in {project} assigned to you",
+            "document_type": "Project",
+            "document_name": project,
+        }).insert(ignore_permissions=True)
+    return len(inserted)
@@ -0,0 +1,180 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+"""
+Project Overview Report - Concurrency control for bulk writes
+=============================================================
+Two users running bulk updates on overlapping selections used to lock
+Task rows in selection order (and Project rows after every single task
+save), which produced lock waits, deadlocks and TimestampMismatch errors.
+
+Rules used by every bulk write endpoint:
+- Lock order: all Task rows first, sorted by name (SELECT ... FOR UPDATE),
+  then Project rows, sorted by name, all before the first write
+- A Task save also writes other tasks: ERPNext's Task.on_update saves the
+  dependent tasks (reschedule_dependent_tasks, recursively; a parent task
+  depends on its sub-tasks) and the parent task (populate_depends_on). The
+  per-document endpoints therefore lock the selection together with its
+  ancestors and transitive dependents, and the projects of all of them,
+  so no row lock is taken out of order later in the transaction
+- Per-task Project.update_project is deferred (task.flags.from_project)
+  and run once per affected project at the end
+- Optimistic concurrency (optional): the client sends the `modified` value
+  it saw per task; a task changed since then is reported as a conflict and
+  left untouched. Report rows carry the snapshot row's `modified`, which is
+  written in the same transaction as every task change
+- Deadlock victims / lock wait timeouts are rolled back and retried with
+  exponential backoff and jitter
+
+Main Functions:
+- run_with_retry(): Run a bulk write with deadlock retry
+- lock_tasks() / lock_projects(): Ordered row locks
+- lock_for_save(): Ordered locks for tasks saved as documents (with the
+  rows their on_update cascades to)
+- is_conflict(): Compare the seen `modified` with the locked row
+- parse_expected_modified(): Client payload -> {task: datetime}
+"""
+
+import json
+import random
+import time
+
+import frappe
+from frappe.utils import get_datetime
+
+MAX_ATTEMPTS = 4
+BACKOFF_BASE_SECONDS = 0.1
+
+RETRYABLE_ERRORS = (frappe.QueryDeadlockError, frappe.QueryTimeoutError)
+
+
+# -------------------- run_with_retry --------------------
+# Runs fn() and retries it after a rollback when the transaction was
+# chosen as a deadlock victim or timed out waiting for a lock
+# Returns: fn()'s result, or None when all attempts failed
+# ---------------------------------------------------------
+def run_with_retry(fn):
+    """Run a bulk write, retrying deadlock victims with backoff"""
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            return fn()
+        except RETRYABLE_ERRORS as e:
+            frappe.db.rollback()
+            if attempt == MAX_ATTEMPTS - 1:
+                frappe.log_error(f"Bulk update gave up after {MAX_ATTEMPTS} attempts: {str(e)}", "Bulk Update Deadlock")
+                return None
+            time.sleep(BACKOFF_BASE_SECONDS * 2 ** attempt + random.uniform(0, BACKOFF_BASE_SECONDS))
+
+
+# -------------------- lock_tasks --------------------
+# Locks Task rows in name order; returns their current state
+# Returns: {task_name: {"modified", "modified_by", "project"}}
+# -----------------------------------------------------
+def lock_tasks(task_names):
+    """Take row locks on tasks in deterministic (sorted) order"""
+    if not task_names:
+        return {}
+    rows = frappe.db.sql(
+        """
+        select name, modified, modified_by, project
+        from `tabTask`
+        where name in %s
+        order by name asc
+        for update
+        """,
+        (tuple(sorted(task_names)),),
+        as_dict=True
+    )
+    return {row.name: row for row in rows}
+
+
+# -------------------- lock_for_save --------------------
+# Locks for endpoints that save Task documents: the tasks plus every task
+# their on_update can save (get_cascade_tasks), sorted, in one statement,
+# then the projects of all locked tasks, sorted
+# Returns: {task_name: {"modified", "modified_by", "project"}} (all locked rows)
+# --------------------------------------------------------
+def lock_for_save(task_names):
+    """Take row locks on tasks, their cascade targets and projects in a fixed order"""
+    locked = lock_tasks(get_cascade_tasks(task_names))
+    lock_projects(row.project for row in locked.values())
+    return locked
+
+
+# -------------------- get_cascade_tasks --------------------
+# Transitive closure over "saving X may save Y": tasks depending on X
+# (Task Depends On; includes X's parent, which depends on its sub-tasks)
+# and X's parent task. One query per level of the closure
+# ------------------------------------------------------------
+def get_cascade_tasks(task_names):
+    """Tasks plus all tasks their saves can cascade to"""
+    names = set(task_names)
+    frontier = set(names)
+    while frontier:
+        found = set(frappe.db.sql_list(
+            """
+            select d.parent
+            from `tabTask Depends On` d
+            where d.parenttype = 'Task' and d.parentfield = 'depends_on' and d.task in %(tasks)s
+            union
+            select t.parent_task
+            from `tabTask` t
+            where t.name in %(tasks)s and ifnull(t.parent_task, '') != ''
+            """,
+            {"tasks": tuple(frontier)}
+        ))
+        frontier = found - names
+        names.update(frontier)
+    return names
+
+
+# -------------------- lock_projects --------------------
+# Locks Project rows in name order (always after the task rows)
+# --------------------------------------------------------
+def lock_projects(project_names):
+    """Take row locks on projects in deterministic (sorted) order"""
+    project_names = sorted({p for p in project_names if p})
+    if project_names:
+        frappe.db.sql(
+            "select name from `tabProject` where name in %s order by name asc for update",
+            (tuple(project_names),)
+        )
+    return project_names
+
+
+# -------------------- update_projects --------------------
+# Deferred Project.update_project, once per project, projects locked last
+# (already held when the caller used lock_for_save)
+# ----------------------------------------------------------
+def update_projects(project_names):
+    for project in lock_projects(project_names):
+        frappe.get_doc("Project", project).update_project()
+
+
+# -------------------- parse_expected_modified --------------------
+# {task: "YYYY-MM-DD HH:MM:SS.ffffff"} from the client (JSON string)
+# -----------------------------------------------------------------
+def parse_expected_modified(expected_modified):
+    if not expected_modified:
+        return {}
+    if isinstance(expected_modified, str):
+        expected_modified = json.loads(expected_modified)
+    return {task: get_datetime(value) for task, value in expected_modified.items() if value}
+
+
+# -------------------- is_conflict --------------------
+# True when the locked task changed after the client's version
+# ------------------------------------------------------
+def is_conflict(locked_row, expected):
+    return bool(expected and locked_row and get_datetime(locked_row.modified) > expected)
+
+
+def make_conflict(task_id, locked_row):
+    """Structured per-task conflict entry"""
+    return {
+        "task": task_id,
+        "status": "conflict",
+        "message": f"Changed by {locked_row.modified_by} at {locked_row.modified} after you loaded it",
+        "modified": str(locked_row.modified),
+        "modified_by": locked_row.modified_by,
+    }
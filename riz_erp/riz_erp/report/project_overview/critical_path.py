@@ -0,0 +1,165 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+"""
+Project Overview Report - Critical path analysis
+================================================
+Computes earliest/latest finish and slack for every task of the visible
+projects from the Task `depends_on` table, so the report can show which
+tasks actually push the project end date.
+
+How it works:
+- One query loads all tasks of the visible projects with their dependency
+  edges (Task left join Task Depends On)
+- Durations come from exp_start_date/exp_end_date (inclusive days)
+- Forward pass in topological order (Kahn's algorithm) gives earliest
+  start/finish, respecting each task's planned start
+- Backward pass from the project finish gives latest start/finish
+- Slack = latest finish - earliest finish; slack 0 = critical
+- Both passes are linear in tasks + edges
+- Tasks caught in a dependency cycle are reported and left unscheduled
+
+Edges to tasks of other (or invisible) projects and Cancelled tasks are ignored.
+
+Main Functions:
+- get_critical_path(): Load graph for projects and compute the schedule
+- compute_schedule(): Pure CPM computation on nodes and edges
+"""
+
+from collections import deque
+
+import frappe
+from frappe.utils import add_days, getdate, today
+
+
+# -------------------- get_critical_path --------------------
+# Loads tasks + dependency edges for all projects in one query
+# Returns: (schedule, cycles)
+#   schedule: {task_name: {"earliest_finish", "latest_finish", "slack", "is_critical"}}
+#   cycles: {project_name: [task names in or between dependency cycles]}
+# ------------------------------------------------------------
+def get_critical_path(project_names):
+    """Compute critical path columns for all tasks of the given projects"""
+    if not project_names:
+        return {}, {}
+
+    rows = frappe.db.sql(
+        """
+        select t.name, t.project, t.exp_start_date, t.exp_end_date, d.task as depends_on
+        from `tabTask` t
+        left join `tabTask Depends On` d
+            on d.parent = t.name and d.parenttype = 'Task' and d.parentfield = 'depends_on'
+        where t.project in %(projects)s and t.status != 'Cancelled'
+        """,
+        {"projects": project_names},
+        as_dict=True
+    )
+
+    nodes = {}
+    edges = []
+    for r in rows:
+        if r.name not in nodes:
+            nodes[r.name] = {"project": r.project, "start": r.exp_start_date, "end": r.exp_end_date}
+        if r.depends_on:
+            edges.append((r.depends_on, r.name))
+
+    return compute_schedule(nodes, edges)
+
+
+# -------------------- compute_schedule --------------------
+# Critical path method over a task graph
+# nodes: {name: {"project", "start", "end"}}
+# edges: [(predecessor, successor)] - only same-project edges are used
+# -----------------------------------------------------------
+def compute_schedule(nodes, edges):
+    """Forward/backward pass returning per-task finish dates and slack"""
+    successors = {name: [] for name in nodes}
+    predecessors = {name: [] for name in nodes}
+    for pred, succ in edges:
+        if pred in nodes and succ in nodes and pred != succ and nodes[pred]["project"] == nodes[succ]["project"]:
+            successors[pred].append(succ)
+            predecessors[succ].append(pred)
+
+    # Project anchor: earliest planned date of the project (day offset 0)
+    anchors = {}
+    for node in nodes.values():
+        date = node["start"] or node["end"]
+        if date and (node["project"] not in anchors or getdate(date) < anchors[node["project"]]):
+            anchors[node["project"]] = getdate(date)
+
+    def duration(node):
+        if node["start"] and node["end"]:
+            return max((getdate(node["end"]) - getdate(node["start"])).days + 1, 1)
+        return 1 if (node["start"] or node["end"]) else 0
+
+    def planned_start(node, anchor):
+        if node["start"]:
+            return (getdate(node["start"]) - anchor).days
+        if node["end"]:
+            return (getdate(node["end"]) - anchor).days - duration(node) + 1
+        return 0
+
+    # Forward pass (Kahn's algorithm)
+    in_degree = {name: len(preds) for name, preds in predecessors.items()}
+    queue = deque(name for name, degree in in_degree.items() if degree == 0)
+    order = []
+    earliest_start = {}
+    earliest_finish = {}
+    while queue:
+        name = queue.popleft()
+        node = nodes[name]
+        anchor = anchors.get(node["project"]) or getdate(today())
+        start = max([planned_start(node, anchor)] + [earliest_finish[p] for p in predecessors[name]])
+        earliest_start[name] = start
+        earliest_finish[name] = start + duration(node)
+        order.append(name)
+        for succ in successors[name]:
+            in_degree[succ] -= 1
+            if in_degree[succ] == 0:
+                queue.append(succ)
+
+    # Nodes never reached sit in or behind a cycle; peel sinks to keep only
+    # the nodes in (or between) cycles for the report message
+    cycles = {}
+    if len(order) < len(nodes):
+        remaining = set(nodes) - set(order)
+        out_degree = {name: sum(1 for s in successors[name] if s in remaining) for name in remaining}
+        sinks = deque(name for name, degree in out_degree.items() if degree == 0)
+        while sinks:
+            name = sinks.popleft()
+            remaining.discard(name)
+            for pred in predecessors[name]:
+                if pred in out_degree and pred in remaining:
+                    out_degree[pred] -= 1
+                    if out_degree[pred] == 0:
+                        sinks.append(pred)
+        for name in sorted(remaining):
+            cycles.setdefault(nodes[name]["project"], []).append(name)
+
+    # Project finish = latest earliest-finish of the project
+    project_finish = {}
+    for name in order:
+        project = nodes[name]["project"]
+        project_finish[project] = max(project_finish.get(project, 0), earliest_finish[name])
+
+    # Backward pass in reverse topological order
+    latest_finish = {}
+    for name in reversed(order):
+        scheduled = [s for s in successors[name] if s in latest_finish]
+        if scheduled:
+            latest_finish[name] = min(latest_finish[s] - duration(nodes[s]) for s in scheduled)
+        else:
+            latest_finish[name] = project_finish[nodes[name]["project"]]
+
+    schedule = {}
+    for name in order:
+        node = nodes[name]
+        anchor = anchors.get(node["project"]) or getdate(today())
+        slack = latest_finish[name] - earliest_finish[name]
+        schedule[name] = {
+            "earliest_finish": add_days(anchor, max(earliest_finish[name] - 1, earliest_start[name])),
+            "latest_finish": add_days(anchor, max(latest_finish[name] - 1, latest_finish[name] - duration(node))),
+            "slack": slack,
+            "is_critical": 1 if slack <= 0 and duration(node) > 0 else 0,
+        }
+    return schedule, cycles
@@ -0,0 +1,365 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+"""
+Project Overview Report - Background PDF export
+===============================================
+Renders the Project Overview print layout in a background job so that large,
+company-wide overviews no longer time out in the browser print dialog.
+
+How it works:
+- Task rows are paged out of the Project Overview Snapshot in tree order,
+  PDF_CHUNK_ROWS per query (limit_start/limit_page_length), with the
+  report's filters; project header rows are added as the project changes
+- Every chunk is rendered (project_overview_pdf.html, Jinja), converted to
+  PDF on its own and written to a temp file
+- The chunk PDFs are merged by pypdf straight into a file under the site's
+  private files, which the File record then points to (file_url)
+- The requesting user gets a Notification Log entry and a realtime event
+  with the download link
+
+Report rows and HTML are bounded by PDF_CHUNK_ROWS: only one page of rows
+is held at a time and wkhtmltopdf never sees more than one chunk. The merged
+PDF is written to disk and never read back into memory (pypdf still keeps
+the page objects of the chunk files while merging). Filters that select a
+task set (assigned_to, search) hold the matching task names, as the report
+does.
+
+Main Functions:
+- enqueue_pdf_export(): Whitelisted entry point, queues the job
+- render_pdf_export(): Background job that renders, merges and notifies
+- iter_report_rows(): Streams project and task rows page by page
+- chunk_report_rows(): Splits rows into chunks, repeating the project header
+- resolve_tree_chars(): Tree connectors of rows whose next sibling is not
+  loaded yet
+"""
+
+import json
+import os
+import tempfile
+
+import frappe
+
+from riz_erp.riz_erp.doctype.project_overview_snapshot.project_overview_snapshot import (
+    DOCTYPE as SNAPSHOT_DOCTYPE,
+)
+
+# Rows rendered per wkhtmltopdf call
+PDF_CHUNK_ROWS = 250
+
+# Realtime event the report listens to for the finished download link
+PDF_READY_EVENT = "project_overview_pdf_ready"
+
+TEMPLATE_FILE = "project_overview_pdf.html"
+
+SNAPSHOT_FIELDS = ["task", "project", "subject", "custom_next_action", "status", "priority",
+                   "exp_end_date", "progress", "sort_key", "assigned_to", "modified"]
+
+
+# -------------------- enqueue_pdf_export --------------------
+# Queues a background PDF export of the report for the current user
+# Requires: Task read permission
+# -------------------------------------------------------------
+@frappe.whitelist()
+def enqueue_pdf_export(filters=None):
+    """Queue a paginated PDF export of the Project Overview report
+
+    Args:
+        filters (str|dict): Report filters (sent as JSON string from client)
+
+    Returns:
+        dict: {"success": bool, "message": str}
+    """
+    if isinstance(filters, str):
+        filters = json.loads(filters) if filters else {}
+
+    if not frappe.has_permission("Task", "read"):
+        frappe.throw("You do not have permission to export tasks")
+
+    frappe.enqueue(
+        "riz_erp.riz_erp.report.project_overview.pdf_export.render_pdf_export",
+        queue="long",
+        timeout=3600,
+        filters=filters or {},
+        user=frappe.session.user,
+    )
+
+    return {
+        "success": True,
+        "message": "PDF export started. You will be notified when it is ready to download."
+    }
+
+
+# -------------------- render_pdf_export --------------------
+# Background job: renders report rows chunk by chunk, merges the PDFs
+# into a private file and notifies the user
+# ------------------------------------------------------------
+def render_pdf_export(filters, user):
+    """Render, merge and attach the Project Overview PDF
+
+    Args:
+        filters (dict): Report filters
+        user (str): User who requested the export (receives the notification)
+    """
+    from frappe.utils import format_date, now_datetime, nowdate
+    from frappe.utils.pdf import get_pdf
+    from pypdf import PdfWriter
+
+    file_path = None
+    try:
+        filters = frappe._dict(filters)
+        snapshot_filters = get_export_snapshot_filters(filters)
+        template = frappe.read_file(os.path.join(os.path.dirname(__file__), TEMPLATE_FILE))
+        context = {
+            "subtitle": build_filter_subtitle(filters),
+            "generated_on": format_date(nowdate()),
+        }
+
+        file_name = (
+            f"Project Overview {now_datetime().strftime('%Y-%m-%d %H%M%S')} "
+            f"{frappe.generate_hash(length=6)}.pdf"
+        )
+        task_count = 0
+        with tempfile.TemporaryDirectory() as tmpdir:
+            chunk_paths = []
+            rows = iter_report_rows(filters, snapshot_filters)
+            for part, chunk in enumerate(chunk_report_rows(rows, PDF_CHUNK_ROWS), start=1):
+                resolve_tree_chars(chunk, snapshot_filters)
+                task_count += sum(1 for row in chunk if row.get("is_project") != 1)
+                html = frappe.render_template(template, dict(context, rows=chunk, part=part))
+                path = os.path.join(tmpdir, f"part-{part:05d}.pdf")
+                with open(path, "wb") as f:
+                    f.write(get_pdf(html, {"orientation": "Landscape"}))
+                chunk_paths.append(path)
+
+            if not chunk_paths:
+                # No rows: still render the header so the user gets a file
+                path = os.path.join(tmpdir, "part-00001.pdf")
+                with open(path, "wb") as f:
+                    f.write(get_pdf(frappe.render_template(template, dict(context, rows=[], part=1)),
+                                    {"orientation": "Landscape"}))
+                chunk_paths.append(path)
+
+            writer = PdfWriter()
+            for path in chunk_paths:
+                writer.append(path)
+
+            file_path = frappe.get_site_path("private", "files", file_name)
+            with open(file_path, "wb") as f:
+                writer.write(f)
+            writer.close()
+
+        file_doc = frappe.get_doc({
+            "doctype": "File",
+            "file_name": file_name,
+            "file_url": f"/private/files/{file_name}",
+            "attached_to_doctype": "Report",
+            "attached_to_name": "Project Overview",
+            "is_private": 1,
+        })
+        file_doc.insert(ignore_permissions=True)
+
+        notify_user(
+            user,
+            f"Project Overview PDF is ready ({task_count} tasks)",
+            file_doc,
+        )
+        frappe.db.commit()
+
+        frappe.publish_realtime(
+            PDF_READY_EVENT,
+            {"success": True, "file_url": file_doc.file_url, "file_name": file_doc.file_name},
+            user=user,
+        )
+    except Exception as e:
+        frappe.db.rollback()
+        if file_path and os.path.exists(file_path):
+            os.remove(file_path)
+        frappe.log_error(f"Error exporting Project Overview PDF: {str(e)}", "Project Overview PDF Error")
+        frappe.publish_realtime(
+            PDF_READY_EVENT,
+            {"success": False, "message": f"PDF export failed: {str(e)}"},
+            user=user,
+        )
+
+
+# -------------------- get_export_snapshot_filters --------------------
+# Snapshot filters for the report filters (see project_overview.py)
+# Search hits come with their ancestors (any status), as in execute()
+# Returns: None when no task matches
+# ----------------------------------------------------------------------
+def get_export_snapshot_filters(filters):
+    from riz_erp.riz_erp.report.project_overview.project_overview import (
+        get_filtered_task_ids,
+        get_snapshot_filters,
+    )
+
+    task_ids = get_filtered_task_ids(filters)
+    if task_ids is not None and not task_ids:
+        return None
+    snapshot_filters = get_snapshot_filters(filters, task_ids)
+
+    if (filters.get("search") or "").strip():
+        hit_keys = frappe.get_all(SNAPSHOT_DOCTYPE, filters=snapshot_filters, pluck="sort_key")
+        if not hit_keys:
+            return None
+        snapshot_filters = {"task": ["in", list({a for key in hit_keys if key for a in key.split("/")})]}
+    return snapshot_filters
+
+
+# -------------------- iter_report_rows --------------------
+# Streams report rows from the snapshot, one query per page_size tasks
+# Rows are in tree pre-order (project, sort_key); the indent counts the
+# visible ancestors, kept as a path stack (bounded by the tree depth)
+# Tree connectors: a row is "├" once a later sibling arrives; rows still
+# waiting for one carry "_open" for resolve_tree_chars()
+# -----------------------------------------------------------
+def iter_report_rows(filters, snapshot_filters, page_size=PDF_CHUNK_ROWS):
+    """Yield project and task rows of the report page by page"""
+    from riz_erp.riz_erp.report.project_overview.project_overview import make_project_row, make_task_row
+
+    if snapshot_filters is None:
+        return
+
+    project_filters = {"name": filters.get("project")} if filters.get("project") else {}
+    projects = {
+        p.name: p
+        for p in frappe.get_all("Project", fields=["name", "project_name", "percent_complete"],
+                                filters=project_filters)
+    }
+
+    current_project = None
+    visible = []     # sort_keys of the visible ancestors of the current row
+    open_rows = {}   # indent: last row at that indent without a sibling yet
+    start = 0
+    while True:
+        tasks = frappe.get_all(
+            SNAPSHOT_DOCTYPE,
+            filters=snapshot_filters,
+            fields=SNAPSHOT_FIELDS,
+            order_by="project asc, sort_key asc",
+            limit_start=start,
+            limit_page_length=page_size
+        )
+        for t in tasks:
+            if t.project not in projects:
+                continue
+            if t.project != current_project:
+                # Last rows of the previous project have no later sibling
+                for row in open_rows.values():
+                    close_tree_char(row, "└")
+                open_rows, visible = {}, []
+                current_project = t.project
+                yield make_project_row(projects[t.project])
+
+            sort_key = t.sort_key or t.task
+            while visible and not sort_key.startswith(visible[-1] + "/"):
+                visible.pop()
+            indent = 1 + len(visible)
+
+            for level in [level for level in open_rows if level > indent]:
+                close_tree_char(open_rows.pop(level), "└")
+            if indent in open_rows:
+                close_tree_char(open_rows.pop(indent), "├")
+
+            row = make_task_row(t, indent)
+            row["tree_char"] = "└"
+            row["_open"] = (t.project, sort_key, set(visible))
+            open_rows[indent] = row
+            visible.append(sort_key)
+            yield row
+
+        if len(tasks) < page_size:
+            break
+        start += page_size
+
+
+def close_tree_char(row, tree_char):
+    row["tree_char"] = tree_char
+    row.pop("_open", None)
+
+
+# -------------------- resolve_tree_chars --------------------
+# Rows of a chunk still waiting for a sibling (at most one per tree level)
+# look up the next row after their subtree: "├" when it has their indent
+# -------------------------------------------------------------
+def resolve_tree_chars(rows, snapshot_filters):
+    """Settle the tree connectors of a chunk before it is rendered"""
+    for row in rows:
+        if "_open" not in row:
+            continue
+        project, sort_key, ancestors = row.pop("_open")
+        next_key = frappe.get_all(
+            SNAPSHOT_DOCTYPE,
+            filters=[[field, *value] if isinstance(value, list) else [field, "=", value]
+                     for field, value in snapshot_filters.items()]
+            + [["project", "=", project], ["sort_key", ">", sort_key], ["sort_key", "not like", f"{sort_key}/%"]],
+            order_by="sort_key asc",
+            limit_page_length=1,
+            pluck="sort_key"
+        )
+        # Visible ancestors of the next row are those it shares with this row
+        parts = next_key[0].split("/") if next_key else []
+        indent = 1 + sum(1 for i in range(1, len(parts)) if "/".join(parts[:i]) in ancestors)
+        row["tree_char"] = "├" if next_key and indent == row["indent"] else "└"
+
+
+# -------------------- chunk_report_rows --------------------
+# Splits report rows into chunks of at most chunk_size rows
+# A chunk that starts inside a project repeats that project's header
+# row (flagged "continued") so every page stays readable on its own
+# ------------------------------------------------------------
+def chunk_report_rows(data, chunk_size=PDF_CHUNK_ROWS):
+    """Yield lists of report rows, at most chunk_size task rows each"""
+    chunk = []
+    current_project = None
+
+    for row in data:
+        if row.get("is_project") == 1:
+            current_project = row
+
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+            if row.get("is_project") != 1 and current_project:
+                chunk.append(dict(current_project, continued=1))
+
+        chunk.append(row)
+
+    if chunk:
+        yield chunk
+
+
+# -------------------- build_filter_subtitle --------------------
+# Human readable summary of the active filters for the PDF header
+# ---------------------------------------------------------------
+def build_filter_subtitle(filters):
+    """Describe active report filters as a single line"""
+    from riz_erp.riz_erp.report.project_overview.project_overview import parse_multi_select
+
+    parts = []
+    if filters.get("project"):
+        parts.append(f"Project: {filters.get('project')}")
+    if parse_multi_select(filters.get("status")):
+        parts.append("Status: " + ", ".join(parse_multi_select(filters.get("status"))))
+    if parse_multi_select(filters.get("assigned_to")):
+        parts.append("Assigned To: " + ", ".join(parse_multi_select(filters.get("assigned_to"))))
+    if filters.get("show_completed_tasks"):
+        parts.append("Including completed tasks")
+    return " · ".join(parts)
+
+
+# -------------------- notify_user --------------------
+# Creates a Notification Log entry linking to the generated File
+# -----------------------------------------------------
+def notify_user(user, subject, file_doc):
+    """Send an in-app notification pointing at the exported file"""
+    frappe.get_doc({
+        "doctype": "Notification Log",
+        "for_user": user,
+        "type": "Alert",
+        "subject": subject,
+        "email_content": f"<a href='{file_doc.file_url}'>Download {file_doc.file_name}</a>",
+        "document_type": "File",
+        "document_name": file_doc.name,
+    }).insert(ignore_permissions=True)
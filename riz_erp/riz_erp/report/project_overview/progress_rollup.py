@@ -0,0 +1,87 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+"""
+Project Overview Report - Progress rollup for parent tasks
+==========================================================
+A task's own `progress` is only what was entered on it, so a parent task
+whose sub-tasks are all done can still show 0%. With the progress_rollup
+filter, parent tasks show the weighted average progress of the leaf tasks
+below them instead.
+
+Weighting:
+- Duration: leaf tasks weigh their expected duration in days
+  (exp_start_date..exp_end_date inclusive, 1 day when a date is missing)
+- Equal: every leaf task weighs the same
+A parent contributes the summed weight of its leaves, so the result is the
+same as averaging over all leaves of the subtree. Completed leaves count as
+100%. A Cancelled task is left out together with its whole subtree.
+
+A parent without any (non-cancelled) leaf below it, e.g. one whose
+sub-tasks are all cancelled, is not rolled up: it keeps the progress
+entered on it.
+
+How it works:
+- Runs on the snapshot rows the report already reads (one query); the
+  report reads all rows of the projects then, so hidden descendants (e.g.
+  completed tasks) still count, and applies its filters afterwards
+- One pass in tree pre-order marks cancelled subtrees, then one pass in
+  reverse pre-order (children come before their parents) sums the weights,
+  the parent taken from the snapshot sort_key path
+
+Main Functions:
+- rollup_progress(): Rolled-up progress of every task with sub-tasks
+"""
+
+from frappe.utils import flt, getdate
+
+ROLLUP_WEIGHTINGS = ("Duration", "Equal")
+
+
+# -------------------- rollup_progress --------------------
+# Bottom-up weighted progress in one linear pass
+# Args: snapshot rows in tree pre-order (task, status, progress,
+#   exp_start_date, exp_end_date, sort_key), weighting
+# Returns: {task: progress} for tasks with (non-cancelled) leaves below;
+#   other parents are left out and keep their own progress
+# ----------------------------------------------------------
+def rollup_progress(tasks, weighting="Duration"):
+    """Weighted progress of parent tasks from their leaf tasks"""
+    weighted_sums = {}
+    weights = {}
+    rolled_up = {}
+
+    # Cancelled tasks and everything below them (parents come first)
+    cancelled = set()
+    for t in tasks:
+        path = t.sort_key.split("/") if t.sort_key else []
+        if t.status == "Cancelled" or (len(path) > 1 and path[-2] in cancelled):
+            cancelled.add(t.task)
+
+    for t in reversed(tasks):
+        if t.task in cancelled:
+            continue
+        if t.task in weights:
+            # Parent: all children were visited already
+            weight = weights[t.task]
+            if not weight:
+                continue
+            progress = weighted_sums[t.task] / weight
+            rolled_up[t.task] = round(progress)
+        else:
+            weight = get_weight(t, weighting)
+            progress = 100 if t.status == "Completed" else flt(t.progress)
+
+        path = t.sort_key.split("/") if t.sort_key else []
+        if len(path) > 1:
+            parent = path[-2]
+            weighted_sums[parent] = weighted_sums.get(parent, 0) + weight * progress
+            weights[parent] = weights.get(parent, 0) + weight
+
+    return rolled_up
+
+
+def get_weight(task, weighting):
+    if weighting != "Duration" or not (task.exp_start_date and task.exp_end_date):
+        return 1
+    return max((getdate(task.exp_end_date) - getdate(task.exp_start_date)).days + 1, 1)
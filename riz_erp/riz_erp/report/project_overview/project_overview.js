@@ -9,7 +9,19 @@
  * - Task selection with checkboxes for bulk operations
  * - Update task status button with modal dialog
  * - Create new task button with form dialog
+ * - Bulk create a task hierarchy from a pasted outline or CSV
+ * - Bulk updates send the row versions seen; conflicting tasks are reported
+ * - Full-text search filter; hits shown with their (dimmed) ancestor path
+ * - Shift selected tasks (with sub-tasks/dependents) by N days, with preview
  * - Interactive buttons on task/project rows
+ * - Background PDF export (chunked rendering, download link when ready)
+ * - Optional project summary columns (status counts, late tasks, next due)
+ * - Projects Only: collapsed view with project rows (and summary) only
+ * - Optional 90-day progress sparkline on project rows
+ * - Optional critical path columns (earliest/latest finish, slack) with
+ *   zero-slack tasks highlighted
+ * - Optional progress rollup: parent tasks show the weighted progress of
+ *   their sub-tasks (marked with a tooltip)
  *
  * Important:
  * - Filters are defined in project_overview.json (server-side)
@@ -46,6 +58,12 @@ frappe.query_reports["Project Overview"] = {
             width: '80',
             options: 'Project'
         },
+        {
+            fieldname: 'search',
+            label: __('Search'),
+            fieldtype: 'Data',
+            width: '80'
+        },
         {
             fieldname: 'status',
             label: __('Status'),
@@ -83,6 +101,42 @@ frappe.query_reports["Project Overview"] = {
             fieldtype: 'Check',
             width: '80',
             default: 0
+        },
+        {
+            fieldname: 'show_project_summary',
+            label: __('Show Project Summary'),
+            fieldtype: 'Check',
+            width: '80',
+            default: 0
+        },
+        {
+            fieldname: 'projects_only',
+            label: __('Projects Only'),
+            fieldtype: 'Check',
+            width: '80',
+            default: 0
+        },
+        {
+            fieldname: 'show_progress_trend',
+            label: __('Show Progress Trend'),
+            fieldtype: 'Check',
+            width: '80',
+            default: 0
+        },
+        {
+            fieldname: 'show_critical_path',
+            label: __('Show Critical Path'),
+            fieldtype: 'Check',
+            width: '80',
+            default: 0
+        },
+        {
+            fieldname: 'progress_rollup',
+            label: __('Progress Rollup'),
+            fieldtype: 'Select',
+            width: '80',
+            options: ['', 'Duration', 'Equal'],
+            default: ''
         }
     ],
 
@@ -98,13 +152,13 @@ frappe.query_reports["Project Overview"] = {
         setTimeout(function() {
             // Check if any filter has a value from URL params
             const urlParams = new URLSearchParams(window.location.search);
-            const hasFilters = urlParams.has('project') || urlParams.has('status') ||
+            const hasFilters = urlParams.has('project') || urlParams.has('status') || urlParams.has('search') ||
                               urlParams.has('assigned_to') || urlParams.has('show_completed_tasks');
 
             if (hasFilters && report.get_values) {
                 const filters = report.get_values();
                 // Check if at least one filter has a value
-                if (filters.project || (filters.status && filters.status.length) ||
+                if (filters.project || filters.search || (filters.status && filters.status.length) ||
                     (filters.assigned_to && filters.assigned_to.length)) {
                     report.refresh();
                 }
@@ -131,6 +185,16 @@ frappe.query_reports["Project Overview"] = {
             showCreateTaskDialog(report);
         });
 
+        // Button: Bulk Create (always visible, pasted outline or CSV)
+        report.page.add_inner_button(__('Bulk Create'), function() {
+            showBulkCreateDialog(report);
+        });
+
+        // Button: Export PDF (always visible, rendered in a background job)
+        report.page.add_inner_button(__('Export PDF'), function() {
+            startPdfExport(report);
+        });
+
         // Assignment buttons (ungrouped, hidden by default, conditionally visible)
         report.page.add_inner_button(__('Assign'), function() {
             showAssignDialog(report);
@@ -220,6 +284,27 @@ frappe.query_reports["Project Overview"] = {
             }
         });
 
+        // -------------------- PDF Export Ready Handler --------------------
+        // Background PDF export publishes this event when the file is ready
+        // Shows the download link (or the failure message) to the user
+        // ------------------------------------------------------------------
+        frappe.realtime.off("project_overview_pdf_ready");
+        frappe.realtime.on("project_overview_pdf_ready", function(result) {
+            if (result.success) {
+                frappe.msgprint({
+                    title: __('PDF Ready'),
+                    message: `<a href="${result.file_url}" target="_blank">${__('Download')} ${frappe.utils.escape_html(result.file_name)}</a>`,
+                    indicator: 'green'
+                });
+            } else {
+                frappe.msgprint({
+                    title: __('PDF Export Failed'),
+                    message: frappe.utils.escape_html(result.message || ''),
+                    indicator: 'red'
+                });
+            }
+        });
+
         // -------------------- Update Status Button Handler --------------------
         // Handles clicks on "Update Status" buttons
         // Opens modal dialog for status selection and updates task via API
@@ -309,6 +394,16 @@ frappe.query_reports["Project Overview"] = {
         });
     },
 
+    // -------------------- after_datatable_render --------------------
+    // Search hits can sit deep in the tree: expand all rows while searching
+    // -----------------------------------------------------------------
+    after_datatable_render: function (datatable) {
+        const search = frappe.query_report && frappe.query_report.get_filter_value('search');
+        if (search && datatable.rowmanager) {
+            datatable.rowmanager.expandAllNodes();
+        }
+    },
+
     // -------------------- formatter --------------------
     // Custom formatter for report columns
     // Renders checkboxes, status badges, and action buttons
@@ -332,6 +427,13 @@ frappe.query_reports["Project Overview"] = {
             value = checkboxHtml + value;
         }
 
+        // -------------------- Search Context Rendering --------------------
+        // Ancestors shown only as the path to a search hit are dimmed
+        // ------------------------------------------------------------------
+        if (column.fieldname === "task_link" && data && data.search_context) {
+            value = `<span style="opacity:0.55">${value}</span>`;
+        }
+
         // -------------------- Priority Rendering --------------------
         // Uses badge-pill class (like indicator-pill but without dot)
         // Low=blue, Medium=orange, High=red, Urgent=darkred
@@ -383,12 +485,47 @@ frappe.query_reports["Project Overview"] = {
                         <span style="font-size:12px;color:#6b7280">${percent}%</span>
                     </div>
                 `;
+            } else if (data.progress_rollup) {
+                // Parent task row with progress rollup: weighted from sub-tasks
+                value = `<span style="font-size:12px;color:#6b7280;font-style:italic" title="${__('Rolled up from sub-tasks')}">${percent}%</span>`;
             } else {
                 // Task row: Show simple percentage
                 value = `<span style="font-size:12px;color:#6b7280">${percent}%</span>`;
             }
         }
 
+        // -------------------- Project Summary Rendering --------------------
+        // Late tasks (past exp_end_date, not completed) highlighted in red
+        // Zero counts are dimmed so non-zero values stand out
+        // -------------------------------------------------------------------
+        if (column.fieldname === "late_tasks" && data && data.late_tasks > 0) {
+            value = `<span class="indicator-pill red">${data.late_tasks}</span>`;
+        } else if (["open_tasks", "working_tasks", "overdue_tasks", "completed_tasks", "late_tasks", "assignee_count"].includes(column.fieldname)
+                   && data && data.is_project === 1 && !data[column.fieldname]) {
+            value = `<span style="color:#9ca3af">0</span>`;
+        }
+
+        // -------------------- Progress Trend Rendering --------------------
+        // 90-day % complete as an inline SVG sparkline (project rows)
+        // Tooltip shows the change in % complete and open tasks
+        // -------------------------------------------------------------------
+        if (column.fieldname === "progress_trend" && data && data.is_project === 1) {
+            value = data.progress_trend ? buildSparkline(data.progress_trend, data.open_trend) : '';
+        }
+
+        // -------------------- Critical Path Rendering --------------------
+        // Critical tasks (zero slack) push the project end date: red slack
+        // pill and bold finish dates; tasks with slack show days in green
+        // -----------------------------------------------------------------
+        if (["earliest_finish", "latest_finish"].includes(column.fieldname) && data && data.is_critical) {
+            value = `<b style="color:#dc2626">${value}</b>`;
+        }
+        if (column.fieldname === "slack" && data && data.slack !== null && data.slack !== undefined && data.is_project !== 1) {
+            value = data.is_critical
+                ? `<span class="indicator-pill red">${__('Critical')}</span>`
+                : `<span class="indicator-pill green">${data.slack}d</span>`;
+        }
+
         // -------------------- Assigned To Rendering --------------------
         // Render circular avatars with single initial, left-aligned
         // Data format: "email1:fullname1,email2:fullname2,..."
@@ -446,6 +583,23 @@ frappe.query_reports["Project Overview"] = {
     }
 };
 
+// -------------------- Helper: Build Sparkline --------------------
+// Renders comma separated % values (oldest first) as a 100x20 SVG line
+// -------------------------------------------------------------------
+function buildSparkline(progressTrend, openTrend) {
+    const values = progressTrend.split(',').map(Number);
+    const open = (openTrend || '').split(',').map(Number);
+    const width = 100, height = 20;
+    const step = values.length > 1 ? width / (values.length - 1) : 0;
+    const points = values.map((v, i) => `${(i * step).toFixed(1)},${(height - (v / 100) * height).toFixed(1)}`).join(' ');
+    const first = values[0], last = values[values.length - 1];
+    const color = last >= first ? '#16a34a' : '#dc2626';
+    const title = `${first}% → ${last}%` + (open.length ? `, open tasks ${open[0]} → ${open[open.length - 1]}` : '') +
+        ` (${values.length} day(s))`;
+    return `<svg width="${width}" height="${height}" style="vertical-align:middle"><title>${title}</title>` +
+        `<polyline fill="none" stroke="${color}" stroke-width="1.5" points="${points}"/></svg>`;
+}
+
 // -------------------- Helper: Build Task List HTML --------------------
 // Generates HTML list of selected tasks for dialogs (max 10 + count)
 // -----------------------------------------------------------------------
@@ -479,6 +633,20 @@ function validateSelection() {
     return true;
 }
 
+// -------------------- Helper: Get Expected Modified --------------------
+// {task_id: modified} of the selected rows as loaded, so the server can
+// refuse to overwrite tasks someone else changed in the meantime
+// -----------------------------------------------------------------------
+function getExpectedModified(report) {
+    const expected = {};
+    (report.data || []).forEach(row => {
+        if (row && !row.is_project && selectedTaskIds.has(row.name) && row.modified) {
+            expected[row.name] = row.modified;
+        }
+    });
+    return expected;
+}
+
 // -------------------- Helper: Handle Bulk Update Response --------------------
 // Processes API response and shows appropriate success/error messages
 // Auto-refreshes report and clears selections
@@ -487,6 +655,11 @@ function handleBulkUpdateResponse(result, report) {
     let msg = `${result.updated} task(s) updated successfully`;
 
     if (result.skipped > 0) msg += `, ${result.skipped} skipped`;
+    if (result.conflicts && result.conflicts.length > 0) {
+        msg += `, ${result.conflicts.length} not updated because someone changed them after you loaded the report`;
+        msg += `<br><br><strong>Conflicts:</strong><br>${result.conflicts.slice(0, 5).map(c => `${c.task}: ${c.message}`).join('<br>')}`;
+        if (result.conflicts.length > 5) msg += `<br>and ${result.conflicts.length - 5} more...`;
+    }
     if (result.failed > 0) {
         msg += `, ${result.failed} failed`;
         if (result.errors && result.errors.length > 0) {
@@ -557,7 +730,8 @@ function showBulkStatusUpdateDialog(report) {
                     task_ids: Array.from(selectedTaskIds),
                     new_status: values.new_status || null,
                     custom_next_action: values.custom_next_action || null,
-                    auto_complete: values.auto_complete || false
+                    auto_complete: values.auto_complete || false,
+                    expected_modified: getExpectedModified(report)
                 },
                 freeze: true,
                 freeze_message: `Updating ${count} tasks...`,
@@ -607,16 +781,25 @@ function showBulkDateUpdateDialog(report) {
                 fieldtype: 'HTML',
                 options: buildTaskListHTML(selectedTaskIds, report)
             },
+            {
+                label: 'Mode',
+                fieldname: 'mode',
+                fieldtype: 'Select',
+                options: ['Set Dates', 'Shift Dates'],
+                default: 'Set Dates'
+            },
             {
                 label: 'Expected Start Date',
                 fieldname: 'exp_start_date',
                 fieldtype: 'Date',
+                depends_on: "eval:doc.mode === 'Set Dates'",
                 description: 'Leave empty to keep existing dates'
             },
             {
                 label: 'Expected End Date',
                 fieldname: 'exp_end_date',
                 fieldtype: 'Date',
+                depends_on: "eval:doc.mode === 'Set Dates'",
                 description: 'Leave empty to keep existing dates'
             },
             {
@@ -624,11 +807,103 @@ function showBulkDateUpdateDialog(report) {
                 fieldname: 'only_empty',
                 fieldtype: 'Check',
                 default: 1,
+                depends_on: "eval:doc.mode === 'Set Dates'",
                 description: 'Skip tasks that already have dates set'
+            },
+            {
+                label: 'Shift By (Days)',
+                fieldname: 'shift_days',
+                fieldtype: 'Int',
+                depends_on: "eval:doc.mode === 'Shift Dates'",
+                description: 'Negative values move tasks earlier. Durations are kept.'
+            },
+            {
+                label: 'Count Working Days Only',
+                fieldname: 'working_days',
+                fieldtype: 'Check',
+                depends_on: "eval:doc.mode === 'Shift Dates'"
+            },
+            {
+                label: 'Include Sub-Tasks',
+                fieldname: 'include_descendants',
+                fieldtype: 'Check',
+                default: 1,
+                depends_on: "eval:doc.mode === 'Shift Dates'"
+            },
+            {
+                label: 'Include Dependent Tasks',
+                fieldname: 'include_dependents',
+                fieldtype: 'Check',
+                depends_on: "eval:doc.mode === 'Shift Dates'"
+            },
+            {
+                fieldname: 'shift_preview',
+                fieldtype: 'HTML',
+                depends_on: "eval:doc.mode === 'Shift Dates'"
             }
         ],
+        secondary_action_label: 'Preview Shift',
+        secondary_action() {
+            const values = d.get_values();
+            if (values.mode !== 'Shift Dates' || !values.shift_days) {
+                frappe.msgprint('Select "Shift Dates" and enter the number of days to preview.');
+                return;
+            }
+            frappe.call({
+                method: "riz_erp.riz_erp.report.project_overview.project_overview.bulk_update_task_dates",
+                args: {
+                    task_ids: Array.from(selectedTaskIds),
+                    shift_days: values.shift_days,
+                    working_days: values.working_days || false,
+                    include_descendants: values.include_descendants || false,
+                    include_dependents: values.include_dependents || false,
+                    preview: true
+                },
+                freeze: true,
+                freeze_message: __('Calculating...'),
+                callback: function(r) {
+                    if (r.message) {
+                        d.fields_dict.shift_preview.$wrapper.html(buildShiftPreviewHTML(r.message));
+                    }
+                }
+            });
+        },
         primary_action_label: 'Update All Tasks',
         primary_action(values) {
+            // Shift mode: one set-based update on the server
+            if (values.mode === 'Shift Dates') {
+                if (!values.shift_days) {
+                    frappe.msgprint('Please enter the number of days to shift by.');
+                    return;
+                }
+                d.get_primary_btn().prop('disabled', true);
+                frappe.call({
+                    method: "riz_erp.riz_erp.report.project_overview.project_overview.bulk_update_task_dates",
+                    args: {
+                        task_ids: Array.from(selectedTaskIds),
+                        shift_days: values.shift_days,
+                        working_days: values.working_days || false,
+                        include_descendants: values.include_descendants || false,
+                        include_dependents: values.include_dependents || false,
+                        expected_modified: getExpectedModified(report)
+                    },
+                    freeze: true,
+                    freeze_message: __('Shifting tasks...'),
+                    callback: function(r) {
+                        if (r.message) {
+                            handleBulkUpdateResponse(r.message, report);
+                            d.hide();
+                        } else {
+                            d.get_primary_btn().prop('disabled', false);
+                        }
+                    },
+                    error: function() {
+                        d.get_primary_btn().prop('disabled', false);
+                    }
+                });
+                return;
+            }
+
             // Client-side validation
             if (values.exp_start_date && values.exp_end_date) {
                 if (new Date(values.exp_end_date) < new Date(values.exp_start_date)) {
@@ -646,7 +921,8 @@ function showBulkDateUpdateDialog(report) {
                     task_ids: Array.from(selectedTaskIds),
                     exp_start_date: values.exp_start_date || null,
                     exp_end_date: values.exp_end_date || null,
-                    only_empty: values.only_empty || false
+                    only_empty: values.only_empty || false,
+                    expected_modified: getExpectedModified(report)
                 },
                 freeze: true,
                 freeze_message: `Updating ${count} tasks...`,
@@ -684,6 +960,32 @@ function showBulkDateUpdateDialog(report) {
     d.show();
 }
 
+// -------------------- Helper: Build Shift Preview HTML --------------------
+// Old -> new dates per task from a shift preview (first 100 rows)
+// ---------------------------------------------------------------------------
+function buildShiftPreviewHTML(result) {
+    const changes = result.changes || [];
+    const rows = changes.slice(0, 100).map(c => `
+        <tr>
+            <td>${frappe.utils.escape_html(c.subject || c.task)}</td>
+            <td>${frappe.datetime.str_to_user(c.old_start_date) || ''} &rarr; ${frappe.datetime.str_to_user(c.new_start_date) || ''}</td>
+            <td>${frappe.datetime.str_to_user(c.old_end_date) || ''} &rarr; ${frappe.datetime.str_to_user(c.new_end_date) || ''}</td>
+        </tr>`).join('');
+    const more = changes.length > 100 ? `<div class="text-muted">and ${changes.length - 100} more...</div>` : '';
+    const errors = (result.errors || []).slice(0, 5).join('<br>');
+    return `
+        <div style="margin-bottom: 8px;"><strong>${changes.length} task(s) will move</strong>,
+            ${result.skipped} skipped, ${result.failed} failed</div>
+        ${errors ? `<div class="text-danger" style="margin-bottom: 8px;">${errors}</div>` : ''}
+        <div style="max-height: 300px; overflow-y: auto;">
+            <table class="table table-bordered table-sm">
+                <thead><tr><th>Task</th><th>Start</th><th>End</th></tr></thead>
+                <tbody>${rows}</tbody>
+            </table>
+        </div>
+        ${more}`;
+}
+
 // -------------------- showCreateTaskDialog --------------------
 // Displays dialog for creating new task from Actions menu or project row
 // Enhanced with expected date fields
@@ -784,6 +1086,133 @@ function showCreateTaskDialog(report, projectName = null) {
     d.show();
 }
 
+// -------------------- showBulkCreateDialog --------------------
+// Creates a whole task hierarchy from a pasted outline or CSV
+// Outline: indentation = nesting, "Subject | user | start | end"
+// CSV: subject, assigned_to, exp_start_date, exp_end_date[, level]
+// All tasks are created in one request (all or nothing)
+// --------------------------------------------------------------
+function showBulkCreateDialog(report) {
+    const filters = report.get_values() || {};
+    let d = new frappe.ui.Dialog({
+        title: 'Bulk Create Tasks',
+        size: 'large',
+        fields: [
+            {
+                label: 'Project',
+                fieldname: 'project',
+                fieldtype: 'Link',
+                options: 'Project',
+                reqd: 1,
+                default: filters.project
+            },
+            {
+                label: 'Under Task',
+                fieldname: 'parent_task',
+                fieldtype: 'Link',
+                options: 'Task',
+                description: 'Optional - nest the new tasks under this task',
+                get_query: () => ({filters: {project: d.get_value('project') || ''}})
+            },
+            {
+                fieldtype: 'Column Break'
+            },
+            {
+                label: 'Format',
+                fieldname: 'input_format',
+                fieldtype: 'Select',
+                options: [
+                    {label: 'Indented Outline', value: 'outline'},
+                    {label: 'CSV', value: 'csv'}
+                ],
+                default: 'outline'
+            },
+            {
+                label: 'Status',
+                fieldname: 'status',
+                fieldtype: 'Select',
+                options: TASK_STATUSES,
+                default: 'Open'
+            },
+            {
+                fieldtype: 'Section Break'
+            },
+            {
+                label: 'Tasks',
+                fieldname: 'text',
+                fieldtype: 'Code',
+                reqd: 1,
+                description: 'Outline: one task per line, indent sub-tasks, optional "| user | start | end".<br>' +
+                    'CSV: subject, assigned_to, exp_start_date, exp_end_date[, level] (header optional). ' +
+                    'Separate several users with ";".'
+            }
+        ],
+        primary_action_label: 'Create Tasks',
+        primary_action(values) {
+            // Disable button to prevent duplicates
+            d.get_primary_btn().prop('disabled', true);
+
+            frappe.call({
+                method: "riz_erp.riz_erp.report.project_overview.bulk_create.bulk_create_tasks",
+                args: values,
+                freeze: true,
+                freeze_message: __('Creating tasks...'),
+                callback: function(r) {
+                    const result = r.message || {};
+                    if (result.success) {
+                        frappe.msgprint({
+                            title: __('Success'),
+                            message: `${result.created} task(s) created, ${result.assigned} assignment(s) added`,
+                            indicator: 'green'
+                        });
+                        report.refresh();
+                        d.hide();
+                    } else {
+                        d.get_primary_btn().prop('disabled', false);
+                        const errors = result.errors || [];
+                        let msg = errors.slice(0, 10).join('<br>');
+                        if (errors.length > 10) msg += `<br>and ${errors.length - 10} more...`;
+                        frappe.msgprint({
+                            title: __('Nothing was created'),
+                            message: msg || __('Failed to create tasks'),
+                            indicator: 'red'
+                        });
+                    }
+                },
+                error: function() {
+                    d.get_primary_btn().prop('disabled', false);
+                }
+            });
+        }
+    });
+    d.show();
+}
+
+// -------------------- startPdfExport --------------------
+// Queues a background PDF export with the current filters
+// The download link arrives via the project_overview_pdf_ready event
+// --------------------------------------------------------
+function startPdfExport(report) {
+    frappe.call({
+        method: "riz_erp.riz_erp.report.project_overview.pdf_export.enqueue_pdf_export",
+        args: {
+            filters: report.get_values()
+        },
+        callback: function(r) {
+            if (r.message && r.message.success) {
+                frappe.show_alert({message: r.message.message, indicator: 'blue'}, 7);
+            }
+        },
+        error: function() {
+            frappe.msgprint({
+                title: __('Error'),
+                message: __('Failed to start PDF export. Please try again.'),
+                indicator: 'red'
+            });
+        }
+    });
+}
+
 // -------------------- showAssignDialog --------------------
 // Displays dialog for assigning user to selected tasks
 // ----------------------------------------------------------
@@ -10,27 +10,76 @@ Features:
 - Server-side filtering (hide completed tasks by default)
 - Update task status directly from report (with auto-fill completed_on date)
 - Create new tasks from project rows
-- Tree structure with parent-child task relationships
+- Tree structure with parent-child task relationships (pre-computed in
+  Project Overview Snapshot, kept current by Task/ToDo/Project/User hooks)
 - Task selection checkboxes for bulk operations
 - Respects ERPNext permissions
+- Bulk updates lock rows in a fixed order, report conflicts with changes
+  made after the report was loaded and retry deadlocks (concurrency.py)
+- Reads from the read replica when configured, with a read-your-writes guard
+- Bulk audit mode (site config project_overview_bulk_audit): bulk endpoints
+  write one Bulk Operation Log per call instead of per-task versions and
+  assignment comments (bulk_assign.py for set-based assignments)
 
 Filters (defined in .json):
 - project: Filter by specific project
 - status: Filter by task status
 - show_completed_tasks: Show/hide completed tasks (default: hidden)
+- show_project_summary: Add per-project aggregate columns (status counts,
+  late tasks, assignees, next due date) computed with one GROUP BY query
+- projects_only: Collapsed view, project rows only; no task rows are read
+  (task filters do not apply, summary/trend columns still do)
+- show_progress_trend: Add a 90-day progress sparkline on project rows
+  (Project Progress History, one range query)
+- search: Full-text search over subject, next action and description
+  (FULLTEXT index, see search.py); hits are shown with their ancestors
+- show_critical_path: Add earliest/latest finish and slack columns computed
+  from Task dependencies (see critical_path.py); cycles are reported
+- progress_rollup: Show parent-task progress as the duration-weighted or
+  equal-weighted average of their sub-tasks (see progress_rollup.py)
 
 Main Functions:
 - execute(): Report data generation with server-side filtering
+  (task rows are served from the Project Overview Snapshot table)
 - update_task_status(): Update task status via button
 - create_task_from_report(): Create new tasks via button (enhanced with expected dates in v1.2)
 - bulk_update_task_status(): Bulk update status for multiple tasks (v1.2)
-- bulk_update_task_dates(): Bulk update expected dates for multiple tasks (v1.2)
-- build_task_tree(): Build hierarchical task structure
-- flatten_task_tree(): Convert tree to flat list for display
+- bulk_update_task_dates(): Bulk update expected dates for multiple tasks (v1.2),
+  or shift them (with sub-tasks/dependents) by N days (reschedule.py)
+- get_snapshot_task_rows(): Read visible task rows in tree order from the snapshot
+- make_task_row() / make_project_row(): Build task / project rows for display
+- get_project_aggregates(): Per-project task counts in a single grouped query
+- get_critical_path(): Slack per task from the dependency graph (critical_path.py)
 """
 
 import frappe
 
+from riz_erp.riz_erp.doctype.bulk_operation_log.bulk_operation_log import (
+    capture_cascaded_saves,
+    get_field_changes,
+    is_bulk_audit_enabled,
+    merge_task_changes,
+    record_bulk_operation,
+)
+from riz_erp.riz_erp.doctype.project_progress_history.project_progress_history import get_progress_trends
+from riz_erp.riz_erp.report.project_overview.bulk_assign import cancel_assignments, insert_assignments
+from riz_erp.riz_erp.report.project_overview.concurrency import (
+    RETRYABLE_ERRORS,
+    is_conflict,
+    lock_for_save,
+    make_conflict,
+    parse_expected_modified,
+    run_with_retry,
+    update_projects,
+)
+from riz_erp.riz_erp.report.project_overview.critical_path import get_critical_path
+from riz_erp.riz_erp.report.project_overview.progress_rollup import ROLLUP_WEIGHTINGS, rollup_progress
+from riz_erp.riz_erp.report.project_overview.replica import fresh_reads
+from riz_erp.riz_erp.report.project_overview.reschedule import shift_task_dates
+from riz_erp.riz_erp.report.project_overview.search import SEARCH_LIMIT, search_tasks
+
+SNAPSHOT_DOCTYPE = "Project Overview Snapshot"
+
 
 # -------------------- Helper: Parse Boolean --------------------
 # Converts string/bool to boolean for Frappe whitelisted methods
@@ -233,12 +282,16 @@ def create_task_from_report(project, task_name, description=None, status="Open",
 
 # -------------------- bulk_update_task_status --------------------
 # Updates status for multiple tasks with optional auto-complete date
-# Processes in batches of 10 for performance
+# Locks task rows in name order first, projects last (see concurrency.py)
+# Optional expected_modified: tasks changed since the client loaded them
+# are returned as conflicts instead of being overwritten
+# Deadlock victims are retried with backoff
 # Requires: Task write permission for each task
-# Returns: Dict with success/failure counts and error details
+# Returns: Dict with success/failure counts, conflicts and error details
 # ------------------------------------------------------------------
 @frappe.whitelist()
-def bulk_update_task_status(task_ids, new_status=None, custom_next_action=None, auto_complete=True):
+def bulk_update_task_status(task_ids, new_status=None, custom_next_action=None, auto_complete=True,
+                            expected_modified=None):
     """Bulk update status and/or custom next action for multiple tasks
 
     Args:
@@ -246,9 +299,10 @@ def bulk_update_task_status(task_ids, new_status=None, custom_next_action=None,
         new_status (str): Optional new status value
         custom_next_action (str): Optional next action value
         auto_complete (str|bool): Auto-fill completed_on date if status is Completed
+        expected_modified (str|dict): Optional {task_id: modified} the client saw
 
     Returns:
-        dict: {"success": bool, "updated": int, "failed": int, "errors": list}
+        dict: {"success": bool, "updated": int, "failed": int, "conflicts": list, "errors": list}
 
     Note: At least one of new_status or custom_next_action must be provided
     """
@@ -260,6 +314,7 @@ def bulk_update_task_status(task_ids, new_status=None, custom_next_action=None,
         task_ids = json.loads(task_ids)
 
     auto_complete = parse_bool(auto_complete)
+    expected = parse_expected_modified(expected_modified)
 
     # Convert to strings and handle None/empty values
     new_status = cstr(new_status).strip() if new_status else None
@@ -277,66 +332,112 @@ def bulk_update_task_status(task_ids, new_status=None, custom_next_action=None,
             "success": False,
             "updated": 0,
             "failed": 0,
+            "conflicts": [],
             "errors": ["Please provide at least one field to update (status or next action)"]
         }
 
-    updated = 0
-    failed = 0
-    errors = []
-
-    # Process in batches of 10
-    for i in range(0, len(task_ids), 10):
-        batch = task_ids[i:i+10]
-
-        for task_id in batch:
-            try:
-                # Get task document
-                task = frappe.get_doc("Task", task_id)
-
-                # Check write permission
-                if not frappe.has_permission("Task", "write", task):
-                    failed += 1
-                    errors.append(f"{task_id}: Permission denied")
-                    continue
+    task_ids = sorted(set(task_ids))
+    audit = is_bulk_audit_enabled()
+
+    def apply():
+        updated = 0
+        failed = 0
+        errors = []
+        conflicts = []
+        projects = set()
+        task_changes = {}
+
+        # Row locks in deterministic order before the first write, including
+        # the tasks and projects Task.on_update cascades to
+        locked = lock_for_save(task_ids)
+
+        # Audit mode: the tasks Task.on_update saves in cascade skip their
+        # Version too and are recorded in the same Bulk Operation Log
+        with capture_cascaded_saves(audit) as cascaded:
+            # Process in batches of 10
+            for i in range(0, len(task_ids), 10):
+                batch = task_ids[i:i+10]
+
+                for task_id in batch:
+                    if task_id not in locked:
+                        failed += 1
+                        errors.append(f"{task_id}: Task not found")
+                        continue
 
-                # Update status if provided
-                if new_status:
-                    task.status = new_status
+                    # Optimistic concurrency: skip tasks changed since the client loaded them
+                    if is_conflict(locked[task_id], expected.get(task_id)):
+                        conflicts.append(make_conflict(task_id, locked[task_id]))
+                        continue
 
-                    # Auto-fill completed_on date if status is Completed
-                    if new_status == "Completed" and auto_complete:
-                        task.completed_on = frappe.utils.today()
+                    try:
+                        # Get task document
+                        task = frappe.get_doc("Task", task_id)
+
+                        # Check write permission
+                        if not frappe.has_permission("Task", "write", task):
+                            failed += 1
+                            errors.append(f"{task_id}: Permission denied")
+                            continue
+
+                        old_values = {f: task.get(f) for f in ("status", "completed_on", "custom_next_action")}
+
+                        # Update status if provided
+                        if new_status:
+                            task.status = new_status
+
+                            # Auto-fill completed_on date if status is Completed
+                            if new_status == "Completed" and auto_complete:
+                                task.completed_on = frappe.utils.today()
+
+                        # Update custom_next_action if provided (and not empty)
+                        if custom_next_action:
+                            task.custom_next_action = custom_next_action
+
+                        # Save task (project is updated once below, locked last)
+                        task.flags.from_project = True
+                        # Audit mode: one Bulk Operation Log instead of a Version per task
+                        task.flags.ignore_version = audit
+                        task.save()
+                        projects.add(task.project)
+                        updated += 1
+                        if audit:
+                            task_changes[task_id] = (task.project, get_field_changes(old_values, task))
+
+                    except RETRYABLE_ERRORS:
+                        raise
+                    except frappe.TimestampMismatchError:
+                        conflicts.append(make_conflict(task_id, locked[task_id]))
+                    except Exception as e:
+                        failed += 1
+                        errors.append(f"{task_id}: {str(e)}")
+                        frappe.log_error(f"Bulk update failed for {task_id}: {str(e)}", "Bulk Update Error")
 
-                # Update custom_next_action if provided (and not empty)
-                if custom_next_action:
-                    task.custom_next_action = custom_next_action
+            update_projects(projects)
+        if audit:
+            record_bulk_operation("Status Update", merge_task_changes(task_changes, cascaded))
+        return {
+            "success": failed == 0 and not conflicts,
+            "updated": updated,
+            "failed": failed,
+            "conflicts": conflicts,
+            "errors": errors
+        }
 
-                # Save task
-                task.save()
-                updated += 1
-
-            except Exception as e:
-                failed += 1
-                errors.append(f"{task_id}: {str(e)}")
-                frappe.log_error(f"Bulk update failed for {task_id}: {str(e)}", "Bulk Update Error")
-
-    return {
-        "success": failed == 0,
-        "updated": updated,
-        "failed": failed,
-        "errors": errors
-    }
+    return run_with_retry(apply) or busy_response(task_ids)
 
 
 # -------------------- bulk_update_task_dates --------------------
 # Updates expected dates for multiple tasks
 # Supports "only empty" mode to skip tasks with existing dates
-# Processes in batches of 10 for performance
+# Supports shift mode (shift_days) to move tasks by an offset
+# Same locking, conflict and retry rules as bulk_update_task_status
 # Requires: Task write permission for each task
-# Returns: Dict with success/failure/skipped counts and error details
+# Returns: Dict with success/failure/skipped counts, conflicts and error details
 # ----------------------------------------------------------------
 @frappe.whitelist()
-def bulk_update_task_dates(task_ids, exp_start_date=None, exp_end_date=None, only_empty=False):
+def bulk_update_task_dates(task_ids, exp_start_date=None, exp_end_date=None, only_empty=False,
+                           shift_days=None, working_days=False, include_descendants=False,
+                           include_dependents=False, preview=False, expected_modified=None):
     """Bulk update expected dates for multiple tasks
 
     Args:
@@ -344,9 +445,16 @@ def bulk_update_task_dates(task_ids, exp_start_date=None, exp_end_date=None, onl
         exp_start_date (str): Expected start date in YYYY-MM-DD format
         exp_end_date (str): Expected end date in YYYY-MM-DD format
         only_empty (str|bool): Only update if currently empty
+        shift_days (str|int): Shift mode - move dates by this many days instead
+        working_days (str|bool): Shift mode - count working days only
+        include_descendants (str|bool): Shift mode - also move all sub-tasks
+        include_dependents (str|bool): Shift mode - also move dependent tasks
+        preview (str|bool): Shift mode - return old/new dates without saving
+        expected_modified (str|dict): Optional {task_id: modified} the client saw
 
     Returns:
-        dict: {"success": bool, "updated": int, "skipped": int, "failed": int, "errors": list}
+        dict: {"success": bool, "updated": int, "skipped": int, "failed": int, "conflicts": list, "errors": list}
+        (shift preview adds "changes": list of old/new dates per task)
     """
     import json
     from frappe.utils import getdate
@@ -356,6 +464,31 @@ def bulk_update_task_dates(task_ids, exp_start_date=None, exp_end_date=None, onl
         task_ids = json.loads(task_ids)
 
     only_empty = parse_bool(only_empty)
+    expected = parse_expected_modified(expected_modified)
+    task_ids = sorted(set(task_ids))
+
+    # Shift mode: set-based move by an offset (see reschedule.py)
+    if shift_days not in (None, ""):
+        if exp_start_date or exp_end_date:
+            frappe.throw("Provide either new dates or a shift, not both")
+        try:
+            shift_days = int(str(shift_days).strip())
+        except ValueError:
+            frappe.throw(f"Invalid shift: {shift_days}")
+        if not shift_days:
+            frappe.throw("Shift must be a non-zero number of days")
+        return run_with_retry(lambda: shift_task_dates(
+            task_ids,
+            shift_days,
+            working_days=parse_bool(working_days),
+            include_descendants=parse_bool(include_descendants),
+            include_dependents=parse_bool(include_dependents),
+            preview=parse_bool(preview),
+            expected_modified=expected
+        )) or busy_response(task_ids)
+
+    if not (exp_start_date or exp_end_date):
+        frappe.throw("Provide new dates or a shift")
 
     # Validate and convert dates using Frappe's getdate (handles various formats)
     if exp_start_date:
@@ -374,59 +507,114 @@ def bulk_update_task_dates(task_ids, exp_start_date=None, exp_end_date=None, onl
     if exp_start_date and exp_end_date and exp_end_date < exp_start_date:
         frappe.throw("Expected End Date must be greater than or equal to Expected Start Date")
 
-    updated = 0
-    skipped = 0
-    failed = 0
-    errors = []
-
-    # Process in batches of 10
-    for i in range(0, len(task_ids), 10):
-        batch = task_ids[i:i+10]
-
-        for task_id in batch:
-            try:
-                # Get task document
-                task = frappe.get_doc("Task", task_id)
-
-                # Check write permission
-                if not frappe.has_permission("Task", "write", task):
-                    failed += 1
-                    errors.append(f"{task_id}: Permission denied")
-                    continue
+    audit = is_bulk_audit_enabled()
+
+    def apply():
+        updated = 0
+        skipped = 0
+        failed = 0
+        errors = []
+        conflicts = []
+        projects = set()
+        task_changes = {}
+
+        # Row locks in deterministic order before the first write, including
+        # the tasks and projects Task.on_update cascades to
+        locked = lock_for_save(task_ids)
+
+        # Audit mode: the tasks Task.on_update saves in cascade skip their
+        # Version too and are recorded in the same Bulk Operation Log
+        with capture_cascaded_saves(audit) as cascaded:
+            # Process in batches of 10
+            for i in range(0, len(task_ids), 10):
+                batch = task_ids[i:i+10]
+
+                for task_id in batch:
+                    if task_id not in locked:
+                        failed += 1
+                        errors.append(f"{task_id}: Task not found")
+                        continue
 
-                # Check if should skip due to only_empty mode
-                should_skip = False
-                if only_empty:
-                    if exp_start_date and task.exp_start_date:
-                        should_skip = True
-                    if exp_end_date and task.exp_end_date:
-                        should_skip = True
+                    # Optimistic concurrency: skip tasks changed since the client loaded them
+                    if is_conflict(locked[task_id], expected.get(task_id)):
+                        conflicts.append(make_conflict(task_id, locked[task_id]))
+                        continue
 
-                if should_skip:
-                    skipped += 1
-                    continue
+                    try:
+                        # Get task document
+                        task = frappe.get_doc("Task", task_id)
+
+                        # Check write permission
+                        if not frappe.has_permission("Task", "write", task):
+                            failed += 1
+                            errors.append(f"{task_id}: Permission denied")
+                            continue
+
+                        # Check if should skip due to only_empty mode
+                        should_skip = False
+                        if only_empty:
+                            if exp_start_date and task.exp_start_date:
+                                should_skip = True
+                            if exp_end_date and task.exp_end_date:
+                                should_skip = True
+
+                        if should_skip:
+                            skipped += 1
+                            continue
+
+                        old_values = {"exp_start_date": task.exp_start_date, "exp_end_date": task.exp_end_date}
+
+                        # Update dates
+                        if exp_start_date:
+                            task.exp_start_date = exp_start_date
+                        if exp_end_date:
+                            task.exp_end_date = exp_end_date
+
+                        # Save task (project is updated once below, locked last)
+                        task.flags.from_project = True
+                        # Audit mode: one Bulk Operation Log instead of a Version per task
+                        task.flags.ignore_version = audit
+                        task.save()
+                        projects.add(task.project)
+                        updated += 1
+                        if audit:
+                            task_changes[task_id] = (task.project, get_field_changes(old_values, task))
+
+                    except RETRYABLE_ERRORS:
+                        raise
+                    except frappe.TimestampMismatchError:
+                        conflicts.append(make_conflict(task_id, locked[task_id]))
+                    except Exception as e:
+                        failed += 1
+                        errors.append(f"{task_id}: {str(e)}")
+                        frappe.log_error(f"Bulk date update failed for {task_id}: {str(e)}", "Bulk Date Update Error")
 
-                # Update dates
-                if exp_start_date:
-                    task.exp_start_date = exp_start_date
-                if exp_end_date:
-                    task.exp_end_date = exp_end_date
+            update_projects(projects)
+        if audit:
+            record_bulk_operation("Date Update", merge_task_changes(task_changes, cascaded))
+        return {
+            "success": failed == 0 and not conflicts,
+            "updated": updated,
+            "skipped": skipped,
+            "failed": failed,
+            "conflicts": conflicts,
+            "errors": errors
+        }
 
-                # Save task
-                task.save()
-                updated += 1
+    return run_with_retry(apply) or busy_response(task_ids)
 
-            except Exception as e:
-                failed += 1
-                errors.append(f"{task_id}: {str(e)}")
-                frappe.log_error(f"Bulk date update failed for {task_id}: {str(e)}", "Bulk Date Update Error")
 
+# -------------------- busy_response --------------------
+# Result returned when every retry ended as a deadlock victim
+# --------------------------------------------------------
+def busy_response(task_ids):
     return {
-        "success": failed == 0,
-        "updated": updated,
-        "skipped": skipped,
-        "failed": failed,
-        "errors": errors
+        "success": False,
+        "updated": 0,
+        "skipped": 0,
+        "failed": len(task_ids),
+        "conflicts": [],
+        "errors": ["These tasks are being updated by someone else right now. Please try again."]
     }
 
 
@@ -470,6 +658,8 @@ def assign_tasks(task_ids, user):
     already_assigned = 0
     failed = 0
     errors = []
+    audit = is_bulk_audit_enabled()
+    to_assign = []
 
     # Get existing assignments for all tasks in one query
     existing_assignments = frappe.get_all(
@@ -501,6 +691,11 @@ def assign_tasks(task_ids, user):
                     already_assigned += 1
                     continue
 
+                # Audit mode: assigned set-based below (no comment per task)
+                if audit:
+                    to_assign.append(task_id)
+                    continue
+
                 # Assign using Frappe's native API
                 from frappe.desk.form.assign_to import add
                 add({
@@ -516,6 +711,10 @@ def assign_tasks(task_ids, user):
                 errors.append(f"{task_id}: {str(e)}")
                 frappe.log_error(f"Assignment failed for {task_id}: {str(e)}", "Task Assignment Error")
 
+    # One ToDo insert, one notification and one Bulk Operation Log
+    if to_assign:
+        assigned += insert_assignments(list(dict.fromkeys(to_assign)), user)
+
     return {
         "success": failed == 0,
         "assigned": assigned,
@@ -565,6 +764,8 @@ def unassign_tasks(task_ids, users):
     not_assigned = 0
     failed = 0
     errors = []
+    audit = is_bulk_audit_enabled()
+    to_remove = []
 
     # Get existing assignments for all tasks in one query
     existing_assignments = frappe.get_all(
@@ -606,6 +807,11 @@ def unassign_tasks(task_ids, users):
                         not_assigned += 1
                         continue
 
+                    # Audit mode: removed set-based below (no comment per task)
+                    if audit:
+                        to_remove.append((task_id, user_to_remove))
+                        continue
+
                     try:
                         # Remove using Frappe's native API
                         from frappe.desk.form.assign_to import remove
@@ -620,6 +826,10 @@ def unassign_tasks(task_ids, users):
                 errors.append(f"{task_id}: {str(e)}")
                 frappe.log_error(f"Unassignment failed for {task_id}: {str(e)}", "Task Unassignment Error")
 
+    # One ToDo update and one Bulk Operation Log
+    if to_remove:
+        removed += cancel_assignments(list(dict.fromkeys(to_remove)))
+
     return {
         "success": failed == 0,
         "removed": removed,
@@ -631,15 +841,16 @@ def unassign_tasks(task_ids, users):
 
 # -------------------- execute --------------------
 # Main report execution function
-# Fetches projects and tasks, builds tree structure
+# Fetches projects and serves task rows from Project Overview Snapshot
 # Returns columns and data for the report display
+# Runs on the read replica when configured (see replica.py)
 # ------------------------------------------------
+@fresh_reads
 def execute(filters=None):
     if not filters:
         filters = {}
 
     data = []
-    all_task_names = []  # Collect all task names for batch assignment fetch
     project_filters = {}
     if filters.get("project"):
         project_filters["name"] = filters.get("project")
@@ -647,117 +858,60 @@ def execute(filters=None):
     # fetch projects with percent_complete for progress bar
     projects = frappe.get_all("Project", fields=["name", "project_name", "percent_complete"], filters=project_filters)
 
-    # Handle assigned_to filter - get task IDs assigned to selected users (multi-select)
-    assigned_to_values = parse_multi_select(filters.get("assigned_to"))
-    assigned_task_ids = None
-    if assigned_to_values:
-        assigned_tasks = frappe.get_all(
-            "ToDo",
-            filters={
-                "reference_type": "Task",
-                "allocated_to": ["in", assigned_to_values],
-                "status": "Open"
-            },
-            pluck="reference_name"
-        )
-        assigned_task_ids = set(assigned_tasks) if assigned_tasks else set()
+    # Projects only (collapsed view): project rows without loading any task row
+    projects_only = filters.get("projects_only")
 
-    # First pass: collect all tasks per project
+    # assigned_to / search filters restrict the task set (None = no restriction)
+    search_text = (filters.get("search") or "").strip()
     project_tasks = {}
-    for p in projects:
-        # Build task filter
-        task_filters = {"project": p.name}
-
-        # Handle status filtering (multi-select)
-        status_values = parse_multi_select(filters.get("status"))
-        if status_values:
-            task_filters["status"] = ["in", status_values]
-        elif not filters.get("show_completed_tasks"):
-            # No specific status selected AND show_completed unchecked - hide completed
-            task_filters["status"] = ["not in", ["Completed", "Cancelled"]]
-
-        # Apply assigned_to filter if set
-        if assigned_task_ids is not None:
-            if not assigned_task_ids:
-                # No tasks assigned to selected users - skip this project
-                continue
-            task_filters["name"] = ["in", list(assigned_task_ids)]
-
-        # fetch tasks for this project
-        tasks = frappe.get_all(
-            "Task",
-            filters=task_filters,
-            fields=["name", "subject", "custom_next_action", "type", "priority", "status", "exp_start_date", "exp_end_date", "progress", "parent_task"]
+    task_ids = None
+    if not projects_only:
+        task_ids = get_filtered_task_ids(filters)
+
+        # Single indexed scan of the snapshot, already in tree order
+        # (search hits come with their ancestors so the tree stays readable)
+        if task_ids is None or task_ids:
+            project_tasks = get_snapshot_task_rows(filters, task_ids, with_ancestors=bool(search_text))
+
+    # Aggregate columns in one grouped query, from the project filter alone
+    # (independent of the task rows, so they are there in the collapsed view)
+    show_summary = filters.get("show_project_summary")
+    project_aggregates = {}
+    if show_summary:
+        project_aggregates = get_project_aggregates([p.name for p in projects])
+
+    # Progress trend (last 90 days) for all visible projects in one range query
+    show_trend = filters.get("show_progress_trend")
+    project_trends = {}
+    if show_trend:
+        project_trends = get_progress_trends(
+            [p.name for p in projects if projects_only or project_tasks.get(p.name)]
         )
 
-        if tasks:
-            project_tasks[p.name] = {"project": p, "tasks": tasks}
-            all_task_names.extend([t.name for t in tasks])
-
-    # Batch fetch all assignments for all tasks with user full names
-    task_assignments = {}
-    if all_task_names:
-        assignments = frappe.get_all(
-            "ToDo",
-            filters={
-                "reference_type": "Task",
-                "reference_name": ["in", all_task_names],
-                "status": "Open"
-            },
-            fields=["reference_name", "allocated_to"]
-        )
+    # Critical path (earliest/latest finish, slack) from Task dependencies
+    show_critical_path = filters.get("show_critical_path")
+    schedule, cycles = {}, {}
+    if show_critical_path:
+        schedule, cycles = get_critical_path([p.name for p in projects if project_tasks.get(p.name)])
 
-        # Get full names for all assigned users
-        assigned_users = list(set([a.allocated_to for a in assignments]))
-        user_names = {}
-        if assigned_users:
-            users = frappe.get_all(
-                "User",
-                filters={"name": ["in", assigned_users]},
-                fields=["name", "full_name"]
-            )
-            user_names = {u.name: u.full_name or u.name for u in users}
-
-        # Group assignments by task (store as "email:full_name" for client parsing)
-        for assignment in assignments:
-            task_name = assignment.reference_name
-            if task_name not in task_assignments:
-                task_assignments[task_name] = []
-            email = assignment.allocated_to
-            full_name = user_names.get(email, email)
-            task_assignments[task_name].append(f"{email}:{full_name}")
-
-    # Second pass: build data with assignments
-    for project_name, project_data in project_tasks.items():
-        p = project_data["project"]
-        tasks = project_data["tasks"]
-
-        # Use Project's percent_complete field for progress bar
-        project_progress = round(p.percent_complete or 0)
+    for p in projects:
+        task_rows = project_tasks.get(p.name)
+        if not task_rows and not projects_only:
+            continue
 
         # Project node (parent row)
-        project_node = {
-            "indent": 0,
-            "project": "",  # Empty for project rows - ID shown in task_link
-            "task_link": f"<a href='/app/project/{p.name}' target='_blank'><b>{p.name}</b> - {p.project_name}</a>",
-            "custom_next_action": "",
-            "status": "",
-            "priority": "",
-            "assigned_to": "",
-            "expected_end_date": "",
-            "progress": project_progress,  # Smart progress: project % for project rows
-            "is_project": 1,  # Flag for formatter to render as progress bar
-            "name": p.name,
-            # Commented out fields - Option B minimal view
-            # "type": "",
-            # "expected_start_date": "",
-            # "actions": "",
-        }
+        project_node = make_project_row(p)
+        if show_summary:
+            project_node.update(project_aggregates.get(p.name, {}))
+        if show_trend:
+            project_node.update(project_trends.get(p.name, {}))
         data.append(project_node)
-
-        # build and flatten the task tree with assignments
-        task_tree = build_task_tree(tasks)
-        data.extend(flatten_task_tree(task_tree, indent=1, task_assignments=task_assignments))
+        if not task_rows:
+            continue
+        if show_critical_path:
+            for row in task_rows:
+                row.update(schedule.get(row["name"], {}))
+        data.extend(task_rows)
 
     # column definitions - Option B minimal view
     columns = [
@@ -774,70 +928,277 @@ def execute(filters=None):
         # {"label": "E. Start", "fieldname": "expected_start_date", "fieldtype": "Date", "width": 90},
         # {"label": "Actions", "fieldname": "actions", "fieldtype": "Data", "width": 150},
     ]
+
+    # Optional project summary columns (filled on project rows only)
+    if show_summary:
+        columns.extend([
+            {"label": "Open", "fieldname": "open_tasks", "fieldtype": "Int", "width": 60},
+            {"label": "Working", "fieldname": "working_tasks", "fieldtype": "Int", "width": 70},
+            {"label": "Overdue", "fieldname": "overdue_tasks", "fieldtype": "Int", "width": 70},
+            {"label": "Done", "fieldname": "completed_tasks", "fieldtype": "Int", "width": 60},
+            {"label": "Late", "fieldname": "late_tasks", "fieldtype": "Int", "width": 60},
+            {"label": "People", "fieldname": "assignee_count", "fieldtype": "Int", "width": 65},
+            {"label": "Next Due", "fieldname": "next_due_date", "fieldtype": "Date", "width": 90},
+        ])
+
+    # Optional progress trend column (sparkline, filled on project rows only)
+    if show_trend:
+        columns.append({"label": "Trend (90d)", "fieldname": "progress_trend", "fieldtype": "Data", "width": 110})
+
+    # Optional critical path columns (filled on task rows only)
+    if show_critical_path:
+        columns.extend([
+            {"label": "E. Finish", "fieldname": "earliest_finish", "fieldtype": "Date", "width": 90},
+            {"label": "L. Finish", "fieldname": "latest_finish", "fieldtype": "Date", "width": 90},
+            {"label": "Slack", "fieldname": "slack", "fieldtype": "Int", "width": 60},
+        ])
+
+    # Dependency cycles cannot be scheduled - tell the user which tasks to fix
+    messages = [
+        f"Dependency cycle in <b>{project}</b>: {', '.join(tasks)}" for project, tasks in cycles.items()
+    ]
+    # Search results are capped - say so instead of silently dropping hits
+    if search_text and not projects_only and task_ids and len(task_ids) >= SEARCH_LIMIT:
+        messages.append(f"Showing the best {SEARCH_LIMIT} search matches only. Refine the search to see others.")
+    if messages:
+        return columns, data, "<br>".join(messages)
     return columns, data
 
 
-# -------------------- build_task_tree --------------------
-# Converts flat task list into nested tree structure
-# Organizes tasks by parent-child relationships
-# Returns: Dictionary with top-level tasks as keys
-# ---------------------------------------------------------
-def build_task_tree(tasks):
-    """Convert flat task list into nested dict by parent_task"""
-    tree = {}
-    lookup = {}
+# -------------------- get_project_aggregates --------------------
+# Computes per-project task counts for all given projects at once
+# Single GROUP BY over Task (left join open ToDo for assignees)
+# - open/working/overdue/completed: counts by task status
+# - late: not completed/cancelled and exp_end_date before today
+# - assignee_count: distinct users with open assignments
+# - next_due_date: earliest upcoming exp_end_date of unfinished tasks
+# Counts cover all tasks of the project, independent of task filters
+# Returns: {project_name: {fieldname: value}}
+# -----------------------------------------------------------------
+def get_project_aggregates(project_names):
+    """Aggregate task counts per project with one grouped query"""
+    if not project_names:
+        return {}
+
+    rows = frappe.db.sql(
+        """
+        select
+            t.project,
+            count(distinct case when t.status = 'Open' then t.name end) as open_tasks,
+            count(distinct case when t.status = 'Working' then t.name end) as working_tasks,
+            count(distinct case when t.status = 'Overdue' then t.name end) as overdue_tasks,
+            count(distinct case when t.status = 'Completed' then t.name end) as completed_tasks,
+            count(distinct case
+                when t.status not in ('Completed', 'Cancelled') and t.exp_end_date < %(today)s
+                then t.name end) as late_tasks,
+            count(distinct td.allocated_to) as assignee_count,
+            min(case
+                when t.status not in ('Completed', 'Cancelled') and t.exp_end_date >= %(today)s
+                then t.exp_end_date end) as next_due_date
+        from `tabTask` t
+        left join `tabToDo` td
+            on td.reference_type = 'Task' and td.reference_name = t.name and td.status = 'Open'
+        where t.project in %(projects)s
+        group by t.project
+        """,
+        {"projects": project_names, "today": frappe.utils.today()},
+        as_dict=True
+    )
+    return {r.pop("project"): r for r in rows}
+
+
+# -------------------- get_snapshot_task_rows --------------------
+# Reads visible tasks from Project Overview Snapshot in one query
+# Rows arrive ordered by (project, sort_key) = tree pre-order
+# Indent counts only ancestors that are visible with the current
+# filters, so a task whose parent is hidden moves up a level
+# With progress_rollup, parent rows show the rolled-up progress
+# (progress_rollup.py, computed from the same query)
+# Returns: {project_name: [report rows]}
+# -----------------------------------------------------------------
+def get_snapshot_task_rows(filters, assigned_task_ids=None, with_ancestors=False):
+    """Fetch report task rows per project from the snapshot table"""
+    project_filters = {}
+    if filters.get("project"):
+        project_filters["project"] = filters.get("project")
+    snapshot_filters = get_snapshot_filters(filters, assigned_task_ids)
+
+    fields = ["task", "project", "subject", "custom_next_action", "status", "priority",
+              "exp_start_date", "exp_end_date", "progress", "sort_key", "assigned_to", "modified"]
+
+    # Progress rollup needs whole trees (incl. hidden descendants): read all
+    # rows of the projects in the same single query and filter them here
+    rollup = filters.get("progress_rollup")
+    rolled_up = {}
+    all_tasks = {}
+    if rollup in ROLLUP_WEIGHTINGS:
+        rows = frappe.get_all(
+            SNAPSHOT_DOCTYPE,
+            filters=project_filters,
+            fields=fields,
+            order_by="project asc, sort_key asc"
+        )
+        rolled_up = rollup_progress(rows, rollup)
+        all_tasks = {t.task: t for t in rows}
+        tasks = [t for t in rows if matches_task_filters(t, snapshot_filters)]
+    else:
+        tasks = frappe.get_all(
+            SNAPSHOT_DOCTYPE,
+            filters=snapshot_filters,
+            fields=fields,
+            order_by="project asc, sort_key asc"
+        )
 
-    # Single loop: build lookup and initialize children
+    # Ancestors of the rows (by primary key, ignoring status filters)
+    context = set()
+    if with_ancestors and tasks:
+        visible = {t.task for t in tasks}
+        ancestor_ids = {a for t in tasks if t.sort_key for a in t.sort_key.split("/")[:-1]} - visible
+        if ancestor_ids:
+            if all_tasks:
+                tasks.extend(all_tasks[a] for a in ancestor_ids if a in all_tasks)
+            else:
+                tasks.extend(
+                    frappe.get_all(SNAPSHOT_DOCTYPE, filters={"task": ["in", list(ancestor_ids)]}, fields=fields)
+                )
+            tasks.sort(key=lambda t: (t.project, t.sort_key or ""))
+            context = ancestor_ids
+
+    visible = {t.task for t in tasks}
+    project_tasks = {}
     for t in tasks:
-        t["children"] = []
-        lookup[t["name"]] = t
+        ancestors = t.sort_key.split("/")[:-1] if t.sort_key else []
+        indent = 1 + sum(1 for a in ancestors if a in visible)
+        row = make_task_row(t, indent)
+        if t.task in context:
+            row["search_context"] = 1  # Shown only as a path to a search hit
+        if t.task in rolled_up:
+            row["progress"] = rolled_up[t.task]
+            row["progress_rollup"] = 1  # Formatter marks rolled-up values
+        project_tasks.setdefault(t.project, []).append(row)
+    return project_tasks
+
+
+# -------------------- get_filtered_task_ids --------------------
+# Task set allowed by the assigned_to (open ToDos of the selected users)
+# and search (full-text, see search.py) filters
+# Returns: None when neither filter is set, else a set of task names
+# -----------------------------------------------------------------
+def get_filtered_task_ids(filters):
+    assigned_to_values = parse_multi_select(filters.get("assigned_to"))
 
-    # Build hierarchy
-    for t in tasks:
-        if t.get("parent_task") and t["parent_task"] in lookup:
-            lookup[t["parent_task"]]["children"].append(t)
-        else:
-            tree[t["name"]] = t
-
-    return tree
-
-
-# -------------------- flatten_task_tree --------------------
-# Recursively flattens task tree for report display
-# Adds indent level and formats task links
-# Returns: List of row dictionaries for the report
-# -----------------------------------------------------------
-def flatten_task_tree(tree, indent=1, task_assignments=None):
-    """Flatten tree recursively for display"""
-    if task_assignments is None:
-        task_assignments = {}
-
-    result = []
-    for name, t in tree.items():
-        task_link = f"<a href='/app/task/{t['name']}' target='_blank'>{t['subject']}</a>"
-
-        # Get assignments for this task (comma-separated for formatter)
-        assignees = task_assignments.get(t["name"], [])
-        assigned_to = ",".join(assignees) if assignees else ""
-
-        row = {
-            "indent": indent,
-            "project": "",
-            "task_link": task_link,
-            "custom_next_action": t.get("custom_next_action", ""),
-            "status": t.get("status"),
-            "priority": t.get("priority", ""),
-            "assigned_to": assigned_to,
-            "expected_end_date": t.get("exp_end_date"),
-            "progress": t.get("progress"),  # Smart progress: task % for task rows
-            "is_project": 0,  # Flag for formatter
-            "name": t["name"],
-            # Commented out fields - Option B minimal view
-            # "type": t.get("type", "Task"),
-            # "expected_start_date": t.get("exp_start_date"),
-            # "actions": "",
-        }
-        result.append(row)
-        if t["children"]:
-            result.extend(flatten_task_tree({c["name"]: c for c in t["children"]}, indent + 1, task_assignments))
-    return result
+    # Search applies the status / assigned_to filters in its own query,
+    # so its result limit only counts visible tasks
+    search_text = (filters.get("search") or "").strip()
+    if search_text:
+        return set(search_tasks(
+            search_text,
+            filters.get("project"),
+            status=get_snapshot_filters(filters).get("status"),
+            assigned_to=assigned_to_values
+        ))
+
+    if assigned_to_values:
+        return set(frappe.get_all(
+            "ToDo",
+            filters={
+                "reference_type": "Task",
+                "allocated_to": ["in", assigned_to_values],
+                "status": "Open"
+            },
+            pluck="reference_name"
+        ))
+    return None
+
+
+# -------------------- get_snapshot_filters --------------------
+# Snapshot filters for project, status (completed/cancelled hidden
+# unless shown or selected) and an optional task set
+# ---------------------------------------------------------------
+def get_snapshot_filters(filters, task_ids=None):
+    snapshot_filters = {}
+    if filters.get("project"):
+        snapshot_filters["project"] = filters.get("project")
+
+    # Handle status filtering (multi-select)
+    status_values = parse_multi_select(filters.get("status"))
+    if status_values:
+        snapshot_filters["status"] = ["in", status_values]
+    elif not filters.get("show_completed_tasks"):
+        # No specific status selected AND show_completed unchecked - hide completed
+        snapshot_filters["status"] = ["not in", ["Completed", "Cancelled"]]
+
+    # Apply assigned_to / search task set if given
+    if task_ids is not None:
+        snapshot_filters["task"] = ["in", list(task_ids)]
+    return snapshot_filters
+
+
+# -------------------- matches_task_filters --------------------
+# In-memory version of the status/task filters built above
+# ---------------------------------------------------------------
+def matches_task_filters(t, snapshot_filters):
+    for fieldname in ("status", "task"):
+        if fieldname not in snapshot_filters:
+            continue
+        operator, values = snapshot_filters[fieldname]
+        if (t[fieldname] in values) != (operator == "in"):
+            return False
+    return True
+
+
+# -------------------- make_project_row --------------------
+# Builds the header row of a project (progress bar from percent_complete)
+# ----------------------------------------------------------
+def make_project_row(p):
+    """Build a project row for display"""
+    # Use Project's percent_complete field for progress bar
+    project_progress = round(p.percent_complete or 0)
+
+    return {
+        "indent": 0,
+        "project": "",  # Empty for project rows - ID shown in task_link
+        "task_link": f"<a href='/app/project/{p.name}' target='_blank'><b>{p.name}</b> - {p.project_name}</a>",
+        "custom_next_action": "",
+        "status": "",
+        "priority": "",
+        "assigned_to": "",
+        "expected_end_date": "",
+        "progress": project_progress,  # Smart progress: project % for project rows
+        "is_project": 1,  # Flag for formatter to render as progress bar
+        "name": p.name,
+        # Commented out fields - Option B minimal view
+        # "type": "",
+        # "expected_start_date": "",
+        # "actions": "",
+    }
+
+
+# -------------------- make_task_row --------------------
+# Builds a report row for a task at the given indent level
+# Formats the task link; assigned_to is "email:full_name,..." for formatter
+# -------------------------------------------------------
+def make_task_row(t, indent):
+    """Build a single task row for display"""
+    task_link = f"<a href='/app/task/{t['task']}' target='_blank'>{t['subject']}</a>"
+
+    return {
+        "indent": indent,
+        "project": "",
+        "task_link": task_link,
+        "custom_next_action": t.get("custom_next_action", ""),
+        "status": t.get("status"),
+        "priority": t.get("priority", ""),
+        "assigned_to": t.get("assigned_to") or "",
+        "expected_end_date": t.get("exp_end_date"),
+        "progress": t.get("progress"),  # Smart progress: task % for task rows
+        "is_project": 0,  # Flag for formatter
+        "name": t["task"],
+        # Version token for optimistic concurrency in bulk updates: the
+        # snapshot row is rewritten in the same transaction as every task change
+        "modified": str(t.get("modified") or ""),
+        # Commented out fields - Option B minimal view
+        # "type": t.get("type", "Task"),
+        # "expected_start_date": t.get("exp_start_date"),
+        # "actions": "",
+    }
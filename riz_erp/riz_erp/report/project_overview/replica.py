@@ -0,0 +1,128 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+"""
+Project Overview - Read replica routing with a freshness guard
+==============================================================
+Frappe runs Script Reports through `frappe.desk.query_report.run`, which is
+decorated with `@frappe.read_only()`: when the site has `read_from_replica`
+configured, execute() already reads from the replica while all whitelisted
+write endpoints stay on the primary.
+
+A replica can lag behind, so a user who just updated tasks could refresh
+the report and not see their change. This module adds a read-your-writes
+guard:
+- Every Task/ToDo/Project write or delete stamps the writing user
+  (doc_events) when its transaction commits
+- Within `project_overview_replica_max_lag` seconds of the user's last write,
+  the report checks the replica lag (optionally waiting up to
+  `project_overview_replica_wait` seconds for it to catch up)
+- If the replica has not applied the write yet, the read goes to the primary
+
+Site config (site_config.json):
+- read_from_replica / replica_host: Frappe's replica settings
+- project_overview_replica_max_lag: Guard window in seconds (default 10)
+- project_overview_replica_wait: Max seconds to wait for the replica (default 0)
+
+Main Functions:
+- fresh_reads(): Decorator for read paths (report execute functions)
+- mark_user_write(): doc_events hook recording the user's last write
+"""
+
+import functools
+import time
+
+import frappe
+
+LAST_WRITE_KEY = "riz_erp:project_overview:last_write"
+LAST_WRITE_FLAG = "riz_erp_last_write_pending"
+
+DEFAULT_MAX_LAG = 10
+REPLICA_POLL_INTERVAL = 0.2
+
+
+# -------------------- mark_user_write --------------------
+# doc_events hook: remembers when the current user last wrote data
+# the report shows (also called by set-based bulk updates)
+# The time is taken when the transaction commits: stamped earlier, a long
+# transaction could commit after the replica already looked fresh
+# ----------------------------------------------------------
+def mark_user_write(doc=None, method=None):
+    """Stamp the current user's last write time once the transaction commits"""
+    # One callback per transaction; a rollback discards it
+    if frappe.flags.get(LAST_WRITE_FLAG):
+        return
+    frappe.flags[LAST_WRITE_FLAG] = True
+    frappe.db.after_commit.add(functools.partial(set_last_write, frappe.session.user))
+    frappe.db.after_rollback.add(clear_last_write_flag)
+
+
+def set_last_write(user):
+    clear_last_write_flag()
+    frappe.cache.set_value(f"{LAST_WRITE_KEY}:{user}", time.time(), expires_in_sec=get_max_lag() + 60)
+
+
+def clear_last_write_flag():
+    frappe.flags.pop(LAST_WRITE_FLAG, None)
+
+
+# -------------------- fresh_reads --------------------
+# Decorator: runs a read-only function on the replica unless the
+# current user wrote recently and the replica has not caught up
+# -----------------------------------------------------
+def fresh_reads(fn):
+    """Route the wrapped read to the primary when the replica is stale for this user"""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        primary_db = getattr(frappe.local, "primary_db", None)
+        if not primary_db or frappe.local.db is primary_db or replica_is_fresh():
+            return fn(*args, **kwargs)
+
+        replica_db = frappe.local.db
+        frappe.local.db = primary_db
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            frappe.local.db = replica_db
+
+    return wrapper
+
+
+# -------------------- replica_is_fresh --------------------
+# True when the replica already contains the user's last write
+# (or the user has not written within the guard window)
+# -----------------------------------------------------------
+def replica_is_fresh():
+    """Check (and optionally wait) until the replica covers the user's last write"""
+    last_write = frappe.cache.get_value(f"{LAST_WRITE_KEY}:{frappe.session.user}")
+    if not last_write or time.time() - last_write > get_max_lag():
+        return True
+
+    deadline = time.time() + (frappe.conf.get("project_overview_replica_wait") or 0)
+    while True:
+        lag = get_replica_lag()
+        # Replica has applied everything older than `lag` seconds
+        if lag is not None and time.time() - lag > last_write:
+            return True
+        if time.time() >= deadline:
+            return False
+        time.sleep(REPLICA_POLL_INTERVAL)
+
+
+# -------------------- get_replica_lag --------------------
+# Seconds_Behind_Master of the current (replica) connection
+# Returns None when unknown (no privilege / replication stopped)
+# ----------------------------------------------------------
+def get_replica_lag():
+    """Replication lag of the replica connection in seconds"""
+    try:
+        status = frappe.db.sql("show slave status", as_dict=True)
+    except Exception:
+        return None
+    if not status:
+        return None
+    return status[0].get("Seconds_Behind_Master")
+
+
+def get_max_lag():
+    return frappe.conf.get("project_overview_replica_max_lag") or DEFAULT_MAX_LAG
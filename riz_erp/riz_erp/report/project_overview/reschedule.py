@@ -0,0 +1,455 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+"""
+Project Overview Report - Shift task dates by an offset
+=======================================================
+Shift mode of bulk_update_task_dates(): moves the selected tasks by N
+calendar or working days, keeping each task's duration (in working days
+when shifting by working days: the end is recomputed from the new start).
+
+How it works:
+- Optionally adds all descendants (one lft/rgt query) and, transitively,
+  all dependent tasks (one Task Depends On query per dependency level;
+  the parent -> child rows ERPNext adds for sub-tasks are not followed)
+- Dependent tasks that are not shifted themselves are pushed after their
+  moved predecessors the way Task.reschedule_dependent_tasks does on save
+  (Open tasks starting before a predecessor's new end date move to the day
+  after it, keeping their calendar duration)
+- New dates are computed in Python, then written with one CASE UPDATE per
+  500 tasks to Task and to the Project Overview Snapshot
+- preview=True returns the old/new dates without writing anything
+- In bulk audit mode the old/new dates are recorded in one Bulk Operation Log
+
+Guards:
+- All affected Task rows are locked in name order before dates are read;
+  tasks changed since the client loaded them are returned as conflicts
+- Completed/Cancelled tasks and tasks without dates are skipped
+- Tasks the user cannot write (per-task permission check) or see
+  (permission query) are reported as failed
+- A moved task whose dependent would have to be pushed but cannot be
+  (no write permission, or the pushed dates break a rule below) fails
+- A task that would end after its (unmoved) parent task fails, as on save
+- So does a task whose start would come after its end, or whose new dates
+  fall outside its project's expected start/end dates (Task.validate checks
+  the first and the project end; the set-based write does not run it)
+
+Working days skip the holidays of the default company's Holiday List,
+or Saturdays/Sundays when no Holiday List is set.
+
+Main Functions:
+- shift_task_dates(): Compute (and apply) the shift for a selection
+- collect_tasks(): Selection + descendants + dependents (writable only)
+- push_dependents(): Dependents pushed after their moved predecessors
+- validate_new_dates(): Task/project date rules for the new dates
+- add_working_days(): Move a date by N working days
+"""
+
+import frappe
+from frappe.utils import add_days, date_diff, getdate, now
+
+from riz_erp.riz_erp.doctype.bulk_operation_log.bulk_operation_log import (
+    is_bulk_audit_enabled,
+    record_bulk_operation,
+)
+from riz_erp.riz_erp.doctype.project_overview_snapshot.project_overview_snapshot import (
+    DOCTYPE as SNAPSHOT_DOCTYPE,
+    bump_data_version,
+)
+from riz_erp.riz_erp.report.project_overview.concurrency import is_conflict, lock_tasks, make_conflict
+from riz_erp.riz_erp.report.project_overview.replica import mark_user_write
+
+UPDATE_BATCH_SIZE = 500
+
+SKIPPED_STATUSES = ("Completed", "Cancelled")
+
+
+# -------------------- shift_task_dates --------------------
+# Moves tasks by shift_days (calendar or working days)
+# Returns: Dict with counts, errors and (preview) the date changes
+# -----------------------------------------------------------
+def shift_task_dates(task_ids, shift_days, working_days=False, include_descendants=False,
+                     include_dependents=False, preview=False, expected_modified=None):
+    """Shift expected dates of tasks (and optionally their subtrees/dependents)
+
+    Args:
+        task_ids (list): Selected task IDs
+        shift_days (int): Offset, negative moves tasks earlier
+        working_days (bool): Count only working days
+        include_descendants (bool): Also move all sub-tasks
+        include_dependents (bool): Also move tasks depending on moved tasks
+        preview (bool): Only return the changes
+        expected_modified (dict): Optional {task_id: modified datetime} the client saw
+
+    Returns:
+        dict: {"success": bool, "updated": int, "skipped": int, "failed": int, "conflicts": list,
+               "errors": list, "changes": list}
+    """
+    if not frappe.has_permission("Task", "write"):
+        frappe.throw("You do not have permission to update tasks")
+
+    names, denied = collect_tasks(task_ids, include_descendants, include_dependents)
+    # Dependents left out of the shift that a save would push later
+    followers, blocked = collect_tasks(names, include_dependents=True)
+    followers -= names
+    blocked -= names | set(denied)
+
+    # Row locks in name order before reading dates (not needed for a preview)
+    conflicts = []
+    if not preview:
+        locked = lock_tasks(names | followers)
+        for name, expected in (expected_modified or {}).items():
+            if name in names and is_conflict(locked.get(name), expected):
+                conflicts.append(make_conflict(name, locked[name]))
+        names -= {c["task"] for c in conflicts}
+
+    # Permission query conditions apply here: invisible tasks are not returned
+    tasks = frappe.get_list(
+        "Task",
+        filters={"name": ["in", list(names | followers | blocked)]},
+        fields=["name", "subject", "project", "status", "exp_start_date", "exp_end_date", "parent_task"],
+        limit_page_length=0
+    )
+    visible = {t.name for t in tasks}
+
+    errors = [f"{name}: Permission denied" for name in sorted(set(denied) | (names - visible))]
+    failed = len(errors)
+    skipped = 0
+
+    is_working_day = get_working_day_check() if working_days else None
+    changes = {}
+    for task in tasks:
+        if task.name not in names:
+            continue
+        if task.status in SKIPPED_STATUSES or not (task.exp_start_date or task.exp_end_date):
+            skipped += 1
+            continue
+        new_start, new_end = shift_task(task, shift_days, is_working_day)
+        changes[task.name] = make_change(task, new_start, new_end)
+
+    for name, error in check_new_dates(changes).items():
+        del changes[name]
+        failed += 1
+        errors.append(f"{name}: {error}")
+
+    # Push dependents like Task.on_update; a moved task whose dependent
+    # cannot be pushed fails, then the pushes are recomputed without it
+    others = [t for t in tasks if t.name in followers | blocked]
+    while True:
+        pushed, causes = push_dependents(changes, others)
+        invalid = {name: "Permission denied" for name in pushed if name in blocked}
+        invalid.update({name: error for name, error in check_new_dates(pushed, changes).items()})
+        if not invalid:
+            break
+        for name, error in sorted(invalid.items()):
+            for cause in sorted(causes[name] & set(changes)):
+                del changes[cause]
+                failed += 1
+                errors.append(f"{cause}: dependent task {name} cannot be rescheduled ({error})")
+    changes.update(pushed)
+
+    result = {
+        "success": failed == 0 and not conflicts,
+        "updated": len(changes),
+        "skipped": skipped,
+        "failed": failed,
+        "conflicts": conflicts,
+        "errors": errors
+    }
+    if preview:
+        result["changes"] = sorted(changes.values(), key=lambda c: (c["project"] or "", c["task"]))
+        return result
+
+    write_dates(list(changes.values()))
+    if changes:
+        mark_user_write()
+        if is_bulk_audit_enabled():
+            unit = "working day(s)" if working_days else "day(s)"
+            record_bulk_operation("Date Shift", {
+                name: (c["project"], {
+                    "exp_start_date": [c["old_start_date"], c["new_start_date"]],
+                    "exp_end_date": [c["old_end_date"], c["new_end_date"]],
+                })
+                for name, c in changes.items()
+            }, summary=f"Shifted {len(changes)} task(s) by {shift_days} {unit}")
+    return result
+
+
+# -------------------- check_new_dates --------------------
+# Parent end date rule (Task.validate_parent_expected_end_date, parents
+# not moved themselves) plus validate_new_dates()
+# Returns: {task: error}
+# ----------------------------------------------------------
+def check_new_dates(changes, moved=None):
+    """Date rules of a task save for new dates, `moved` being other changes"""
+    moved = {**(moved or {}), **changes}
+    errors = {}
+
+    parents = {c["parent_task"] for c in changes.values() if c["parent_task"] and c["parent_task"] not in moved}
+    if parents:
+        parent_end_dates = dict(frappe.get_all(
+            "Task", filters={"name": ["in", list(parents)]}, fields=["name", "exp_end_date"], as_list=True
+        ))
+        for name, change in changes.items():
+            parent_end = parent_end_dates.get(change["parent_task"])
+            if parent_end and change["new_end_date"] and getdate(change["new_end_date"]) > getdate(parent_end):
+                errors[name] = f"would end after parent task {change['parent_task']} ({parent_end})"
+
+    # Task.validate checks skipped by the set-based write
+    valid = [c for name, c in changes.items() if name not in errors]
+    errors.update(validate_new_dates(valid))
+    return errors
+
+
+# -------------------- push_dependents --------------------
+# Task.reschedule_dependent_tasks for the set-based write: Open dependents
+# (same project, both dates set) that start before a moved predecessor's
+# new end date start the day after it; repeated until nothing moves
+# Returns: ({task: change}, {task: set of moved tasks that caused it})
+# ----------------------------------------------------------
+def push_dependents(changes, tasks):
+    """Dependents outside `changes` pushed after their moved predecessors"""
+    tasks = {t.name: t for t in tasks if t.status == "Open" and t.exp_start_date and t.exp_end_date}
+    if not (tasks and changes):
+        return {}, {}
+
+    predecessors = {}
+    for parent, task in frappe.db.sql(
+        """
+        select d.parent, d.task
+        from `tabTask Depends On` d
+        inner join `tabTask` t on t.name = d.task
+        where d.parenttype = 'Task' and d.parent in %s
+            and d.parent != ifnull(t.parent_task, '')
+        """,
+        (tuple(tasks),)
+    ):
+        predecessors.setdefault(parent, set()).add(task)
+
+    pushed, causes = {}, {}
+    for _round in range(len(tasks) + 1):
+        moved = False
+        for name, task in sorted(tasks.items()):
+            start = getdate(pushed[name]["new_start_date"] if name in pushed else task.exp_start_date)
+            for predecessor in sorted(predecessors.get(name, ())):
+                change = changes.get(predecessor) or pushed.get(predecessor)
+                if not change or change["project"] != task.project or not change["new_end_date"]:
+                    continue
+                end = getdate(change["new_end_date"])
+                if start < end:
+                    start = getdate(add_days(end, 1))
+                    pushed[name] = make_change(
+                        task, start, add_days(start, date_diff(task.exp_end_date, task.exp_start_date))
+                    )
+                    causes.setdefault(name, set()).update(causes.get(predecessor, {predecessor}))
+                    moved = True
+        if not moved:
+            break
+    return pushed, causes
+
+
+# -------------------- validate_new_dates --------------------
+# Date rules of a task save: start after end and dates after the project's
+# expected end date (Task.validate), plus dates before its expected start
+# (one Project query)
+# Returns: {task: error}
+# -------------------------------------------------------------
+def validate_new_dates(changes):
+    """Check shifted dates against the task and project date rules"""
+    changes = list(changes)
+    projects = {c["project"] for c in changes if c["project"]}
+    windows = {
+        p.name: p for p in frappe.get_all(
+            "Project",
+            filters={"name": ["in", list(projects)]},
+            fields=["name", "expected_start_date", "expected_end_date"]
+        )
+    } if projects else {}
+
+    errors = {}
+    for change in changes:
+        start, end = change["new_start_date"], change["new_end_date"]
+        if start and end and getdate(start) > getdate(end):
+            errors[change["task"]] = f"expected start date {start} would be after expected end date {end}"
+            continue
+
+        project = windows.get(change["project"])
+        if not project:
+            continue
+        dates = [getdate(d) for d in (start, end) if d]
+        if project.expected_end_date and any(d > getdate(project.expected_end_date) for d in dates):
+            errors[change["task"]] = (
+                f"would end after project {project.name} expected end date ({project.expected_end_date})"
+            )
+        elif project.expected_start_date and any(d < getdate(project.expected_start_date) for d in dates):
+            errors[change["task"]] = (
+                f"would start before project {project.name} expected start date ({project.expected_start_date})"
+            )
+    return errors
+
+
+# -------------------- collect_tasks --------------------
+# Selected tasks, plus descendants (nested set) and dependents
+# (Task Depends On, followed level by level until no new tasks),
+# split by the user's write permission on each task
+# --------------------------------------------------------
+def collect_tasks(task_ids, include_descendants=False, include_dependents=False):
+    """Return the task names affected by a shift
+
+    Returns:
+        tuple: (set of writable task names, sorted list of tasks without write permission)
+    """
+    names = set(task_ids)
+    if not names:
+        return names, []
+
+    if include_descendants:
+        names.update(frappe.db.sql_list(
+            """
+            select distinct child.name
+            from `tabTask` root
+            inner join `tabTask` child on child.lft > root.lft and child.rgt < root.rgt
+            where root.name in %s
+            """,
+            (tuple(names),)
+        ))
+
+    if include_dependents:
+        frontier = set(names)
+        while frontier:
+            # Skip the parent -> child rows added by Task.populate_depends_on
+            dependents = set(frappe.db.sql_list(
+                """
+                select distinct d.parent
+                from `tabTask Depends On` d
+                inner join `tabTask` t on t.name = d.task
+                where d.parenttype = 'Task' and d.task in %s
+                    and d.parent != ifnull(t.parent_task, '')
+                """,
+                (tuple(frontier),)
+            ))
+            frontier = dependents - names
+            names.update(frontier)
+
+    # Same per-task check as task.save() in the absolute-date path
+    denied = sorted(name for name in names if not frappe.has_permission("Task", "write", name))
+    return names - set(denied), denied
+
+
+# -------------------- write_dates --------------------
+# One CASE UPDATE per batch for Task and for the snapshot rows
+# ------------------------------------------------------
+def write_dates(changes):
+    if changes:
+        bump_data_version()
+    timestamp = now()
+    user = frappe.session.user
+    for i in range(0, len(changes), UPDATE_BATCH_SIZE):
+        batch = changes[i:i + UPDATE_BATCH_SIZE]
+        case = " ".join(["when %s then %s"] * len(batch))
+        start_values = [v for c in batch for v in (c["task"], c["new_start_date"])]
+        end_values = [v for c in batch for v in (c["task"], c["new_end_date"])]
+        names = tuple(c["task"] for c in batch)
+
+        frappe.db.sql(
+            f"""
+            update `tabTask`
+            set exp_start_date = case name {case} end,
+                exp_end_date = case name {case} end,
+                modified = %s, modified_by = %s
+            where name in %s
+            """,
+            (*start_values, *end_values, timestamp, user, names)
+        )
+        frappe.db.sql(
+            f"""
+            update `tab{SNAPSHOT_DOCTYPE}`
+            set exp_start_date = case name {case} end,
+                exp_end_date = case name {case} end,
+                modified = %s
+            where name in %s
+            """,
+            (*start_values, *end_values, timestamp, names)
+        )
+
+
+# -------------------- shift_date --------------------
+# Calendar shift, or working-day shift when is_working_day is given
+# -----------------------------------------------------
+def shift_date(date, days, is_working_day=None):
+    if not date:
+        return None
+    if is_working_day is None:
+        return getdate(add_days(date, days))
+    return add_working_days(date, days, is_working_day)
+
+
+def shift_task(task, days, is_working_day=None):
+    """New (start, end) of a task; working-day shifts keep the working-day duration"""
+    start, end = task.exp_start_date, task.exp_end_date
+    if is_working_day is None or not (start and end) or getdate(end) < getdate(start):
+        return shift_date(start, days, is_working_day), shift_date(end, days, is_working_day)
+    new_start = add_working_days(start, days, is_working_day)
+    return new_start, add_working_days(new_start, count_working_days(start, end, is_working_day), is_working_day)
+
+
+def count_working_days(start, end, is_working_day):
+    """Working days after start up to and including end"""
+    start, end = getdate(start), getdate(end)
+    return sum(1 for i in range(1, (end - start).days + 1) if is_working_day(getdate(add_days(start, i))))
+
+
+def make_change(task, new_start, new_end):
+    return {
+        "task": task.name,
+        "subject": task.subject,
+        "project": task.project,
+        "parent_task": task.parent_task,
+        "old_start_date": task.exp_start_date,
+        "old_end_date": task.exp_end_date,
+        "new_start_date": getdate(new_start) if new_start else None,
+        "new_end_date": getdate(new_end) if new_end else None,
+    }
+
+
+def add_working_days(date, days, is_working_day):
+    """Move date by `days` working days (negative moves backwards)"""
+    date = getdate(date)
+    step = 1 if days > 0 else -1
+    remaining = abs(days)
+    while remaining:
+        date = add_days(date, step)
+        if is_working_day(date):
+            remaining -= 1
+    return getdate(date)
+
+
+# -------------------- get_working_day_check --------------------
+# Holidays of the default company's Holiday List (one query); dates
+# outside the list's period (and sites without a list) use Monday-Friday
+# ----------------------------------------------------------------
+def get_working_day_check():
+    def is_weekday(date):
+        return date.weekday() < 5
+
+    company = frappe.defaults.get_user_default("Company") or frappe.db.get_single_value(
+        "Global Defaults", "default_company"
+    )
+    holiday_list = company and frappe.get_cached_value("Company", company, "default_holiday_list")
+    if not holiday_list:
+        return is_weekday
+
+    from_date, to_date = frappe.get_cached_value("Holiday List", holiday_list, ["from_date", "to_date"])
+    holidays = {
+        getdate(d) for d in frappe.get_all(
+            "Holiday", filters={"parent": holiday_list, "parenttype": "Holiday List"}, pluck="holiday_date"
+        )
+    }
+    from_date, to_date = getdate(from_date), getdate(to_date)
+
+    def is_working_day(date):
+        if from_date <= date <= to_date:
+            return date not in holidays
+        return is_weekday(date)
+
+    return is_working_day
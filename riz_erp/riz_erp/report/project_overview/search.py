@@ -0,0 +1,150 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+"""
+Project Overview Report - Full-text task search
+===============================================
+Backs the report's search filter with a FULLTEXT index on Task
+(subject, custom_next_action, description).
+
+How it works:
+- ensure_task_search_index() creates the index once; it runs from the
+  v2_0 patch and after every migrate (custom_next_action is a Custom Field
+  that only exists after fixtures are synced on a new site)
+- search_tasks() turns the search text into a boolean-mode prefix query
+  (every word required) and returns the best SEARCH_LIMIT task names; the
+  report's status and assigned_to filters are part of the query, so the
+  limit only counts tasks the report can show (the report says when the
+  limit was reached)
+- execute() adds the matches' ancestors (from the snapshot sort_key) so
+  hits are shown in their place in the tree
+
+Words shorter than the InnoDB minimum token size and InnoDB stopwords are
+not indexed; a search made only of such words falls back to a LIKE on the
+subject. Sites without the index (e.g. custom field missing) use LIKE too.
+
+Main Functions:
+- search_tasks(): Task names matching the search text
+- ensure_task_search_index(): Create the FULLTEXT index if missing
+"""
+
+import re
+
+import frappe
+
+SEARCH_INDEX = "riz_task_search"
+SEARCH_COLUMNS = ("subject", "custom_next_action", "description")
+SEARCH_LIMIT = 500
+
+INDEX_CACHE_KEY = "riz_erp:task_search_index"
+
+# innodb_ft_min_token_size default
+MIN_TOKEN_SIZE = 3
+
+# InnoDB default full-text stopword list
+STOPWORDS = {
+    "a", "about", "an", "are", "as", "at", "be", "by", "com", "de", "en", "for", "from", "how", "i",
+    "in", "is", "it", "la", "of", "on", "or", "that", "the", "this", "to", "was", "what", "when",
+    "where", "who", "will", "with", "und", "www",
+}
+
+
+# -------------------- search_tasks --------------------
+# Full-text search over Task, optionally limited to one project
+# status: (operator, statuses) with operator "in" / "not in"
+# assigned_to: users with an open assignment on the task
+# Both are applied in the query, before SEARCH_LIMIT
+# Returns: list of task names, best matches first
+# -------------------------------------------------------
+def search_tasks(text, project=None, status=None, assigned_to=None):
+    """Find tasks whose subject, next action or description match the text"""
+    words = re.findall(r"\w+", text or "", re.UNICODE)
+    if not words:
+        return []
+
+    conditions = ["t.project is not null", "t.project != ''"]
+    values = {"limit": SEARCH_LIMIT}
+    if project:
+        conditions.append("t.project = %(project)s")
+        values["project"] = project
+    if status:
+        operator, values["statuses"] = status
+        conditions.append(f"t.status {'not in' if operator == 'not in' else 'in'} %(statuses)s")
+    if assigned_to:
+        conditions.append(
+            """exists (
+                select 1 from `tabToDo` td
+                where td.reference_type = 'Task' and td.reference_name = t.name
+                    and td.status = 'Open' and td.allocated_to in %(assigned_to)s
+            )"""
+        )
+        values["assigned_to"] = assigned_to
+
+    indexed = [w for w in words if len(w) >= MIN_TOKEN_SIZE and w.lower() not in STOPWORDS]
+    if indexed and has_search_index():
+        values["match"] = " ".join(f"+{w}*" for w in indexed)
+        match = f"match({', '.join(f't.{c}' for c in SEARCH_COLUMNS)}) against (%(match)s in boolean mode)"
+        return frappe.db.sql_list(
+            f"""
+            select t.name
+            from `tabTask` t
+            where {match} and {" and ".join(conditions)}
+            order by {match} desc
+            limit %(limit)s
+            """,
+            values
+        )
+
+    # Short words only (or no index): subject scan
+    for i, word in enumerate(words):
+        values[f"word_{i}"] = f"%{word}%"
+        conditions.append(f"t.subject like %(word_{i})s")
+    return frappe.db.sql_list(
+        f"""
+        select t.name
+        from `tabTask` t
+        where {" and ".join(conditions)}
+        order by t.modified desc
+        limit %(limit)s
+        """,
+        values
+    )
+
+
+# -------------------- has_search_index --------------------
+# Cached check whether the FULLTEXT index exists; a missing index is
+# cached too ("0"), until ensure_task_search_index() clears the key
+# -----------------------------------------------------------
+def has_search_index():
+    state = frappe.cache.get_value(INDEX_CACHE_KEY)
+    if state is None:
+        state = "1" if get_search_index_exists() else "0"
+        frappe.cache.set_value(INDEX_CACHE_KEY, state)
+    return state == "1"
+
+
+def get_search_index_exists():
+    return bool(frappe.db.sql("show index from `tabTask` where Key_name = %s", SEARCH_INDEX))
+
+
+# -------------------- ensure_task_search_index --------------------
+# Creates the FULLTEXT index when all columns exist (idempotent)
+# Used by patches.txt (v2_0) and after_migrate
+# -------------------------------------------------------------------
+def ensure_task_search_index():
+    """Add the Task FULLTEXT search index if it does not exist yet"""
+    frappe.cache.delete_value(INDEX_CACHE_KEY)
+    if get_search_index_exists():
+        return
+
+    missing = [c for c in SEARCH_COLUMNS if not frappe.db.has_column("Task", c)]
+    if missing:
+        frappe.logger("riz_erp").warning(
+            f"Skipping Task search index, missing column(s): {', '.join(missing)}"
+        )
+        return
+
+    frappe.db.sql_ddl(
+        f"alter table `tabTask` add fulltext index `{SEARCH_INDEX}` ({', '.join(f'`{c}`' for c in SEARCH_COLUMNS)})"
+    )
+    frappe.cache.delete_value(INDEX_CACHE_KEY)
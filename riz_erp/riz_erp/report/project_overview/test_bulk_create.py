@@ -0,0 +1,75 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import getdate
+
+from riz_erp.riz_erp.report.project_overview.bulk_create import (
+    assign_levels,
+    parse_csv,
+    parse_outline,
+    set_nested_set_values,
+)
+
+
+def parse_tree(text):
+    entries, errors = parse_outline(text)
+    errors += assign_levels(entries)
+    return entries, errors
+
+
+class TestBulkCreate(FrappeTestCase):
+    def test_outline_fields_and_bullets(self):
+        entries, errors = parse_outline(
+            "- Design | alice@example.com; bob@example.com | 2026-01-05 | 2026-01-09\n"
+            "\n"
+            "    1. Wireframes\n"
+        )
+        self.assertEqual(errors, [])
+        self.assertEqual([e.subject for e in entries], ["Design", "Wireframes"])
+        self.assertEqual(entries[0].assignees, ["alice@example.com", "bob@example.com"])
+        self.assertEqual(entries[0].exp_start_date, getdate("2026-01-05"))
+        self.assertEqual(entries[1].line, 3)
+
+    def test_outline_line_errors(self):
+        entries, errors = parse_outline("Ok\n| nobody\nBad | | 2026-01-09 | 2026-01-05\nWrong | | soon\n")
+        self.assertEqual([e.subject for e in entries], ["Ok"])
+        self.assertEqual(errors, [
+            "Line 2: subject is required",
+            "Line 3: end date is before start date",
+            "Line 4: invalid date",
+        ])
+
+    def test_levels_from_indentation(self):
+        entries, errors = parse_tree("A\n    A1\n        A1a\n    A2\nB\n\tB1\n")
+        self.assertEqual(errors, [])
+        self.assertEqual([e.level for e in entries], [0, 1, 2, 1, 0, 1])
+        self.assertEqual([e.parent_index for e in entries], [None, 0, 1, 0, None, 4])
+        self.assertEqual([e.is_group for e in entries], [1, 1, 0, 0, 1, 0])
+
+    def test_malformed_indentation(self):
+        # A jump of several indent widths is one level deeper; a dedent to a
+        # width between two levels attaches to the nearest shallower line
+        entries, errors = parse_tree("A\n            deep\n  half\n      half-child\n")
+        self.assertEqual(errors, [])
+        self.assertEqual([e.level for e in entries], [0, 1, 1, 2])
+        self.assertEqual([e.parent_index for e in entries], [None, 0, 0, 2])
+
+        # Indented first line has nothing to nest under
+        entries, errors = parse_tree("    A\nB\n")
+        self.assertEqual([e.level for e in entries], [0, 0])
+
+    def test_csv_levels(self):
+        entries, errors = parse_csv("subject,level\nA,0\nA1,1\nA2,2\nB,x\nC,4\n")
+        errors += assign_levels(entries)
+        self.assertEqual(errors, ["Line 5: level must be a number", "Line 6: level 4 skips a level"])
+        self.assertEqual([e.level for e in entries[:3]], [0, 1, 2])
+        self.assertEqual([e.parent_index for e in entries[:3]], [None, 0, 1])
+
+    def test_nested_set_values(self):
+        entries, _errors = parse_tree("A\n  A1\n    A1a\n  A2\nB\n")
+        set_nested_set_values(entries, 10)
+        self.assertEqual(
+            [(e.subject, e.lft, e.rgt) for e in entries],
+            [("A", 11, 18), ("A1", 12, 15), ("A1a", 13, 14), ("A2", 16, 17), ("B", 19, 20)],
+        )
@@ -0,0 +1,157 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+import threading
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import add_days, today
+
+from riz_erp.riz_erp.report.project_overview.concurrency import get_cascade_tasks
+from riz_erp.riz_erp.report.project_overview.project_overview import (
+    bulk_update_task_dates,
+    bulk_update_task_status,
+    busy_response,
+)
+
+TEST_PROJECT = "_Test Riz Concurrency Project"
+CHAIN_LENGTH = 12
+ROUNDS = 5
+
+
+# -------------------- run_concurrently --------------------
+# Runs every call in its own thread with its own DB connection; the
+# threads start together and commit (or roll back) on their own
+# Returns: the calls' results, or the exception a call raised
+# -----------------------------------------------------------
+def run_concurrently(*calls):
+    site, sites_path = frappe.local.site, frappe.local.sites_path
+    barrier = threading.Barrier(len(calls))
+    results = [None] * len(calls)
+
+    def worker(index, call):
+        frappe.init(site=site, sites_path=sites_path)
+        frappe.connect()
+        frappe.flags.in_test = True
+        frappe.set_user("Administrator")
+        try:
+            barrier.wait()
+            results[index] = call()
+            frappe.db.commit()
+        except Exception as e:
+            frappe.db.rollback()
+            results[index] = e
+        finally:
+            frappe.destroy()
+
+    threads = [threading.Thread(target=worker, args=(i, call)) for i, call in enumerate(calls)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestConcurrentBulkUpdates(FrappeTestCase):
+    """Overlapping bulk updates from two connections (committed test data)"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        project = frappe.get_doc({
+            "doctype": "Project",
+            "project_name": TEST_PROJECT,
+            "company": (frappe.get_all("Company", pluck="name", limit=1) or [None])[0],
+        }).insert()
+        cls.project = project.name
+
+        parent = frappe.get_doc({
+            "doctype": "Task", "subject": "_Test Concurrency Parent", "project": cls.project, "is_group": 1
+        }).insert()
+        cls.parent = parent.name
+
+        # A dependency chain under one parent: every save cascades to the
+        # parent and, for date changes, to the following tasks
+        cls.tasks = []
+        for i in range(CHAIN_LENGTH):
+            task = frappe.get_doc({
+                "doctype": "Task",
+                "subject": f"_Test Concurrency Task {i}",
+                "project": cls.project,
+                "parent_task": cls.parent,
+                "exp_start_date": add_days(today(), 2 * i),
+                "exp_end_date": add_days(today(), 2 * i + 1),
+                "depends_on": [{"task": cls.tasks[-1]}] if cls.tasks else [],
+            }).insert()
+            cls.tasks.append(task.name)
+
+        # The threads use their own connections: they only see committed rows
+        frappe.db.commit()
+
+    @classmethod
+    def tearDownClass(cls):
+        names = [cls.parent, *cls.tasks]
+        frappe.db.delete("Task Depends On", {"parent": ("in", names)})
+        frappe.db.delete("ToDo", {"reference_type": "Task", "reference_name": ("in", names)})
+        frappe.db.delete("Version", {"ref_doctype": "Task", "docname": ("in", names)})
+        frappe.db.delete("Project Overview Snapshot", {"task": ("in", names)})
+        frappe.db.delete("Task", {"name": ("in", names)})
+        frappe.db.delete("Project", {"name": cls.project})
+        frappe.db.commit()
+        super().tearDownClass()
+
+    def test_cascade_tasks_are_locked(self):
+        # Saving the first task can save its parent and every later task
+        self.assertEqual(get_cascade_tasks([self.tasks[0]]), {self.parent, *self.tasks})
+        self.assertEqual(get_cascade_tasks([self.tasks[-1]]), {self.parent, self.tasks[-1]})
+
+    def test_overlapping_updates_do_not_deadlock(self):
+        busy = busy_response([])["errors"]
+        for i in range(ROUNDS):
+            status = "Working" if i % 2 else "Open"
+            start = add_days(today(), i)
+            results = run_concurrently(
+                lambda: bulk_update_task_status(list(reversed(self.tasks)), new_status=status),
+                # Date changes reschedule the dependent tasks of the chain
+                lambda: bulk_update_task_dates(self.tasks[::2], exp_start_date=start, exp_end_date=start),
+            )
+            for result in results:
+                # No deadlock or lock timeout escaped run_with_retry
+                self.assertIsInstance(result, dict, f"round {i}: {result!r}")
+                self.assertNotEqual(result["errors"], busy, f"round {i}: retries exhausted")
+                self.assertEqual(result["failed"], 0, f"round {i}: {result['errors']}")
+                self.assertEqual(result["conflicts"], [])
+
+    def test_stale_versions_come_back_as_conflicts(self):
+        expected = {
+            name: str(modified)
+            for name, modified in frappe.get_all(
+                "Task", filters={"name": ["in", self.tasks]}, fields=["name", "modified"], as_list=True
+            )
+        }
+        results = run_concurrently(
+            lambda: bulk_update_task_status(self.tasks, custom_next_action="A", expected_modified=expected),
+            lambda: bulk_update_task_status(self.tasks, custom_next_action="B", expected_modified=expected),
+        )
+        for result in results:
+            self.assertIsInstance(result, dict, repr(result))
+
+        # All rows are locked in one statement: one call wins every task,
+        # the other finds all of them changed after the version it was given
+        winner, loser = sorted(results, key=lambda r: r["updated"], reverse=True)
+        self.assertEqual(winner["updated"], len(self.tasks))
+        self.assertEqual(winner["conflicts"], [])
+        self.assertEqual(loser["updated"], 0)
+        self.assertFalse(loser["success"])
+        self.assertEqual(sorted(c["task"] for c in loser["conflicts"]), sorted(self.tasks))
+        for conflict in loser["conflicts"]:
+            self.assertEqual(conflict["status"], "conflict")
+            self.assertTrue(conflict["modified"])
+            self.assertEqual(conflict["modified_by"], "Administrator")
+            self.assertIn("after you loaded it", conflict["message"])
+
+        frappe.db.rollback()
+        next_actions = set(frappe.get_all(
+            "Task", filters={"name": ["in", self.tasks]}, pluck="custom_next_action"
+        ))
+        self.assertEqual(len(next_actions), 1)  # no mix of both updates
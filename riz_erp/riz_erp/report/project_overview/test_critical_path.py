@@ -0,0 +1,78 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import getdate
+
+from riz_erp.riz_erp.report.project_overview.critical_path import compute_schedule
+
+
+def node(start=None, end=None, project="P1"):
+    return {"project": project, "start": start, "end": end}
+
+
+class TestCriticalPath(FrappeTestCase):
+    def test_chain_and_parallel_task(self):
+        nodes = {
+            "A": node("2026-01-01", "2026-01-03"),
+            "B": node("2026-01-04", "2026-01-05"),
+            "C": node("2026-01-01", "2026-01-01"),
+        }
+        schedule, cycles = compute_schedule(nodes, [("A", "B")])
+
+        self.assertEqual(cycles, {})
+        self.assertEqual(schedule["A"]["earliest_finish"], getdate("2026-01-03"))
+        self.assertEqual(schedule["B"]["earliest_finish"], getdate("2026-01-05"))
+        self.assertEqual((schedule["A"]["slack"], schedule["B"]["slack"]), (0, 0))
+        self.assertEqual((schedule["A"]["is_critical"], schedule["B"]["is_critical"]), (1, 1))
+        self.assertEqual(schedule["C"]["slack"], 4)
+        self.assertEqual(schedule["C"]["latest_finish"], getdate("2026-01-05"))
+        self.assertEqual(schedule["C"]["is_critical"], 0)
+
+    def test_dependency_pushes_planned_start(self):
+        # B is planned to start on day 2 but A only finishes on day 3
+        nodes = {
+            "A": node("2026-01-01", "2026-01-03"),
+            "B": node("2026-01-02", "2026-01-03"),
+        }
+        schedule, _cycles = compute_schedule(nodes, [("A", "B")])
+        self.assertEqual(schedule["B"]["earliest_finish"], getdate("2026-01-05"))
+
+    def test_cycle_is_reported_and_left_unscheduled(self):
+        nodes = {
+            "X": node("2026-01-01", "2026-01-02"),
+            "Y": node("2026-01-03", "2026-01-04"),
+            "Z": node("2026-01-05", "2026-01-05"),
+            "W": node("2026-01-01", "2026-01-01"),
+        }
+        schedule, cycles = compute_schedule(nodes, [("X", "Y"), ("Y", "X"), ("Y", "Z")])
+
+        # Z only sits behind the cycle: unscheduled, but not part of it
+        self.assertEqual(cycles, {"P1": ["X", "Y"]})
+        self.assertEqual(set(schedule), {"W"})
+
+    def test_zero_duration_task(self):
+        nodes = {
+            "A": node("2026-01-01", "2026-01-03"),
+            "M": node(),
+        }
+        schedule, _cycles = compute_schedule(nodes, [("A", "M")])
+
+        self.assertEqual(schedule["M"]["earliest_finish"], getdate("2026-01-04"))
+        self.assertEqual(schedule["M"]["slack"], 0)
+        self.assertEqual(schedule["M"]["is_critical"], 0)
+        self.assertEqual(schedule["A"]["is_critical"], 1)
+
+    def test_ignored_edges(self):
+        nodes = {
+            "A": node("2026-01-01", "2026-01-05"),
+            "B": node("2026-01-01", "2026-01-01"),
+            "Q": node("2026-01-01", "2026-01-10", project="P2"),
+        }
+        # Self edge, cross-project edge and edge to an unknown task
+        schedule, cycles = compute_schedule(nodes, [("A", "A"), ("Q", "B"), ("missing", "B")])
+
+        self.assertEqual(cycles, {})
+        self.assertEqual(schedule["B"]["earliest_finish"], getdate("2026-01-01"))
+        self.assertEqual(schedule["B"]["slack"], 4)
+        self.assertEqual(schedule["Q"]["slack"], 0)
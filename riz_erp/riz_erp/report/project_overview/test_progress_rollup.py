@@ -0,0 +1,78 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from riz_erp.riz_erp.report.project_overview.progress_rollup import rollup_progress
+
+
+def row(sort_key, progress=0, status="Open", start=None, end=None):
+    return frappe._dict({
+        "task": sort_key.split("/")[-1],
+        "sort_key": sort_key,
+        "status": status,
+        "progress": progress,
+        "exp_start_date": start,
+        "exp_end_date": end,
+    })
+
+
+class TestProgressRollup(FrappeTestCase):
+    def test_duration_weighting(self):
+        tasks = [
+            row("P"),
+            row("P/A", 100, start="2026-01-01", end="2026-01-03"),  # 3 days
+            row("P/B", 0, start="2026-01-04", end="2026-01-04"),    # 1 day
+        ]
+        self.assertEqual(rollup_progress(tasks, "Duration"), {"P": 75})
+        self.assertEqual(rollup_progress(tasks, "Equal"), {"P": 50})
+
+    def test_nested_parents_average_all_leaves(self):
+        tasks = [
+            row("P"),
+            row("P/Q"),
+            row("P/Q/A", 100),
+            row("P/Q/B", 100),
+            row("P/C", 0),
+        ]
+        # Q covers two leaves, so P = (100 + 100 + 0) / 3
+        self.assertEqual(rollup_progress(tasks, "Equal"), {"P": 67, "Q": 100})
+
+    def test_missing_weights_and_statuses(self):
+        tasks = [
+            row("P"),
+            row("P/A", 0, status="Completed"),                       # counts as 100%
+            row("P/B", 40, start="2026-01-01"),                      # no end: weight 1
+            row("P/C", 90, status="Cancelled", start="2026-01-01", end="2026-01-30"),
+            row("P/D", None),                                        # no progress: 0%
+        ]
+        self.assertEqual(rollup_progress(tasks, "Duration"), {"P": round(140 / 3)})
+
+    def test_parent_with_only_cancelled_children(self):
+        tasks = [row("P", 30), row("P/A", 90, status="Cancelled"), row("Z", 10)]
+        # No weight below P: keeps its own progress (not in the result)
+        self.assertEqual(rollup_progress(tasks, "Equal"), {})
+
+    def test_cancelled_parent_drops_its_subtree(self):
+        tasks = [
+            row("P"),
+            row("P/Q", status="Cancelled"),
+            row("P/Q/A", 100),
+            row("P/Q/B", 100),
+            row("P/C", 20),
+            row("R", 50),
+            row("R/S", status="Cancelled"),
+            row("R/S/A", 100),
+        ]
+        # Q's leaves do not count for P; R only has leaves under a cancelled
+        # task, so it keeps its own progress like a parent with cancelled children
+        self.assertEqual(rollup_progress(tasks, "Equal"), {"P": 20})
+
+    def test_end_before_start_weighs_one_day(self):
+        tasks = [
+            row("P"),
+            row("P/A", 100, start="2026-01-05", end="2026-01-01"),
+            row("P/B", 0, start="2026-01-01", end="2026-01-01"),
+        ]
+        self.assertEqual(rollup_progress(tasks, "Duration"), {"P": 50})
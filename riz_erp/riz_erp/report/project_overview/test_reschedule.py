@@ -0,0 +1,42 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import getdate
+
+from riz_erp.riz_erp.report.project_overview.reschedule import shift_task
+
+
+def is_weekday(date):
+    return date.weekday() < 5
+
+
+def task(start, end):
+    return frappe._dict({"exp_start_date": getdate(start), "exp_end_date": getdate(end)})
+
+
+class TestShiftTask(FrappeTestCase):
+    def test_calendar_shift_keeps_duration(self):
+        self.assertEqual(
+            shift_task(task("2026-01-09", "2026-01-11"), 3),  # Fri - Sun
+            (getdate("2026-01-12"), getdate("2026-01-14")),
+        )
+
+    def test_working_day_shift_keeps_working_duration(self):
+        # Mon - Sat: 4 working days after the start; the end is recomputed
+        # from the new start (shifting the Saturday on its own gives Fri 9th)
+        self.assertEqual(
+            shift_task(task("2026-01-05", "2026-01-10"), -1, is_weekday),
+            (getdate("2026-01-02"), getdate("2026-01-08")),
+        )
+        self.assertEqual(
+            shift_task(task("2026-01-12", "2026-01-16"), -5, is_weekday),  # Mon - Fri
+            (getdate("2026-01-05"), getdate("2026-01-09")),
+        )
+
+    def test_working_day_shift_of_one_date(self):
+        self.assertEqual(
+            shift_task(frappe._dict({"exp_start_date": None, "exp_end_date": getdate("2026-01-09")}), 1, is_weekday),
+            (None, getdate("2026-01-12")),
+        )
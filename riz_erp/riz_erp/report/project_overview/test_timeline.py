@@ -0,0 +1,66 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from riz_erp.riz_erp.report.project_overview.timeline import get_timeline_rows
+
+
+class TestTimelineWindow(FrappeTestCase):
+    def setUp(self):
+        self.project = frappe.get_doc({
+            "doctype": "Project",
+            "project_name": "_Test Riz Timeline Project",
+            "company": (frappe.get_all("Company", pluck="name", limit=1) or [None])[0],
+        }).insert().name
+        self.parent = self.make_task("Parent", is_group=1)
+        self.tasks = {
+            "inside": self.make_task("Inside", "2026-03-05", "2026-03-10"),
+            "overlap_start": self.make_task("Overlap start", "2026-02-20", "2026-03-02"),
+            "overlap_end": self.make_task("Overlap end", "2026-03-28", "2026-04-10"),
+            "before": self.make_task("Before", "2026-02-01", "2026-02-10"),
+            "after": self.make_task("After", "2026-04-05", "2026-04-08"),
+            "no_start": self.make_task("No start", end="2026-03-15"),
+            "no_end": self.make_task("No end", start="2026-03-15"),
+            "no_start_ends_before": self.make_task("No start, ends before", end="2026-02-15"),
+            "no_end_starts_after": self.make_task("No end, starts after", start="2026-04-15"),
+        }
+
+    def tearDown(self):
+        frappe.db.rollback()
+
+    def make_task(self, subject, start=None, end=None, is_group=0):
+        return frappe.get_doc({
+            "doctype": "Task",
+            "subject": f"_Test Timeline {subject}",
+            "project": self.project,
+            "parent_task": None if is_group else getattr(self, "parent", None),
+            "is_group": is_group,
+            "exp_start_date": start,
+            "exp_end_date": end,
+        }).insert().name
+
+    def get_window(self, from_date=None, to_date=None):
+        names = {row[0] for row in get_timeline_rows({"project": self.project}, from_date, to_date)}
+        found = {key for key, name in self.tasks.items() if name in names}
+        return found, self.parent in names
+
+    def test_both_ends_keep_undated_tasks(self):
+        found, has_parent = self.get_window("2026-03-01", "2026-03-31")
+        self.assertTrue(has_parent)
+        self.assertEqual(found, {"inside", "overlap_start", "overlap_end", "no_start", "no_end"})
+
+    def test_single_ends(self):
+        found, has_parent = self.get_window(to_date="2026-03-31")
+        self.assertTrue(has_parent)
+        self.assertEqual(found, set(self.tasks) - {"after", "no_end_starts_after"})
+
+        found, has_parent = self.get_window(from_date="2026-03-01")
+        self.assertTrue(has_parent)
+        self.assertEqual(found, set(self.tasks) - {"before", "no_start_ends_before"})
+
+    def test_no_window(self):
+        found, has_parent = self.get_window()
+        self.assertTrue(has_parent)
+        self.assertEqual(found, set(self.tasks))
@@ -0,0 +1,214 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+"""
+Project Overview Report - Compact timeline (Gantt) data
+=======================================================
+Data endpoint for timeline charts (e.g. the Task Timeline tab), which need
+dates for thousands of tasks but none of the HTML row formatting of
+execute(). Returns column arrays instead of row dicts.
+
+Task mode (one entry per task, arrays share the same index):
+    {"mode": "tasks", "origin": "2026-01-05", "statuses": [...],
+     "projects": [...], "ids": [...], "subjects": [...], "project": [...],
+     "parent": [...], "start": [...], "end": [...], "status": [...],
+     "progress": [...]}
+- project: index into projects; parent: index of the nearest visible
+  ancestor task (-1 for top-level tasks)
+- start/end: day offsets from origin (end inclusive), null without date
+- status: index into statuses
+
+Bucket mode (zoomed out, px_per_day < 1, i.e. tasks narrower than a pixel):
+    {"mode": "buckets", "origin": ..., "bucket_days": 7, "statuses": [...],
+     "projects": [...], "lane": [...], "bucket": [...], "active": [...],
+     "completed": [...], "late": [...]}
+- One entry per project (lane) and bucket with tasks: tasks active in the
+  bucket, and those of them completed / late (not completed, ending before
+  today). Bucket b covers days b * bucket_days .. (b + 1) * bucket_days - 1
+- Counts use difference arrays, linear in tasks + buckets
+
+Filters match the report's (project, status, assigned_to, show_completed_tasks,
+search); from_date/to_date keep tasks overlapping the window (and tasks
+without the date compared at that end). Rows come from the Project Overview
+Snapshot in one query (tree pre-order).
+
+Main Functions:
+- get_timeline_data(): Whitelisted entry point
+- build_task_arrays() / build_buckets(): Array encodings
+"""
+
+import json
+import math
+
+import frappe
+from frappe.utils import getdate, today
+
+from riz_erp.riz_erp.doctype.project_overview_snapshot.project_overview_snapshot import (
+    DOCTYPE as SNAPSHOT_DOCTYPE,
+)
+from riz_erp.riz_erp.report.project_overview.project_overview import (
+    get_filtered_task_ids,
+    get_snapshot_filters,
+)
+
+STATUS_CODES = ["Open", "Working", "Pending Review", "Overdue", "Template", "Completed", "Cancelled"]
+
+# Buckets per lane are capped so a very long range cannot blow up the response
+MAX_BUCKETS = 2000
+
+
+# -------------------- get_timeline_data --------------------
+# Timeline arrays for the tasks visible with the given filters
+# Requires: Task read permission
+# Returns: Task mode or bucket mode dict (see module docstring)
+# ------------------------------------------------------------
+@frappe.whitelist()
+def get_timeline_data(filters=None, px_per_day=None, from_date=None, to_date=None):
+    """Compact, array-based timeline data for the Project Overview tasks
+
+    Args:
+        filters (str|dict): Report filters (JSON string from client)
+        px_per_day (float): Zoom level; below 1 returns per-project buckets
+        from_date (str): Only tasks ending on/after this date (or without end date)
+        to_date (str): Only tasks starting on/before this date (or without start date)
+
+    Returns:
+        dict: Column arrays (mode "tasks") or bucket counts (mode "buckets")
+    """
+    if isinstance(filters, str):
+        filters = json.loads(filters or "{}")
+    filters = filters or {}
+
+    if not frappe.has_permission("Task", "read"):
+        frappe.throw("You do not have permission to read tasks")
+
+    rows = get_timeline_rows(filters, from_date, to_date)
+    origin = getdate(from_date) if from_date else min(
+        (getdate(r[3]) for r in rows if r[3]), default=getdate(today())
+    )
+
+    px_per_day = float(px_per_day or 0)
+    if 0 < px_per_day < 1:
+        return build_buckets(rows, origin, math.ceil(1 / px_per_day))
+    return build_task_arrays(rows, origin)
+
+
+# -------------------- get_timeline_rows --------------------
+# One snapshot query with the report's filters, tree pre-order
+# Returns: [(task, subject, project, start, end, status, progress, sort_key)]
+# ------------------------------------------------------------
+def get_timeline_rows(filters, from_date=None, to_date=None):
+    # assigned_to / search restrict the task set, as in execute()
+    task_ids = get_filtered_task_ids(filters)
+    if task_ids is not None and not task_ids:
+        return []
+
+    snapshot = frappe.qb.DocType(SNAPSHOT_DOCTYPE)
+    query = frappe.qb.get_query(
+        SNAPSHOT_DOCTYPE,
+        filters=get_snapshot_filters(filters, task_ids),
+        fields=["task", "subject", "project", "exp_start_date", "exp_end_date", "status", "progress", "sort_key"],
+        order_by="project asc, sort_key asc"
+    )
+
+    # Overlap with the window; a missing date does not exclude a task (at
+    # either end), so undated parents stay in the tree. Two OR groups joined
+    # by AND, which or_filters cannot express
+    if from_date:
+        query = query.where(snapshot.exp_end_date.isnull() | (snapshot.exp_end_date >= getdate(from_date)))
+    if to_date:
+        query = query.where(snapshot.exp_start_date.isnull() | (snapshot.exp_start_date <= getdate(to_date)))
+
+    return query.run()
+
+
+# -------------------- build_task_arrays --------------------
+# One array entry per task; parent = nearest visible ancestor
+# ------------------------------------------------------------
+def build_task_arrays(rows, origin):
+    projects, project_index = [], {}
+    index = {row[0]: i for i, row in enumerate(rows)}
+    data = {key: [] for key in ("ids", "subjects", "project", "parent", "start", "end", "status", "progress")}
+
+    for task, subject, project, start, end, status, progress, sort_key in rows:
+        if project not in project_index:
+            project_index[project] = len(projects)
+            projects.append(project)
+
+        parent = -1
+        for ancestor in reversed(sort_key.split("/")[:-1] if sort_key else []):
+            if ancestor in index:
+                parent = index[ancestor]
+                break
+
+        data["ids"].append(task)
+        data["subjects"].append(subject)
+        data["project"].append(project_index[project])
+        data["parent"].append(parent)
+        data["start"].append(day_offset(start, origin))
+        data["end"].append(day_offset(end, origin))
+        data["status"].append(status_code(status))
+        data["progress"].append(round(progress or 0))
+
+    return {"mode": "tasks", "origin": str(origin), "statuses": STATUS_CODES, "projects": projects, **data}
+
+
+# -------------------- build_buckets --------------------
+# Per project lane: tasks active / completed / late per bucket, via
+# difference arrays (+1 at the first bucket, -1 after the last)
+# --------------------------------------------------------
+def build_buckets(rows, origin, bucket_days):
+    today_date = getdate(today())
+    lanes = {}
+    last_bucket = 0
+    for _task, _subject, project, start, end, status, _progress, _sort_key in rows:
+        if not (start or end):
+            continue
+        first = max(day_offset(start or end, origin) // bucket_days, 0)
+        last = min(max(day_offset(end or start, origin) // bucket_days, first), MAX_BUCKETS - 1)
+        if first > last:
+            continue
+        last_bucket = max(last_bucket, last)
+
+        counters = lanes.setdefault(project, {"active": {}, "completed": {}, "late": {}})
+        kinds = ["active"]
+        if status == "Completed":
+            kinds.append("completed")
+        elif status != "Cancelled" and end and getdate(end) < today_date:
+            kinds.append("late")
+        for kind in kinds:
+            diff = counters[kind]
+            diff[first] = diff.get(first, 0) + 1
+            diff[last + 1] = diff.get(last + 1, 0) - 1
+
+    projects = list(lanes)
+    data = {key: [] for key in ("lane", "bucket", "active", "completed", "late")}
+    for lane, project in enumerate(projects):
+        counters = lanes[project]
+        running = {kind: 0 for kind in counters}
+        for bucket in range(last_bucket + 1):
+            for kind, diff in counters.items():
+                running[kind] += diff.get(bucket, 0)
+            if running["active"]:
+                data["lane"].append(lane)
+                data["bucket"].append(bucket)
+                for kind in counters:
+                    data[kind].append(running[kind])
+
+    return {
+        "mode": "buckets",
+        "origin": str(origin),
+        "bucket_days": bucket_days,
+        "statuses": STATUS_CODES,
+        "projects": projects,
+        **data,
+    }
+
+
+def day_offset(date, origin):
+    """Days from origin (None for missing dates)"""
+    return (getdate(date) - origin).days if date else None
+
+
+def status_code(status):
+    return STATUS_CODES.index(status) if status in STATUS_CODES else -1
@@ -0,0 +1,50 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+"""
+Scheduled jobs (wired in hooks.py scheduler_events)
+"""
+
+import frappe
+
+
+# -------------------- repair_project_overview_snapshot --------------------
+# Runs the snapshot consistency checker and rebuilds drifted projects
+# Catches writes that bypass doc events (db_set, raw SQL from other apps)
+# ---------------------------------------------------------------------------
+def repair_project_overview_snapshot():
+    from riz_erp.riz_erp.doctype.project_overview_snapshot.project_overview_snapshot import check_snapshot
+
+    problems = check_snapshot(fix=True)
+    if problems:
+        projects = sorted({p["project"] for p in problems})
+        frappe.log_error(
+            f"Rebuilt {len(projects)} drifted project(s): {', '.join(projects[:20])}",
+            "Project Overview Snapshot Repair"
+        )
+
+
+# -------------------- record_project_progress_history --------------------
+# Appends today's progress row per open project, then applies retention
+# (daily rows thinned to weekly after a while, old rows dropped)
+# --------------------------------------------------------------------------
+def record_project_progress_history():
+    from riz_erp.riz_erp.doctype.project_progress_history.project_progress_history import (
+        downsample_history,
+        record_progress_history,
+    )
+
+    record_progress_history()
+    downsample_history()
+
+
+# -------------------- export_project_analytics --------------------
+# Nightly incremental analytics export, enabled per site with
+# "riz_erp_analytics_export": 1 in site_config.json
+# -------------------------------------------------------------------
+def export_project_analytics():
+    from riz_erp.analytics_export import export_analytics
+
+    if not frappe.conf.get("riz_erp_analytics_export"):
+        return
+    export_analytics()
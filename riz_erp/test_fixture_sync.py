@@ -0,0 +1,31 @@
+# Copyright (c) 2025, https://github.com/RAhmed-Dev?tab=repositories
+# For license information, please see license.txt
+
+import glob
+import json
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from riz_erp.fixture_sync import CUSTOM_JSON_KEYS, CUSTOM_JSON_META_KEYS, load_records
+
+
+class TestFixtureSync(FrappeTestCase):
+    def test_every_custom_json_key_is_synced(self):
+        # sync_on_migrate is off: a key load_records does not read is never synced
+        handled = CUSTOM_JSON_META_KEYS | set(CUSTOM_JSON_KEYS.values())
+        paths = glob.glob(frappe.get_app_path("riz_erp", "riz_erp", "custom", "*.json"))
+        self.assertIn("sales_invoice.json", {path.rsplit("/", 1)[-1] for path in paths})
+        for path in paths:
+            data = json.loads(frappe.read_file(path))
+            self.assertEqual(set(data) - handled, set(), path)
+            self.assertFalse(data["sync_on_migrate"], path)
+
+    def test_sales_invoice_records_are_loaded(self):
+        path = frappe.get_app_path("riz_erp", "riz_erp", "custom", "sales_invoice.json")
+        data = json.loads(frappe.read_file(path))
+        loaded = {(doctype, record["name"]) for doctype, record in load_records()}
+        for doctype, key in CUSTOM_JSON_KEYS.items():
+            for record in data[key]:
+                self.assertIn((doctype, record["name"]), loaded)
+        self.assertIn(("DocType Link", "gk2ulq99hj"), loaded)